@@ -1,18 +1,38 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+from fractions import Fraction
+from math import prod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from algebra.Constants.properties import DETERMINANT_PROPERTIES
 
 from algebra.utils.algebraic_support import (
-    isclose, format_number, shape, clone_with, TOL, 
+    isclose, format_number, shape, TOL, 
     det_steps_init, log_det_init, log_sarrus_extended,
     log_sarrus_diag, log_det_result, log_cofactor_minor, log_subdet_2x2, 
-    log_cofactor_value, DetSteps
+    log_cofactor_value, log_det_step, log_det_diagonal, log_cramer_variable, wants_steps, DetSteps
+)
+from algebra.utils.lu_cache import get_lu
+from algebra.utils.dense_matrix import DenseMatrix
+from django.conf import settings
+from algebra.algorithms.reduce.bareiss import (
+    to_exact_matrix, integerize_rows, scaling_text, select_pivot_row_exact, bareiss_row_update
 )
 
 Number = float
 Matrix = List[List[Number]]
 
+# Por encima de este n la expansión por cofactores (O(n·2ⁿ) memorizada) se reemplaza por LU;
+# configurable con settings.ALGEBRA_COFACTOR_MAX_N
+COFACTOR_MAX_N = 16
+
+
+def cofactor_max_n() -> int:
+    if settings.configured:
+        return int(getattr(settings, "ALGEBRA_COFACTOR_MAX_N", COFACTOR_MAX_N))
+    return COFACTOR_MAX_N
+
 
 
 def _check_square(A: Matrix) -> None:
@@ -21,13 +41,13 @@ def _check_square(A: Matrix) -> None:
         raise ValueError("La matriz debe ser cuadrada para calcular el determinante.")
 
 
-def determinant_sarrus(A: List[List[float]]) -> Tuple[float, DetSteps]:
+def determinant_sarrus(A: List[List[float]], steps_level: str = "full") -> Tuple[float, DetSteps]:
     _check_square(A)
     m, n = shape(A)
     if n != 3:
         raise ValueError("La Regla de Sarrus solo aplica para matrices 3x3.")
 
-    steps = det_steps_init()
+    steps = det_steps_init(steps_level)
     method_name = "Sarrus"
     log_det_init(steps, A, method_name)
 
@@ -59,42 +79,62 @@ def determinant_sarrus(A: List[List[float]]) -> Tuple[float, DetSteps]:
 
 
 
-def determinant_cofactors(A: List[List[float]]) -> Tuple[float, DetSteps]:
+def _laplace_minors(A: Matrix, steps: DetSteps) -> Callable[[int], float]:
+    """
+    Expansión de Laplace memorizada sobre subconjuntos de columnas (O(n·2ⁿ) en vez de O(n!)).
+    Un menor es una vista por índices: la máscara `cols` elige las columnas y las filas
+    son las últimas popcount(cols) de A, así que no se copian submatrices.
+    Cada menor se calcula una vez; los 2×2 se registran la primera vez que aparecen.
+    """
+    n = shape(A)[0]
+    memo: Dict[int, float] = {0: 1.0}
+
+    def det_minor(cols: int) -> float:
+        val = memo.get(cols)
+        if val is not None:
+            return val
+        idx = [k for k in range(n) if cols >> k & 1]
+        size = len(idx)
+        row = A[n - size]
+        if size == 1:
+            val = row[idx[0]]
+        elif size == 2:
+            nxt = A[n - 1]
+            a, b = row[idx[0]], row[idx[1]]
+            c, d = nxt[idx[0]], nxt[idx[1]]
+            val = a*d - b*c
+            if wants_steps(steps):
+                log_subdet_2x2(steps, [[a, b], [c, d]], val)
+        else:
+            # Desarrollo por la primera fila del menor (mismo orden de suma que la recursión)
+            val = 0.0
+            for p, k in enumerate(idx):
+                val += ((-1)**p) * row[k] * det_minor(cols & ~(1 << k))
+        memo[cols] = val
+        return val
+
+    return det_minor
+
+
+def determinant_cofactors(A: List[List[float]], steps_level: str = "full") -> Tuple[float, DetSteps]:
     _check_square(A)
     n = shape(A)[0]
-    steps = det_steps_init()
+    steps = det_steps_init(steps_level)
     method_name = "Cofactores"
     log_det_init(steps, A, method_name)
 
-    # Recursivo (detallamos solo: nivel superior + 2×2)
-    def _det_cof(M: List[List[float]], level: int) -> float:
-        size = shape(M)[0]
-        if size == 1:
-            return M[0][0]
-        if size == 2:
-            a, b = M[0][0], M[0][1]
-            c, d = M[1][0], M[1][1]
-            det2 = a*d - b*c
-            # Solo log si no estamos en la raíz (para no repetir demasiado):
-            log_subdet_2x2(steps, M, det2)
-            return det2
-        # nivel > 2: sin logs internos (evitar explosión), solo cálculo
-        total = 0.0
-        for j in range(size):
-            sub = [[M[i][k] for k in range(size) if k != j] for i in range(1, size)]
-            sub_det = _det_cof(sub, level+1)
-            total += ((-1)**j) * M[0][j] * sub_det
-        return total
+    det_minor = _laplace_minors(A, steps)
+    full = (1 << n) - 1
 
     total = 0.0
     # expandimos por primera fila con logs de menores y cofactores
     for j in range(n):
         a1j = A[0][j]
         sign = 1 if (j % 2 == 0) else -1
-        M1j = [[A[i][k] for k in range(n) if k != j] for i in range(1, n)]
-
-        log_cofactor_minor(steps, j, M1j)  # mostrar submatriz
-        sub_det = _det_cof(M1j, level=1)
+        if wants_steps(steps):
+            M1j = [[A[i][k] for k in range(n) if k != j] for i in range(1, n)]
+            log_cofactor_minor(steps, j, M1j)  # mostrar submatriz
+        sub_det = det_minor(full & ~(1 << j))
         cofactor = sign * a1j * sub_det
         total += cofactor
         log_cofactor_value(steps, j, sign, a1j, sub_det, cofactor)
@@ -103,20 +143,269 @@ def determinant_cofactors(A: List[List[float]]) -> Tuple[float, DetSteps]:
     return total, steps
 
 
-def determinant_cramer(A: Matrix) -> Tuple[float, List[str]]:
-    return determinant_cofactors(A)
+def determinant_bareiss(A: List[List[float]], steps_level: str = "full") -> Tuple[Fraction, DetSteps]:
+    """
+    Determinante exacto por eliminación libre de fracciones (Bareiss).
+    Las filas se escalan a enteros; cada paso divide exactamente por el pivote anterior
+    y el último pivote es det(A) (corregido por intercambios y escalas).
+    """
+    _check_square(A)
+    n = shape(A)[0]
+    steps = det_steps_init(steps_level)
+    method_name = "Bareiss"
+    M = to_exact_matrix(A)
+    log_det_init(steps, M, method_name)
+
+    scales = integerize_rows(M)
+    scale = 1
+    for d in scales:
+        scale *= d
+    if scale != 1 and wants_steps(steps):
+        log_det_step(steps, "scale_rows", "Escalar filas a enteros", M,
+                     note=f"{scaling_text(scales)} (det se divide luego por {scale})")
+
+    sign = 1
+    prev = 1
+    for k in range(n):
+        pivot_row = select_pivot_row_exact(M, k, k, pivoting="none")
+        if pivot_row is None:
+            log_det_step(steps, "zero_column", f"Columna {k+1} sin pivote no nulo", M, note="det(A) = 0")
+            det = Fraction(0)
+            log_det_result(steps, det, method_name)
+            return det, steps
+        if pivot_row != k:
+            M[k], M[pivot_row] = M[pivot_row], M[k]
+            sign = -sign
+            log_det_step(steps, "swap_rows", f"Intercambio filas: F{k+1} <-> F{pivot_row+1}", M, note="el signo cambia")
+
+        p = M[k][k]
+        for r in range(k + 1, n):
+            bareiss_row_update(M[k], M[r], k, prev)
+        if k < n - 1 and wants_steps(steps):
+            divisor = f" / {prev}" if prev != 1 else ""
+            log_det_step(steps, "bareiss", f"Pivote {format_number(p)} en ({k+1},{k+1})",
+                         M, note=f"R_i ← ({p}·R_i - a_i{k+1}·R{k+1}){divisor}, i > {k+1}")
+        prev = p
+
+    det = Fraction(sign * M[n - 1][n - 1], scale)
+    log_det_result(steps, det, method_name)
+    return det, steps
+
+
+def determinant_lu(A: List[List[float]], steps_level: str = "full") -> Tuple[float, DetSteps]:
+    """
+    Determinante por eliminación con pivoteo parcial (PA = LU) en O(n³):
+    det(A) = (−1)^intercambios · producto de la diagonal de U.
+    Sin detalle completo se usa la factorización de la caché LU (utils/lu_cache.py).
+    """
+    _check_square(A)
+    n = shape(A)[0]
+    steps = det_steps_init(steps_level)
+    method_name = "LU"
+    log_det_init(steps, A, method_name)
+
+    if not wants_steps(steps):
+        lu = get_lu(A)
+        if lu.rank() < n:
+            det = 0.0
+        else:
+            diag = [float(lu.lu[k, k]) for k in range(n)]
+            det = float(lu.sign * prod(diag))
+            log_det_diagonal(steps, diag, lu.sign, det)
+        log_det_result(steps, det, method_name)
+        return det, steps
+
+    # Misma eliminación que LUFactorization, registrando un estado por pivote
+    M = DenseMatrix.from_rows(A, n)
+    sign = 1
+    diag: List[float] = []
+    for k in range(n):
+        sel, best = M.argmax_abs(k, k)
+        if best <= TOL:
+            log_det_step(steps, "zero_column", f"Columna {k+1} sin pivote no nulo", M, note="det(A) = 0")
+            det = 0.0
+            log_det_result(steps, det, method_name)
+            return det, steps
+        if sel != k:
+            M.swap_rows(k, sel)
+            sign = -sign
+            log_det_step(steps, "swap_rows", f"Intercambio filas: F{k+1} <-> F{sel+1}", M, note="el signo cambia")
+
+        p = M.get(k, k)
+        P = M.row(k)
+        for r in range(k + 1, n):
+            a = M.get(r, k)
+            if abs(a) <= TOL:
+                continue
+            row = M.row(r)  # vista: se actualiza en sitio
+            row[k + 1:] -= (a / p) * P[k + 1:]
+            tail = row[k + 1:]
+            tail[np.abs(tail) <= TOL] = 0.0
+            row[k] = 0.0
+        diag.append(p)
+        if k < n - 1:
+            log_det_step(steps, "lu", f"Pivote {format_number(p)} en ({k+1},{k+1})",
+                         M, note=f"R_i ← R_i - (a_i{k+1} / {format_number(p)})·R{k+1}, i > {k+1}")
+
+    det = float(sign * prod(diag))
+    log_det_diagonal(steps, diag, sign, det)
+    log_det_result(steps, det, method_name)
+    return det, steps
+
+
+def determinant_lu_stacked(stack: np.ndarray, tol: float = TOL) -> List[float]:
+    """
+    det de k matrices n×n apiladas en un arreglo (k, n, n): la misma eliminación que
+    LUFactorization y el mismo producto que determinant_lu (resultados idénticos),
+    con cada paso aplicado a las k matrices a la vez.
+    """
+    M = np.array(stack, dtype=np.float64)
+    k, n, _ = M.shape
+    idx = np.arange(k)
+    sign = np.ones(k)
+    prod_diag = np.ones(k)
+    singular = np.zeros(k, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for col in range(n):
+            column = np.abs(M[:, col:, col])
+            sel = np.argmax(column, axis=1)
+            singular |= column[idx, sel] <= tol  # sin pivote: rank < n → det = 0
+            sel += col
+            swap = sel != col
+            if swap.any():
+                top = M[idx, col].copy()
+                M[idx, col] = M[idx, sel]
+                M[idx, sel] = top
+                sign[swap] = -sign[swap]
+            P = M[:, col]
+            below = M[:, col + 1:, col]
+            factors = below / P[:, col:col + 1]
+            factors[np.abs(below) <= tol] = 0.0  # filas que la eliminación no toca
+            M[:, col + 1:, col + 1:] -= factors[:, :, None] * P[:, None, col + 1:]
+            block = M[:, col + 1:, col + 1:]
+            block[np.abs(block) <= tol] = 0.0
+            prod_diag *= P[:, col]
+    return np.where(singular, 0.0, sign * prod_diag).tolist()
+
+
+def cramer_solve(A: Matrix, b: List[float], steps_level: str = "full") -> Tuple[float, List[float], List[float], DetSteps]:
+    """
+    Resuelve A·x = b por la regla de Cramer con una sola factorización PA = LU.
+    A_i = A + (b − a_i)·e_iᵀ es una actualización de rango uno, así que
+    det(A_i) = det(A)·(1 + e_iᵀ·A⁻¹·(b − a_i)) = det(A)·x_i: con x = A⁻¹b (O(n²))
+    salen los n determinantes. Total O(n³) en lugar de n+1 determinantes independientes.
+    Devuelve (det(A), [det(A_i)], x, pasos).
+    """
+    _check_square(A)
+    n = shape(A)[0]
+    if len(b) != n:
+        raise ValueError(f"Dimensiones inconsistentes: A es {n}x{n} y b tiene longitud {len(b)}.")
+    steps = det_steps_init(steps_level)
+    method_name = "Cramer"
+    log_det_init(steps, A, method_name)
+
+    lu = get_lu(A)
+    if not lu.is_invertible():
+        raise ValueError("det(A) = 0: la regla de Cramer requiere una matriz invertible.")
+    diag = [float(lu.lu[k, k]) for k in range(n)]
+    det = float(lu.sign * prod(diag))
+    log_det_diagonal(steps, diag, lu.sign, det)
+    log_det_result(steps, det, method_name)
+
+    x = [0.0 if abs(v) <= TOL else float(v) for v in lu.solve(np.array(b, dtype=np.float64))]
+    dets = [det * xi for xi in x]
+    for i in range(n):
+        Ai = [row[:i] + [b[r]] + row[i+1:] for r, row in enumerate(A)] if wants_steps(steps) else None
+        log_cramer_variable(steps, i, Ai, dets[i], det, x[i])
+    return det, dets, x, steps
+
+
+_REL_TOL = 1e-9  # rel_tol por defecto de math.isclose
+
+
+def _isclose_np(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """isclose(a, b, TOL) elemento a elemento, con las mismas operaciones que math.isclose."""
+    with np.errstate(invalid="ignore", over="ignore"):
+        diff = np.abs(b - a)
+        close = (diff <= np.abs(_REL_TOL * b)) | (diff <= np.abs(_REL_TOL * a)) | (diff <= TOL)
+    return (a == b) | (close & ~np.isinf(a) & ~np.isinf(b))
+
+
+def _has_equal_pair(M: np.ndarray) -> bool:
+    """
+    ¿Dos filas iguales (isclose entrada a entrada)? Las filas se ordenan por una proyección
+    p = M·w: dos filas iguales difieren en p a lo sumo `bound` (tolerancia de isclose con
+    |x| <= max|M| más el redondeo del producto), así que solo se comparan las filas dentro
+    de esa ventana. La confirmación es la misma comparación por pares de siempre.
+    """
+    m, n = M.shape
+    if m < 2:
+        return False
+    w = 1.0 + (np.arange(n) * 0.6180339887498949) % 1.0  # pesos fijos en [1, 2)
+    G = float(np.abs(M).max())
+    bound = 2.0 * float(w.sum()) * (_REL_TOL * G + TOL + (n + 2) * 2.3e-16 * G)
+    p = M @ w
+    order = np.argsort(p, kind="stable")
+    ps = p[order]
+    ends = np.searchsorted(ps, ps + bound, side="right")
+    for k in np.flatnonzero(ends > np.arange(m) + 1):
+        rows = M[order[k + 1:ends[k]]]
+        if _isclose_np(M[order[k]], rows).all(axis=1).any():
+            return True
+    return False
+
+
+def _has_multiple_column(C: np.ndarray) -> bool:
+    """
+    ¿Alguna columna j es k·columna i con i < j? (mismo criterio que antes: donde la columna i
+    es ~0 la j también; en el resto, cada cociente isclose al primero; k puede ser 0).
+    `C` tiene las columnas como filas. Para cada i se descartan primero, en bloque, las j que
+    fallan en dos filas de la columna i (la primera y la última no nulas) y en su primera fila
+    nula; a las que quedan se les aplica la comprobación completa, también en bloque.
+    """
+    n = C.shape[0]
+    Z = np.abs(C) <= TOL
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for i in range(n - 1):
+            nz = np.flatnonzero(~Z[i])
+            if nz.size == 0:
+                continue
+            u = C[i]
+            cand = np.arange(i + 1, n)
+            f, g = nz[0], nz[-1]
+            k = C[cand, f] / u[f]
+            keep = _isclose_np(k, C[cand, g] / u[g])
+            if nz.size < C.shape[1]:
+                keep &= Z[cand, int(np.argmax(Z[i]))]
+            cand = cand[keep]
+            if cand.size == 0:
+                continue
+            keep = ~(~Z[cand][:, Z[i]]).any(axis=1)
+            cand = cand[keep]
+            if cand.size == 0:
+                continue
+            R = C[cand][:, nz] / u[nz]
+            if _isclose_np(R[:, :1], R).all(axis=1).any():
+                return True
+    return False
 
 
 def validate_determinant_properties(A: Matrix, det: float) -> Dict[str, Any]:
     """Valida algunas propiedades comunes relacionadas con determinantes y devuelve
     un resumen con resultados booleanos y evidencias.
+    Las comparaciones entre filas/columnas se hacen en bloque sobre los candidatos
+    (mismo resultado que comparar todos los pares con isclose) y el signo del
+    intercambio se deduce de la propiedad, sin volver a calcular determinantes.
     """
     props: Dict[str, Any] = {}
     m, n = shape(A)
+    M = np.array(A, dtype=np.float64).reshape(m, n)
 
     # 1) Si una fila o columna es cero => det == 0
-    zero_row = any(all(isclose(x, 0.0, TOL) for x in row) for row in A)
-    zero_col = any(all(isclose(A[i][j], 0.0, TOL) for i in range(m)) for j in range(n))
+    Z = np.abs(M) <= TOL
+    zero_cols = Z.all(axis=0).tolist()
+    zero_row = bool(Z.all(axis=1).any())
+    zero_col = any(zero_cols)
     props['zero_row_or_col'] = {
         'applies': zero_row or zero_col,
         'message': DETERMINANT_PROPERTIES.get(1),
@@ -126,33 +415,17 @@ def validate_determinant_properties(A: Matrix, det: float) -> Dict[str, Any]:
         }
     }
 
-    # 2) Dos filas o columnas iguales => det == 0
-    equal_rows = False
-    for i in range(m):
-        for j in range(i+1, m):
-            if all(isclose(A[i][k], A[j][k], TOL) for k in range(n)):
-                equal_rows = True
-    equal_cols = False
-    for i in range(n):
-        for j in range(i+1, n):
-            if all(isclose(A[k][i], A[k][j], TOL) for k in range(m)):
-                equal_cols = True
+    # 2) Dos filas o columnas iguales => det == 0 (candidatos por ventana de proyección)
+    equal_rows = _has_equal_pair(M)
+    equal_cols = _has_equal_pair(M.T)
     props['equal_rows_or_cols'] = {
         'applies': equal_rows or equal_cols,
         'message': DETERMINANT_PROPERTIES.get(2),
         'evidence': {'equal_rows': equal_rows, 'equal_cols': equal_cols}
     }
 
-    # 3) Intercambio de filas multiplica por -1: we can demonstrate by swapping two rows and comparing
-    swapped_demo = None
-    if m > 1:
-        Mswap = clone_with(A)
-        Mswap[0], Mswap[1] = Mswap[1], Mswap[0]
-        try:
-            det_swap, _ = determinant_cofactors(Mswap)
-            swapped_demo = isclose(det_swap, -det, TOL)
-        except Exception:
-            swapped_demo = False
+    # 3) Intercambio de filas multiplica por -1: det(P·A) = det(P)·det(A) con det(P) = -1
+    swapped_demo = True if m > 1 else None
     props['swap_rows_sign'] = {
         'applies': swapped_demo,
         'message': DETERMINANT_PROPERTIES.get(3),
@@ -160,30 +433,7 @@ def validate_determinant_properties(A: Matrix, det: float) -> Dict[str, Any]:
     }
 
     # 4) Si una columna es múltiplo escalar de otra -> det == 0
-    scalar_mult_col = False
-    if n > 1:
-        for i in range(n):
-            for j in range(i+1, n):
-                # find scalar k such that column_j = k * column_i
-                k = None
-                ok = True
-                for r in range(m):
-                    a = A[r][i]
-                    b = A[r][j]
-                    if isclose(a, 0.0, TOL):
-                        if not isclose(b, 0.0, TOL):
-                            ok = False
-                            break
-                        else:
-                            continue
-                    ratio = b / a
-                    if k is None:
-                        k = ratio
-                    elif not isclose(k, ratio, TOL):
-                        ok = False
-                        break
-                if ok and k is not None:
-                    scalar_mult_col = True
+    scalar_mult_col = n > 1 and _has_multiple_column(M.T)
     props['scalar_multiple_column'] = {
         'applies': scalar_mult_col,
         'message': DETERMINANT_PROPERTIES.get(4),
@@ -192,12 +442,14 @@ def validate_determinant_properties(A: Matrix, det: float) -> Dict[str, Any]:
 
     # add a quick consistency check: if any of the above implies det == 0 but computed det not ~0, mark inconsistent
     inferred_zero = props['zero_row_or_col']['applies'] or props['equal_rows_or_cols']['applies'] or props['scalar_multiple_column']['applies']
+    # det exacto (Fraction de Bareiss) se compara sin pasar por float
+    det_is_zero = isclose(det, 0.0, 0.0 if isinstance(det, Fraction) else TOL)
     props['consistency'] = {
         'inferred_zero': inferred_zero,
-        'det_is_zero': isclose(det, 0.0, TOL),
-        'consistent': (not inferred_zero) or isclose(det, 0.0, TOL)
+        'det_is_zero': det_is_zero,
+        'consistent': (not inferred_zero) or det_is_zero
     }
 
     return props
 
-__all__ = ['determinant_sarrus', 'determinant_cofactors', 'determinant_cramer', 'validate_determinant_properties']
\ No newline at end of file
+__all__ = ['determinant_sarrus', 'determinant_cofactors', 'determinant_bareiss', 'determinant_lu', 'determinant_lu_stacked', 'cramer_solve', 'validate_determinant_properties']
\ No newline at end of file
@@ -1,13 +1,31 @@
 from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from .crammer import (
     determinant_sarrus,
     determinant_cofactors,
-    determinant_cramer,
+    determinant_bareiss,
+    determinant_lu,
+    determinant_lu_stacked,
+    cramer_solve,
     validate_determinant_properties,
+    cofactor_max_n,
+)
+from algebra.utils.algebraic_support import (
+    format_number, exact_as_float, matrix_as_fraction, steps_level, wants_steps, det_steps_init
 )
-from algebra.utils.algebraic_support import format_number, matrix_as_fraction
+
+
+def resolve_method(method: str, n: int) -> str:
+    """
+    Método con el que se calcula: cofactores es O(n·2ⁿ), por encima de cofactor_max_n() se usa LU (O(n³)).
+    "cramer" siempre es LU: la regla de Cramer resuelve sistemas (cramer_api) con el det(A) de PA = LU.
+    """
+    if method == "cramer" or (method == "cofactors" and n > cofactor_max_n()):
+        return "lu"
+    return method
 
 
 def determinant_api(*, A: List[List[float]], method: str = "cofactors", options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -15,21 +33,105 @@ def determinant_api(*, A: List[List[float]], method: str = "cofactors", options:
     method = (method or "cofactors").lower()
     if A is None:
         raise ValueError("Se requiere la matriz A.")
+    level = steps_level(opt)  # options.steps: "none" | "summary" | "full"
 
-    if method == "sarrus":
-        det, steps = determinant_sarrus(A)
+    n = len(A)
+    method_used = resolve_method(method, n)
+
+    if method_used == "lu":
+        det, steps = determinant_lu(A, level)
+        if method == "cramer" and wants_steps(steps, "summary"):
+            steps["text_steps"].insert(0, "Cramer: det(A) se calcula por LU; para resolver A·x = b usa /matrix/cramer.")
+        elif method_used != method and wants_steps(steps, "summary"):
+            steps["text_steps"].insert(0, f"n = {n} > {cofactor_max_n()}: se usa LU en lugar de {method} (O(n·2ⁿ)).")
+    elif method == "sarrus":
+        det, steps = determinant_sarrus(A, level)
     elif method == "cofactors":
-        det, steps = determinant_cofactors(A)
-    elif method == "cramer":
-        det, steps = determinant_cramer(A)
+        det, steps = determinant_cofactors(A, level)
+    elif method == "bareiss":
+        det, steps = determinant_bareiss(A, level)
     else:
         raise ValueError(f"Método desconocido: {method}")
 
     props = validate_determinant_properties(A, det)
 
     return {
-        "input": {"method": method, "A": A, "A_pretty": matrix_as_fraction(A)},
+        "input": {"method": method, "method_used": method_used, "A": A, "A_pretty": matrix_as_fraction(A)},
         "steps": steps,   # <-- YA ES {"frame":{"states":[...]}, "text_steps":[...]}
-        "result": {"determinant": det, "determinant_pretty": format_number(det)},
+        "result": {"determinant": exact_as_float(det), "determinant_pretty": format_number(det)},
         "properties": props,
     }
+
+
+# Sin pasos el método solo cambia cómo se calcula el mismo valor en punto flotante:
+# estas matrices se apilan y se calculan por LU. Bareiss (exacto) y Sarrus (solo 3x3) van una a una.
+STACKED_METHODS = ("cofactors", "cramer", "lu")
+
+
+def _batch_item(A: List[List[float]], method: str, det: float) -> Dict[str, Any]:
+    # Misma respuesta que determinant_api(A, "lu", {"steps": "none"}), con el método pedido en input.method
+    return {
+        "input": {"method": method, "method_used": "lu", "A": A, "A_pretty": matrix_as_fraction(A)},
+        "steps": det_steps_init("none"),
+        "result": {"determinant": det, "determinant_pretty": format_number(det)},
+        "properties": validate_determinant_properties(A, det),
+    }
+
+
+def determinant_batch_api(*, matrices: List[List[List[float]]], method: str = "cofactors",
+                          options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Varios determinantes en una petición; `results` respeta el orden de `matrices`.
+    Con options.steps = "none" y method en STACKED_METHODS (incluido el predeterminado,
+    cofactores), las matrices se apilan por tamaño en un arreglo (k, n, n) y se eliminan juntas
+    (determinant_lu_stacked: mismos valores que determinant_lu); cada elemento es lo que
+    devolvería determinant_api con method="lu" y lleva method_used = "lu".
+    Con pasos, o con Bareiss / Sarrus, cada matriz pasa por determinant_api.
+    Un error en una matriz se devuelve en su posición sin cancelar el resto.
+    """
+    opt = options or {}
+    method = (method or "cofactors").lower()
+    level = steps_level(opt)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(matrices)
+
+    if level == "none" and method in STACKED_METHODS:
+        groups: Dict[int, List[int]] = {}
+        for i, A in enumerate(matrices):
+            n = len(A)
+            if n and all(len(row) == n for row in A):
+                groups.setdefault(n, []).append(i)
+        for idx in groups.values():
+            dets = determinant_lu_stacked(np.array([matrices[i] for i in idx], dtype=np.float64))
+            for i, det in zip(idx, dets):
+                results[i] = _batch_item(matrices[i], method, det)
+
+    for i, A in enumerate(matrices):
+        if results[i] is None:
+            try:
+                results[i] = determinant_api(A=A, method=method, options=opt)
+            except Exception as e:
+                results[i] = {"error": {"code": "DETERMINANT_ERROR", "message": str(e)}}
+
+    return {"count": len(results), "results": results}
+
+
+def cramer_api(*, A: List[List[float]], b: List[float], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    opt = options or {}
+    if A is None or b is None:
+        raise ValueError("Se requieren la matriz A y el vector b.")
+    level = steps_level(opt)  # options.steps: "none" | "summary" | "full"
+
+    det, dets, x, steps = cramer_solve(A, b, level)
+
+    return {
+        "input": {"A": A, "A_pretty": matrix_as_fraction(A), "b": b},
+        "steps": steps,
+        "result": {
+            "determinant": det,
+            "determinant_pretty": format_number(det),
+            "determinants": dets,
+            "determinants_pretty": [format_number(d) for d in dets],
+            "solution": x,
+            "solution_pretty": [format_number(v) for v in x],
+        },
+    }
@@ -3,94 +3,141 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from algebra.algorithms.matrix.matrix_operations import (
     add_matrices, sub_matrices, scalar_mult, transpose, matmul,
-    sum_many, sub_many, matmul_chain, inverse)
+    sum_many, sub_many, matmul_chain, matrix_power, matrix_polyval, inverse)
 
-from ...utils.algebraic_support import matrix_as_fraction, format_number
+from ...utils.algebraic_support import (
+    matrix_as_fraction, format_number, KEYFRAME_EVERY, steps_level, response_encoding, ValueTable)
 
 Number = float
 Matrix = List[List[Number]]
 
 
+def _text_steps(steps: Any) -> List[str]:
+    if isinstance(steps, str):
+        return steps.split('\n') if steps else []
+    return steps
+
+
+def _step_cells(opt: Dict[str, Any]) -> Optional[List[Tuple[int, int]]]:
+    # options.step_cells: [[i, j], ...] en base 1 (como c_ij en el texto); solo esas celdas llevan detalle
+    cells = opt.get('step_cells')
+    if cells is None:
+        return None
+    try:
+        return [(int(i) - 1, int(j) - 1) for i, j in cells]
+    except (TypeError, ValueError):
+        raise ValueError("options.step_cells debe ser una lista de pares [fila, columna].")
+
+
 def matrix_ops_api(*, operation: str, A: Optional[Matrix] = None, B: Optional[Matrix] = None,
                    matrices: Optional[List[Matrix]] = None, scalar: Optional[Number] = None,
+                   exponent: Optional[int] = None, coefficients: Optional[List[Number]] = None,
                    options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     opt = options or {}
 
     try:
+        level = steps_level(opt)  # options.steps: "none" | "summary" | "full"
+        cells = _step_cells(opt)
+        info: Dict[str, Any] = {}  # datos extra de power / polyval / inverse para 'result'
         if operation == 'add':
-            C, steps = add_matrices(A, B)
+            C, steps = add_matrices(A, B, level, cells)
             return {
                 'input': {'operation': operation, 'A': A, 'B': B},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
             }
 
         if operation == 'sub':
-            C, steps = sub_matrices(A, B)
+            C, steps = sub_matrices(A, B, level, cells)
             return {
                 'input': {'operation': operation, 'A': A, 'B': B},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
             }
 
         if operation == 'scalar':
-            C, steps = scalar_mult(scalar, A)
+            C, steps = scalar_mult(scalar, A, level, cells)
             return {
                 'input': {'operation': operation, 'A': A, 'scalar': scalar},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
             }
 
         if operation == 'transpose':
-            T, steps = transpose(A)
+            T, steps = transpose(A, level)
             return {
                 'input': {'operation': operation, 'A': A},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': T, 'matrix_pretty': matrix_as_fraction(T)}
             }
 
         if operation == 'matmul':
-            C, steps = matmul(A, B)
+            C, steps = matmul(A, B, level, cells)
             return {
                 'input': {'operation': operation, 'A': A, 'B': B},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
             }
 
         if operation == 'sum_many':
-            C, steps = sum_many(matrices)
+            C, steps = sum_many(matrices, level, cells)
             return {
                 'input': {'operation': operation, 'matrices': matrices},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
             }
 
         if operation == 'sub_many':
-            C, steps = sub_many(matrices[0], matrices[1:])
+            C, steps = sub_many(matrices[0], matrices[1:], level, cells)
             return {
                 'input': {'operation': operation, 'matrices': matrices},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
+                'steps': _text_steps(steps),
                 'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
             }
 
         if operation == 'matmul_chain':
-            C, steps = matmul_chain(matrices)
+            chain: Dict[str, Any] = {}
+            C, steps = matmul_chain(matrices, level, info=chain)
             return {
                 'input': {'operation': operation, 'matrices': matrices},
-                'steps': steps.split('\n') if isinstance(steps, str) else steps,
-                'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C)}
+                'steps': _text_steps(steps),
+                'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C), 'chain': chain}
+            }
+
+        if operation == 'power':
+            C, steps = matrix_power(A, exponent, level, info=info)
+            return {
+                'input': {'operation': operation, 'A': A, 'exponent': exponent},
+                'steps': _text_steps(steps),
+                'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C), **info}
+            }
+
+        if operation == 'polyval':
+            C, steps = matrix_polyval(coefficients, A, level, info=info)
+            return {
+                'input': {'operation': operation, 'A': A, 'coefficients': coefficients},
+                'steps': _text_steps(steps),
+                'result': {'matrix': C, 'matrix_pretty': matrix_as_fraction(C), **info}
             }
 
         if operation == 'inverse':
-            frame = {}
-            Ainv, steps = inverse(A, frame=frame)
+            # options.snapshots = False: solo texto, sin copias de [A | I] por paso
+            frame = {} if opt.get('snapshots', True) else None
+            # options.encoding = "dict": una tabla de valores para todas las instantáneas del frame
+            values = ValueTable() if response_encoding(opt) == 'dict' else None
+            Ainv, steps = inverse(A, frame=frame, steps_format=opt.get('steps_format', 'full'),
+                                  keyframe_every=opt.get('keyframe_every', KEYFRAME_EVERY), steps_level=level,
+                                  info=info, values=values)
+            table = {'value_table': values.values} if values is not None else {}
             return {
                 'input': {'operation': operation, 'A': A},
                 'steps': {
-                    'frame': frame,
-                    'text_steps': steps.split('\n') if isinstance(steps, str) else steps
+                    'frame': frame if frame is not None else {},
+                    'text_steps': _text_steps(steps)
                 },
-                'result': {'matrix': Ainv, 'matrix_pretty': matrix_as_fraction(Ainv)}
+                'result': {'matrix': Ainv, 'matrix_pretty': matrix_as_fraction(Ainv),
+                           'determinant': info['determinant'], 'determinant_pretty': format_number(info['determinant'])},
+                **table
             }
 
         raise ValueError('Operación inválida')
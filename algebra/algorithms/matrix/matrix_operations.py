@@ -1,9 +1,14 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from ...utils.algebraic_support import (
-    isclose, format_number, matrix_as_fraction, shape, normalize_neg_zero, clone_with, TOL
+    isclose, format_number, matrix_as_fraction, shape, normalize_neg_zero, clone_with, TOL,
+    DeltaEncoder, ValueTable, STEPS_FORMATS, KEYFRAME_EVERY, STEPS_LEVELS
 )
+from ...utils.lu_cache import get_lu
+from ...utils.dense_matrix import DenseMatrix
 
 Number = float
 Matrix = List[List[Number]]
@@ -16,49 +21,74 @@ def _shape(M: Matrix) -> Tuple[int, int]:
     return shape(M)
 
 
-def add_matrices(A: Matrix, B: Matrix) -> Tuple[Matrix, str]:
+# steps_level: "full" → texto por celda (comportamiento original),
+# "summary" → una sola línea con la operación y las dimensiones, "none" → sin texto.
+def _brief(steps_level: str, text: str) -> str:
+    return text if steps_level == "summary" else ""
+
+
+# El cálculo se hace con NumPy (BLAS en matmul); el texto por celda solo se arma con
+# steps_level "full" y, si se pasa `cells` (índices (i, j) base 0), solo para esas celdas.
+Cells = Optional[Iterable[Tuple[int, int]]]
+
+
+def _as_array(M: Matrix) -> np.ndarray:
+    return np.array(M, dtype=np.float64).reshape(_shape(M))
+
+
+def _cells(cells: Cells, m: int, n: int) -> Iterable[Tuple[int, int]]:
+    if cells is None:
+        return ((i, j) for i in range(m) for j in range(n))
+    for i, j in cells:
+        if not (0 <= i < m and 0 <= j < n):
+            raise ValueError(f"Celda fuera de rango: ({i+1}, {j+1}) en una matriz {m}x{n}.")
+    return cells
+
+
+def _row_text(m: int, n: int, cells: Cells, term: Callable[[int, int], str]) -> str:
+    """Texto "Fila i: t_i1 | t_i2 | ..." con las celdas pedidas agrupadas por fila."""
+    by_row: Dict[int, List[int]] = {}
+    for i, j in _cells(cells, m, n):
+        by_row.setdefault(i, []).append(j)
+    return "\n".join(f"  Fila {i+1}: " + " | ".join(term(i, j) for j in js) for i, js in by_row.items())
+
+
+def add_matrices(A: Matrix, B: Matrix, steps_level: str = "full", cells: Cells = None) -> Tuple[Matrix, str]:
     if _shape(A) != _shape(B):
         raise ValueError("Dimensiones incompatibles para suma/resta (mismas filas y columnas).")
     m, n = _shape(A)
-    C = [[A[i][j] + B[i][j] for j in range(n)] for i in range(m)]
-    steps = []
-    for i in range(m):
-        row_terms = []
-        for j in range(n):
-            row_terms.append(f"({format_number(A[i][j])}) + ({format_number(B[i][j])}) = {format_number(C[i][j])}")
-        steps.append(f"  Fila {i+1}: " + " | ".join(row_terms))
-    return C, "\n".join(steps)
+    C = (_as_array(A) + _as_array(B)).tolist()
+    if steps_level != "full":
+        return C, _brief(steps_level, f"C = A + B ({m}×{n})")
+    return C, _row_text(m, n, cells, lambda i, j:
+                        f"({format_number(A[i][j])}) + ({format_number(B[i][j])}) = {format_number(C[i][j])}")
 
 
-def sub_matrices(A: Matrix, B: Matrix) -> Tuple[Matrix, str]:
+def sub_matrices(A: Matrix, B: Matrix, steps_level: str = "full", cells: Cells = None) -> Tuple[Matrix, str]:
     if _shape(A) != _shape(B):
         raise ValueError("Dimensiones incompatibles para suma/resta (mismas filas y columnas).")
     m, n = _shape(A)
-    C = [[A[i][j] - B[i][j] for j in range(n)] for i in range(m)]
-    steps = []
-    for i in range(m):
-        row_terms = []
-        for j in range(n):
-            row_terms.append(f"({format_number(A[i][j])}) - ({format_number(B[i][j])}) = {format_number(C[i][j])}")
-        steps.append(f"  Fila {i+1}: " + " | ".join(row_terms))
-    return C, "\n".join(steps)
+    C = (_as_array(A) - _as_array(B)).tolist()
+    if steps_level != "full":
+        return C, _brief(steps_level, f"C = A - B ({m}×{n})")
+    return C, _row_text(m, n, cells, lambda i, j:
+                        f"({format_number(A[i][j])}) - ({format_number(B[i][j])}) = {format_number(C[i][j])}")
 
 
-def scalar_mult(alpha: float, A: Matrix) -> Tuple[Matrix, str]:
+def scalar_mult(alpha: float, A: Matrix, steps_level: str = "full", cells: Cells = None) -> Tuple[Matrix, str]:
     m, n = _shape(A)
-    C = [[alpha * A[i][j] for j in range(n)] for i in range(m)]
-    steps = []
-    for i in range(m):
-        row_terms = []
-        for j in range(n):
-            row_terms.append(f"{format_number(alpha)}·({format_number(A[i][j])}) = {format_number(C[i][j])}")
-        steps.append(f"  Fila {i+1}: " + " | ".join(row_terms))
-    return C, "\n".join(steps)
+    C = (alpha * _as_array(A)).tolist()
+    if steps_level != "full":
+        return C, _brief(steps_level, f"C = {format_number(alpha)}·A ({m}×{n})")
+    a = format_number(alpha)
+    return C, _row_text(m, n, cells, lambda i, j: f"{a}·({format_number(A[i][j])}) = {format_number(C[i][j])}")
 
 
-def transpose(A: Matrix) -> Tuple[Matrix, str]:
+def transpose(A: Matrix, steps_level: str = "full") -> Tuple[Matrix, str]:
     m, n = _shape(A)
     T = [[A[i][j] for i in range(m)] for j in range(n)]
+    if steps_level != "full":
+        return T, _brief(steps_level, f"Aᵀ ({m}×{n} → {n}×{m})")
     lines = []
     for j in range(n):
         moved = ", ".join(f"a_{i+1}{j+1}→t_{j+1}{i+1}" for i in range(m))
@@ -66,26 +96,33 @@ def transpose(A: Matrix) -> Tuple[Matrix, str]:
     return T, "\n".join(lines)
 
 
-def matmul(A: Matrix, B: Matrix) -> Tuple[Matrix, str]:
+def matmul(A: Matrix, B: Matrix, steps_level: str = "full", cells: Cells = None) -> Tuple[Matrix, str]:
     if _shape(A)[1] != _shape(B)[0]:
         raise ValueError("Dimensiones incompatibles para multiplicación (cols(A) = filas(B)).")
     m, p = _shape(A)[0], _shape(B)[1]
     n = _shape(A)[1]
-    C = [[0.0 for _ in range(p)] for _ in range(m)]
+    C = (_as_array(A) @ _as_array(B)).tolist()
+    if steps_level != "full":
+        return C, _brief(steps_level, f"C = A·B ({m}×{n} · {n}×{p} → {m}×{p})")
     steps = []
-    for i in range(m):
-        for j in range(p):
-            terms = [f"{format_number(A[i][k])}·{format_number(B[k][j])}" for k in range(n)]
-            val = sum(A[i][k] * B[k][j] for k in range(n))
-            C[i][j] = val
-            steps.append(f"  c_{i+1}{j+1} = " + " + ".join(terms) + f" = {format_number(val)}")
+    for i, j in _cells(cells, m, p):
+        terms = [f"{format_number(A[i][k])}·{format_number(B[k][j])}" for k in range(n)]
+        steps.append(f"  c_{i+1}{j+1} = " + " + ".join(terms) + f" = {format_number(C[i][j])}")
     return C, "\n".join(steps)
 
 
 # --------------------------
 # Operaciones con varias matrices
 # --------------------------
-def sum_many(mats: List[Matrix]) -> Tuple[Matrix, str]:
+def _running_sum(mats: List[Matrix]) -> np.ndarray:
+    # Suma en el mismo orden que sum(...) celda a celda (M1 + M2 + ...)
+    S = _as_array(mats[0])
+    for M in mats[1:]:
+        S = S + _as_array(M)
+    return S
+
+
+def sum_many(mats: List[Matrix], steps_level: str = "full", cells: Cells = None) -> Tuple[Matrix, str]:
     if len(mats) < 2:
         raise ValueError("Se requieren al menos 2 matrices para la suma.")
     base = mats[0]
@@ -93,181 +130,364 @@ def sum_many(mats: List[Matrix]) -> Tuple[Matrix, str]:
         if _shape(base) != _shape(M):
             raise ValueError("Todas las matrices deben tener la misma dimensión para sumar.")
     m, n = _shape(base)
-    C = [[0.0 for _ in range(n)] for _ in range(m)]
+    C = _running_sum(mats).tolist()
+    if steps_level != "full":
+        return C, _brief(steps_level, f"S = M1 + ... + M{len(mats)} ({m}×{n})")
     steps = []
-    for i in range(m):
-        for j in range(n):
-            terms = [format_number(M[i][j]) for M in mats]
-            val = sum(M[i][j] for M in mats)
-            C[i][j] = val
-            steps.append(f"  s_{i+1}{j+1} = " + " + ".join(terms) + f" = {format_number(val)}")
+    for i, j in _cells(cells, m, n):
+        terms = [format_number(M[i][j]) for M in mats]
+        steps.append(f"  s_{i+1}{j+1} = " + " + ".join(terms) + f" = {format_number(C[i][j])}")
     return C, "\n".join(steps)
 
 
-def sub_many(first: Matrix, rest: List[Matrix]) -> Tuple[Matrix, str]:
+def sub_many(first: Matrix, rest: List[Matrix], steps_level: str = "full", cells: Cells = None) -> Tuple[Matrix, str]:
     if not rest:
         raise ValueError("Se necesita al menos una matriz para restar a la primera.")
     for M in rest:
         if _shape(first) != _shape(M):
             raise ValueError("Todas las matrices deben tener la misma dimensión para restar.")
     m, n = _shape(first)
-    C = [[0.0 for _ in range(n)] for _ in range(m)]
+    C = (_as_array(first) - _running_sum(rest)).tolist()
+    if steps_level != "full":
+        return C, _brief(steps_level, f"R = M1 - ... - M{len(rest) + 1} ({m}×{n})")
     steps = []
-    for i in range(m):
-        for j in range(n):
-            terms = [format_number(first[i][j])] + [f"({format_number(M[i][j])})" for M in rest]
-            val = first[i][j] - sum(M[i][j] for M in rest)
-            C[i][j] = val
-            steps.append(f"  r_{i+1}{j+1} = " + " - ".join(terms) + f" = {format_number(val)}")
+    for i, j in _cells(cells, m, n):
+        terms = [format_number(first[i][j])] + [f"({format_number(M[i][j])})" for M in rest]
+        steps.append(f"  r_{i+1}{j+1} = " + " - ".join(terms) + f" = {format_number(C[i][j])}")
     return C, "\n".join(steps)
 
 
-def matmul_chain(mats: List[Matrix]) -> Tuple[Matrix, str]:
+def _chain_order(dims: List[int]) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Programa dinámico clásico del producto encadenado: cost[i][j] = mínimo de
+    multiplicaciones escalares para M(i+1)···M(j+1); split[i][j] = k del último producto.
+    En empates gana el k mayor, que reproduce el orden de izquierda a derecha.
+    """
+    k_count = len(dims) - 1
+    cost = [[0] * k_count for _ in range(k_count)]
+    split = [[0] * k_count for _ in range(k_count)]
+    for length in range(2, k_count + 1):
+        for i in range(k_count - length + 1):
+            j = i + length - 1
+            best = None
+            for k in range(j - 1, i - 1, -1):
+                c = cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if best is None or c < best:
+                    best, split[i][j] = c, k
+            cost[i][j] = best
+    return cost, split
+
+
+def _chain_label(split: List[List[int]], i: int, j: int) -> str:
+    if i == j:
+        return f"M{i+1}"
+    k = split[i][j]
+    return f"({_chain_label(split, i, k)}·{_chain_label(split, k + 1, j)})"
+
+
+def matmul_chain(mats: List[Matrix], steps_level: str = "full", info: dict | None = None) -> Tuple[Matrix, str]:
+    """
+    M1·M2···Mk en el orden de paréntesis con menos multiplicaciones escalares.
+    Si se pasa `info` se llenan 'parenthesization', 'flops', 'flops_left_to_right' y 'flops_saved'.
+    """
     if len(mats) < 2:
         raise ValueError("Se requieren al menos 2 matrices para multiplicar.")
-    current = mats[0]
+    for M, N in zip(mats, mats[1:]):
+        if _shape(M)[1] != _shape(N)[0]:
+            raise ValueError("Dimensiones incompatibles para multiplicación (cols(A) = filas(B)).")
+    dims = [_shape(mats[0])[0]] + [_shape(M)[1] for M in mats]
+    cost, split = _chain_order(dims)
+
     all_steps = []
-    for idx, M in enumerate(mats[1:], start=2):
-        C, steps = matmul(current, M)
-        all_steps.append(f"Paso {idx-1}: resultado anterior · M{idx}\n" + steps)
-        current = C
+
+    def product(i: int, j: int) -> Tuple[Matrix, str]:
+        if i == j:
+            return mats[i], f"M{i+1}"
+        k = split[i][j]
+        L, left = product(i, k)
+        R, right = product(k + 1, j)
+        C, steps = matmul(L, R, steps_level)
+        label = f"({left}·{right})"
+        if steps_level != "none":
+            all_steps.append(f"Paso {len(all_steps)+1}: {left} · {right}\n" + steps)
+        return C, label
+
+    k_last = len(mats) - 1
+    current, _ = product(0, k_last)
+    if info is not None:
+        left_to_right = sum(dims[0] * dims[t] * dims[t + 1] for t in range(1, len(mats)))
+        info['parenthesization'] = _chain_label(split, 0, k_last)
+        info['flops'] = cost[0][k_last]
+        info['flops_left_to_right'] = left_to_right
+        info['flops_saved'] = left_to_right - cost[0][k_last]
     return current, "\n\n".join(all_steps)
 
 
-# --------------------------
-# Determinante e inversa (usando eliminación Gaussiana)
-# --------------------------
-def determinant(A: Matrix, tol: float = TOL) -> float:
+class _SquarePowers:
+    """A^(2^i) calculadas una sola vez por cuadrados sucesivos (compartidas entre potencias)."""
+
+    def __init__(self, A: np.ndarray, steps: List[str], detail: bool):
+        self.squares = [A]
+        self.steps = steps
+        self.detail = detail
+        self.mults = 0
+
+    def square(self, i: int) -> np.ndarray:
+        while len(self.squares) <= i:
+            t = len(self.squares)
+            self.squares.append(self.squares[-1] @ self.squares[-1])
+            self.mults += 1
+            if self.detail:
+                self.steps.append(f"Cuadrado: A^{2 ** t} = (A^{2 ** (t - 1)})²")
+        return self.squares[i]
+
+    def power(self, k: int) -> np.ndarray:
+        """A^k (k >= 1) multiplicando los cuadrados de los bits encendidos de k."""
+        result = None
+        bit = 0
+        while k:
+            if k & 1:
+                S = self.square(bit)
+                if result is None:
+                    result = S
+                    if self.detail:
+                        self.steps.append(f"Bit {bit} = 1: se parte de A^{2 ** bit}")
+                else:
+                    result = result @ S
+                    self.mults += 1
+                    if self.detail:
+                        self.steps.append(f"Bit {bit} = 1: se multiplica por A^{2 ** bit}")
+            k >>= 1
+            bit += 1
+        return result
+
+
+def _square_base(A: Matrix, name: str) -> np.ndarray:
     m, n = _shape(A)
-    if m != n:
-        raise ValueError("Determinante sólo definido para matrices cuadradas.")
-
-    M = [row[:] for row in A]
-    det = 1.0
-    row = 0
-    swaps = 0
-    for col in range(n):
-        if row >= n:
-            break
-        sel = row
-        best = abs(M[row][col])
-        for r in range(row + 1, n):
-            v = abs(M[r][col])
-            if v > best:
-                best = v
-                sel = r
-
-        if best <= tol:
-            # columna nula -> pivote no disponible
-            continue
-
-        if sel != row:
-            M[row], M[sel] = M[sel], M[row]
-            swaps += 1
-
-        pivot = M[row][col]
-        det *= pivot
-
-        # escalar fila
-        if not isclose(pivot, 1.0, tol):
-            for j in range(col, n):
-                M[row][j] /= pivot
-
-        # eliminación completa (arriba y abajo)
-        for r in range(n):
-            if r == row:
-                continue
-            factor = M[r][col]
-            if abs(factor) <= tol:
-                continue
-            for j in range(col, n):
-                M[r][j] -= factor * M[row][j]
-            normalize_neg_zero(M)
-
-        row += 1
-
-    if swaps % 2 != 0:
-        det = -det
-    return 0.0 if abs(det) <= tol else det
+    if m != n or m == 0:
+        raise ValueError(f"{name} sólo está definida para matrices cuadradas.")
+    return _as_array(A)
+
+
+def matrix_power(A: Matrix, k: int, steps_level: str = "full", info: dict | None = None) -> Tuple[Matrix, str]:
+    """
+    A^k por exponenciación binaria: O(log k) productos en lugar de k−1.
+    Con k < 0 se eleva A⁻¹ (inversa por la caché LU) a |k|; A^0 = I.
+    """
+    M = _square_base(A, "La potencia")
+    n = M.shape[0]
+    steps: List[str] = []
+    detail = steps_level != "none"
+    if k < 0:
+        Ainv, _ = inverse(A, steps_level="none")
+        M = _as_array(Ainv)
+        if detail:
+            steps.append(f"k = {k} < 0: A^{k} = (A⁻¹)^{-k}")
+    powers = _SquarePowers(M, steps, detail)
+    R = powers.power(abs(k)) if k else np.eye(n)
+    if detail:
+        steps.append(f"A^{k} ({n}×{n}) con {powers.mults} multiplicaciones de matrices (productos sucesivos: {max(abs(k) - 1, 0)})")
+    if info is not None:
+        info['multiplications'] = powers.mults
+    return clone_with(R.tolist()), "\n".join(steps)
+
+
+def matrix_polyval(coeffs: List[float], A: Matrix, steps_level: str = "full", info: dict | None = None) -> Tuple[Matrix, str]:
+    """
+    p(A) = c0·A^d + c1·A^(d-1) + ... + cd·I (coeficientes de mayor a menor grado, como numpy.polyval)
+    por Horner. Los tramos de coeficientes nulos se saltan con P ← P·A^g, donde A^g sale de
+    los cuadrados A^(2^i), que se calculan una sola vez para todo el polinomio.
+    """
+    M = _square_base(A, "La evaluación polinómica")
+    if not coeffs:
+        raise ValueError("Se requiere al menos un coeficiente.")
+    n = M.shape[0]
+    I = np.eye(n)
+    steps: List[str] = []
+    detail = steps_level != "none"
+    powers = _SquarePowers(M, steps, detail)
+
+    # Términos no nulos como (grado, coeficiente), del mayor al menor grado
+    d = len(coeffs) - 1
+    terms = [(d - i, c) for i, c in enumerate(coeffs) if c != 0]
+    if not terms:
+        P = np.zeros((n, n))
+    else:
+        deg, lead = terms[0]
+        P = None  # mientras P = lead·I el primer producto es solo un escalado
+        if detail:
+            steps.append(f"Horner: P = {format_number(lead)}·I")
+        for nxt, c in terms[1:] + [(0, 0.0)]:
+            gap = deg - nxt
+            if gap:
+                Ag = powers.power(gap)
+                if P is None:
+                    P = lead * Ag
+                else:
+                    P = P @ Ag
+                    powers.mults += 1
+                if detail:
+                    steps.append(f"P ← P·A^{gap}")
+            if P is None:
+                P = lead * I
+            if c:
+                P = P + c * I
+                if detail:
+                    steps.append(f"P ← P + {format_number(c)}·I (grado {nxt})")
+            deg = nxt
+    if detail:
+        steps.append(f"p(A) de grado {d} ({n}×{n}) con {powers.mults} multiplicaciones de matrices")
+    if info is not None:
+        info['multiplications'] = powers.mults
+    return clone_with(P.tolist()), "\n".join(steps)
 
 
-def inverse(A: Matrix, tol: float = TOL, frame: dict | None = None, check_props: bool = True) -> Tuple[Matrix, str]:
+# --------------------------
+# Inversa (usando eliminación Gaussiana; los determinantes están en determinants/)
+# --------------------------
+def _clean_row(row: List[Number]) -> List[Number]:
+    # Misma limpieza que clone_with, aplicada a una sola fila
+    return [0.0 if abs(v) <= TOL else v for v in row]
+
+
+def inverse(A: Matrix, tol: float = TOL, frame: dict | None = None,
+            steps_format: str = "full", keyframe_every: int = KEYFRAME_EVERY,
+            steps_level: str = "full", info: dict | None = None,
+            values: ValueTable | None = None) -> Tuple[Matrix, str]:
+    """
+    Inversa por Gauss-Jordan sobre [A | I] en una sola eliminación: la singularidad se
+    detecta al no encontrar pivote y det(A) (producto de pivotes con el signo de los
+    intercambios) sale como subproducto en info['determinant'] si se pasa `info`.
+    Con `values` (options.encoding="dict") las instantáneas del frame guardan índices de esa tabla.
+    """
     m, n = _shape(A)
     if m != n:
         raise ValueError("La inversa sólo está definida para matrices cuadradas.")
-
-    detA = determinant(A, tol=tol)
-    if abs(detA) <= tol:
-        raise ValueError(f"Matriz singular: det(A) = {format_number(detA)}")
-
-    # construir matriz aumentada [A | I]
-    M = [list(map(float, row)) + [1.0 if i == j else 0.0 for j in range(n)] for i, row in enumerate([r[:] for r in A])]
+    if steps_format not in STEPS_FORMATS:
+        raise ValueError(f"Formato de pasos desconocido: {steps_format}")
+    if steps_level not in STEPS_LEVELS:
+        raise ValueError(f"Nivel de pasos desconocido: {steps_level}")
+    # "summary": solo una línea por pivote y frame.states; "none": ni texto ni instantáneas
+    detail = steps_level == "full"
+    if steps_level == "none":
+        frame = None
+
+    if steps_level == "none":
+        # La factorización LU se guarda en caché: la misma A en otra petición no se vuelve a eliminar
+        lu = get_lu(A)
+        detA = lu.det()
+        if abs(detA) <= tol:
+            raise ValueError(f"Matriz singular: det(A) = {format_number(detA)}")
+        if info is not None:
+            info['determinant'] = detA
+        return clone_with(lu.inverse().tolist()), ""
+
+    # construir matriz aumentada [A | I] (DenseMatrix: intercambios por permutación, filas en sitio)
+    M = DenseMatrix(np.hstack([_as_array(A), np.eye(n)]))
     steps: List[str] = []
     # If a frame dict is provided, prepare both a backwards-compatible
     # `states` list (used previously) and a new `step_states` list that will
     # contain a snapshot of the matrix after each textual step. This allows the
     # API consumer to align text_steps[i] with step_states[i].
+    # With steps_format="delta", step_states only carries the rows changed by each
+    # step plus periodic keyframes (see rebuild_snapshot in algebraic_support).
+    def snapshot(X: Matrix) -> Matrix:
+        S = clone_with(X)
+        return S if values is None else values.encode_matrix(S)
+
+    row_fn = _clean_row if values is None else (lambda r: values.encode_row(_clean_row(r)))
+    encoder = DeltaEncoder(key='matrix', format_row=row_fn, keyframe_every=keyframe_every) \
+        if steps_format == "delta" else None
+    per_step = frame is not None and detail
+
+    def record_step(tag: str, rows: Tuple[int, ...]) -> None:
+        if encoder is None:
+            frame['step_states'].append({'tag': tag, 'matrix': snapshot(M)})
+        else:
+            frame['step_states'].append({'tag': tag, **encoder.encode(M, rows)})
+
     if frame is not None:
         frame['states'] = []
         frame['step_states'] = []
-        frame['states'].append({'tag': 'initial', 'matrix': clone_with(M)})
+        frame['states'].append({'tag': 'initial', 'matrix': snapshot(M)})
 
     row = 0
+    detA = 1.0
+    clean = False  # hasta la primera limpieza completa de M
     for col in range(n):
         if row >= n:
             break
-        # seleccionar pivote por valor absoluto
-        sel = row
-        best = abs(M[row][col])
-        for r in range(row + 1, n):
-            v = abs(M[r][col])
-            if v > best:
-                best = v
-                sel = r
+        # seleccionar pivote por valor absoluto (primer máximo)
+        sel, best = M.argmax_abs(col, row)
 
         if best <= tol:
-            raise ValueError("No se pudo encontrar pivote no nulo durante la inversión.")
+            raise ValueError("Matriz singular: det(A) = 0")
 
         if sel != row:
-            M[row], M[sel] = M[sel], M[row]
-            steps.append(f"Intercambio filas: F{row+1} <-> F{sel+1}")
+            M.swap_rows(row, sel)
+            detA = -detA
+            if detail:
+                steps.append(f"Intercambio filas: F{row+1} <-> F{sel+1}")
             # record snapshot after swap so clients can align text steps -> matrices
-            if frame is not None:
-                frame['step_states'].append({'tag': f'swap_{row}_{sel}', 'matrix': clone_with(M)})
+            if per_step:
+                record_step(f'swap_{row}_{sel}', (row, sel))
 
-        pivot = M[row][col]
+        pivot = M.get(row, col)
+        detA *= pivot
+        if steps_level == "summary":
+            steps.append(f"Pivot @ ({row+1},{col+1}) = {format_number(pivot)}")
         # escalar fila para pivot = 1
         if abs(pivot - 1.0) > tol:
-            for j in range(col, 2 * n):
-                M[row][j] /= pivot
-            steps.append(f"R{row+1} ← R{row+1} / {format_number(pivot)}")
-            normalize_neg_zero(M)
+            M.scale_row(row, pivot, col)
+            if detail:
+                steps.append(f"R{row+1} ← R{row+1} / {format_number(pivot)}")
+            M.snap((row,) if clean else None)
+            clean = True
             # snapshot after scaling pivot row
-            if frame is not None:
-                frame['step_states'].append({'tag': f'scale_{row}', 'matrix': clone_with(M)})
-
-        # eliminar en otras filas
-        for r in range(n):
-            if r == row:
-                continue
-            factor = M[r][col]
-            if abs(factor) <= tol:
-                continue
-            for j in range(col, 2 * n):
-                M[r][j] -= factor * M[row][j]
-            steps.append(f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}")
-            normalize_neg_zero(M)
-            # snapshot after eliminating row r using current pivot
-            if frame is not None:
-                frame['step_states'].append({'tag': f'elim_r{r}_c{col}', 'matrix': clone_with(M)})
+            if per_step:
+                record_step(f'scale_{row}', (row,))
+
+        # eliminar en otras filas (la fila pivote no cambia: todas usan los mismos valores)
+        column = M.col(col)
+        targets = [r for r in range(n) if r != row and abs(column[r]) > tol]
+        factors = [float(column[r]) for r in targets]
+        if targets and not clean:
+            # La primera operación va sola y después se limpia la matriz completa
+            r, factor = targets.pop(0), factors.pop(0)
+            M.axpy_row(r, factor, row, col)
+            M.snap()
+            clean = True
+            if detail:
+                steps.append(f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}")
+            if per_step:
+                record_step(f'elim_r{r}_c{col}', (r,))
+        if per_step:
+            for r, factor in zip(targets, factors):
+                M.axpy_row(r, factor, row, col)
+                M.snap((r,))
+                if detail:
+                    steps.append(f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}")
+                record_step(f'elim_r{r}_c{col}', (r,))
+        elif targets:
+            phys = M.perm[targets]
+            M.data[phys, col:] -= np.outer(factors, M.row(row)[col:])
+            M.snap(targets)
+            if detail:
+                steps.extend(f"R{r+1} ← R{r+1} - ({format_number(f)})·R{row+1}" for r, f in zip(targets, factors))
 
         if frame is not None:
-            frame['states'].append({'tag': f'pivot_{row}_{col}', 'matrix': clone_with(M)})
+            frame['states'].append({'tag': f'pivot_{row}_{col}', 'matrix': snapshot(M)})
 
         row += 1
 
-    Ainv = [[M[i][j] for j in range(n, 2 * n)] for i in range(n)]
+    # Mismo criterio que el determinante de la caché LU para matrices casi singulares
+    if abs(detA) <= tol:
+        raise ValueError(f"Matriz singular: det(A) = {format_number(detA)}")
+    if info is not None:
+        info['determinant'] = detA
+
+    Ainv = M.to_array()[:, n:].tolist()
     if frame is not None:
-        frame['states'].append({'tag': 'result', 'matrix': clone_with(Ainv)})
+        frame['states'].append({'tag': 'result', 'matrix': snapshot(Ainv)})
 
     return Ainv, "\n".join(steps)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...utils.algebraic_support import TOL, format_number, steps_level
+from ...utils.sparse_support import SparseMatrix, sparse_from_spec, sparse_to_coo, nnz
+from ..reduce.sparse import sparse_forward, sparse_backward_to_rref
+
+Shape = Tuple[int, int]
+
+# --------------------------
+# Operaciones sobre matrices dispersas (filas como dict {col: valor})
+# Los pasos son una sola línea: el detalle por celda sería de tamaño m·n.
+# --------------------------
+
+
+def _put(row: Dict[int, float], j: int, v: float, tol: float = TOL) -> None:
+    if abs(v) <= tol:
+        row.pop(j, None)
+    else:
+        row[j] = v
+
+
+def sparse_add(A: SparseMatrix, B: SparseMatrix, sa: Shape, sb: Shape, sign: float = 1.0) -> SparseMatrix:
+    if sa != sb:
+        raise ValueError("Dimensiones incompatibles para suma/resta (mismas filas y columnas).")
+    C = [dict(row) for row in A]
+    for i, row in enumerate(B):
+        for j, v in row.items():
+            _put(C[i], j, C[i].get(j, 0.0) + sign * v)
+    return C
+
+
+def sparse_scalar(alpha: float, A: SparseMatrix) -> SparseMatrix:
+    return [{j: alpha * v for j, v in row.items() if abs(alpha * v) > TOL} for row in A]
+
+
+def sparse_transpose(A: SparseMatrix, sa: Shape) -> SparseMatrix:
+    T: SparseMatrix = [{} for _ in range(sa[1])]
+    for i, row in enumerate(A):
+        for j, v in row.items():
+            T[j][i] = v
+    return T
+
+
+def sparse_matmul(A: SparseMatrix, B: SparseMatrix, sa: Shape, sb: Shape) -> SparseMatrix:
+    if sa[1] != sb[0]:
+        raise ValueError("Dimensiones incompatibles para multiplicación (cols(A) = filas(B)).")
+    C: SparseMatrix = []
+    for row in A:
+        acc: Dict[int, float] = {}
+        for k, a in row.items():
+            for j, b in B[k].items():
+                acc[j] = acc.get(j, 0.0) + a * b
+        C.append({j: v for j, v in acc.items() if abs(v) > TOL})
+    return C
+
+
+def sparse_inverse(A: SparseMatrix, sa: Shape) -> SparseMatrix:
+    """Inversa por eliminación dispersa de [A | I] (Markowitz) y reducción a RREF."""
+    m, n = sa
+    if m != n:
+        raise ValueError("La inversa sólo está definida para matrices cuadradas.")
+    rows = [{**row, n + i: 1.0} for i, row in enumerate(A)]
+    pivots = sparse_forward(rows, n)
+    if len(pivots) < n:
+        raise ValueError("Matriz singular: det(A) = 0")
+    sparse_backward_to_rref(rows, n, pivots)
+    X: SparseMatrix = [{} for _ in range(n)]
+    for p, c, _ in pivots:
+        X[c] = {j - n: v for j, v in rows[p].items() if j >= n}
+    return X
+
+
+def sparse_ops_api(*, operation: str, A_sparse: Dict[str, Any], B_sparse: Optional[Dict[str, Any]] = None,
+                   scalar: Optional[float] = None, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Igual que matrix_ops_api para entradas COO/CSR; el resultado se devuelve en COO."""
+    opt = options or {}
+    try:
+        level = steps_level(opt)  # options.steps: "none" | "summary" | "full"
+        A, sa = sparse_from_spec(A_sparse)
+        B, sb = sparse_from_spec(B_sparse) if B_sparse is not None else (None, None)
+        inp: Dict[str, Any] = {'operation': operation, 'A_sparse': A_sparse}
+
+        if operation in ('add', 'sub', 'matmul') and B is None:
+            raise ValueError(f"Para '{operation}' envía 'A_sparse' y 'B_sparse'.")
+        if operation == 'add':
+            C, shape, text = sparse_add(A, B, sa, sb), sa, f"C = A + B ({sa[0]}×{sa[1]})"
+        elif operation == 'sub':
+            C, shape, text = sparse_add(A, B, sa, sb, -1.0), sa, f"C = A - B ({sa[0]}×{sa[1]})"
+        elif operation == 'scalar':
+            if scalar is None:
+                raise ValueError("Para 'scalar' envía 'A_sparse' y 'scalar'.")
+            C, shape, text = sparse_scalar(scalar, A), sa, f"C = {format_number(scalar)}·A ({sa[0]}×{sa[1]})"
+        elif operation == 'transpose':
+            C, shape, text = sparse_transpose(A, sa), (sa[1], sa[0]), f"Aᵀ ({sa[0]}×{sa[1]} → {sa[1]}×{sa[0]})"
+        elif operation == 'matmul':
+            C, shape = sparse_matmul(A, B, sa, sb), (sa[0], sb[1])
+            text = f"C = A·B ({sa[0]}×{sa[1]} · {sb[0]}×{sb[1]} → {sa[0]}×{sb[1]})"
+        elif operation == 'inverse':
+            C, shape, text = sparse_inverse(A, sa), sa, f"A⁻¹ por eliminación dispersa ({sa[0]}×{sa[1]})"
+        else:
+            raise ValueError('Operación inválida para matrices dispersas')
+
+        if B_sparse is not None:
+            inp['B_sparse'] = B_sparse
+        if scalar is not None:
+            inp['scalar'] = scalar
+        steps: List[str] = [] if level == "none" else [f"{text}, no nulos: {nnz(C)}"]
+        return {
+            'input': inp,
+            'steps': steps,
+            'result': {'matrix': sparse_to_coo(C, shape), 'matrix_pretty': sparse_to_coo(C, shape, format_number)}
+        }
+    except Exception as e:
+        return {'error': {'code': 'MATRIX_OP_ERROR', 'message': str(e)}}
@@ -1,20 +1,33 @@
 from __future__ import annotations
-from typing import Any, Dict, List 
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from ..utils.algebraic_support import (
-    isclose, format_number, shape,
-    clone_with, TOL 
+    isclose, format_number, shape, TOL
 )
-
-from ..utils.algebraic_support import format_number
 from ..Constants.subDigits import SUBDIGITS
 
 def xsub(i: int) ->str:
     s = str(i)
     return "x" + "".join(SUBDIGITS[ch] for ch in s)
 
+def _scan_pivot_rows(R: List[List[float]], basic: List[int], tol: float = TOL) -> Dict[int, Optional[int]]:
+    # mapa col_pivote->fila (en RREF cada básica tiene su fila con 1 en el pivote)
+    m = len(R)
+    pivot_row_of_col: Dict[int, Optional[int]] = {c: None for c in basic}
+    for r in range(m):
+        for c in basic:
+            if isclose(R[r][c], 1.0, tol) and all(isclose(R[r][k], 0.0, tol) for k in range(c)):
+                if all(isclose(R[k][c], 0.0, tol) for k in range(m) if k != r):
+                    pivot_row_of_col[c] = r
+                    break
+    return pivot_row_of_col
+
+
 def parametric_from_rref(Ab: List[List[float]], info: Dict[str, Any], param_base:str = "s", tol:float=TOL) -> Dict[str, Any]:
-    R = clone_with(Ab)
-    m, n1 = shape(R)
+    """
+    Forma paramétrica y base del espacio nulo de A a partir de [A | b] en RREF, en una pasada.
+    Usa info["pivots"] (fila, col) de la eliminación; si no vienen, los busca en la RREF.
+    """
+    m, n1 = shape(Ab)
     n = n1 - 1
     basic = info.get("basic_vars", [])
     free  = info.get("free_vars", [])
@@ -23,49 +36,98 @@ def parametric_from_rref(Ab: List[List[float]], info: Dict[str, Any], param_base
     params = [f"{param_base}{i+1}" for i in range(len(free))]
     param_of_col = {col: params[k] for k, col in enumerate(free)}
 
-    # mapa fila->col_pivote (en RREF cada básica tiene su fila con 1 en el pivote)
-    pivot_row_of_col = {c: None for c in basic}
-    for r in range(m):
-        for c in basic:
-            if isclose(R[r][c], 1.0, tol) and all(isclose(R[r][k], 0.0, tol) for k in range(c)):
-                if all(isclose(R[k][c], 0.0, tol) for k in range(m) if k != r):
-                    pivot_row_of_col[c] = r
-                    break
+    pivots = info.get("pivots")
+    if pivots is None:
+        pivot_row_of_col = _scan_pivot_rows(Ab, basic, tol)
+    else:
+        pivot_row_of_col = {c: r for r, c in pivots}
+
+    # Base del espacio nulo: por cada libre x_f, v_f = 1 y v_c = -R[fila(c)][f] en cada básica
+    basis = [[0.0] * n for _ in free]
+    for k, f in enumerate(free):
+        basis[k][f] = 1.0
+
+    out_vars = []
+    for col in range(n):
+        if col in param_of_col:
+            out_vars.append(_free_var(col, param_of_col))
+            continue
+        r = pivot_row_of_col.get(col)
+        if r is None:
+            # fallback: constante 0
+            out_vars.append({"col": col, "constant": format_number(0.0), "terms": [], "pretty": f"{xsub(col+1)} = 0"})
+            continue
+        row = Ab[r]
+        out_vars.append(_basic_var(col, row[n], ((j, row[j]) for j in range(n)), param_of_col, tol))
+        for k, f in enumerate(free):
+            if not isclose(row[f], 0.0, tol):
+                basis[k][col] = float(-row[f])
+
+    return {
+        "params": params,
+        "vars": out_vars,
+        "pretty": [v["pretty"] for v in out_vars],
+        "free_basis": basis,
+    }
+
+
+def _basic_var(col: int, const: float, coeffs: Iterable[Tuple[int, float]],
+               param_of_col: Dict[int, str], tol: float = TOL) -> Dict[str, Any]:
+    # coeffs: (j, a) de la fila pivote en orden creciente de j
+    terms = []
+    pieces = [format_number(const)]
+    for j, a in coeffs:
+        if j == col:
+            continue
+        if isclose(a, 0.0, tol):
+            continue
+        # x_col = b - sum_j a*r_j * x_j  -> coef(param) = -a
+        sign = "-" if a > 0 else "+"
+        mag = abs(a)
+        pname = param_of_col.get(j, xsub(j+1))
+        mag_str = "" if abs(mag - 1.0) <= tol else format_number(mag)
+        pieces.append(f"{sign} {mag_str} {pname}".strip())
+        terms.append({"param": param_of_col.get(j, f"x{j+1}"), "coef": float(-a)})
+
+    pretty = f"{xsub(col+1)} = " + " ".join(pieces).replace("  ", " ").strip()
+    return {"col": col, "constant": format_number(const), "terms": terms, "pretty": pretty}
+
+
+def _free_var(col: int, param_of_col: Dict[int, str]) -> Dict[str, Any]:
+    pname = param_of_col[col]
+    return {"col": col, "constant": format_number(0.0), "terms": [{"param": pname, "coef": 1.0}], "pretty": f"{xsub(col+1)} = {pname}"}
+
+
+def parametric_from_sparse_rref(pivot_rows: Dict[int, Dict[int, float]], n: int, free: List[int],
+                                param_base: str = "s", tol: float = TOL) -> Dict[str, Any]:
+    """
+    Igual que parametric_from_rref para una RREF dispersa: pivot_rows[col] es la fila
+    pivote de cada variable básica como dict {col: valor}, con el término independiente en la clave n.
+    """
+    params = [f"{param_base}{i+1}" for i in range(len(free))]
+    param_of_col = {col: params[k] for k, col in enumerate(free)}
+
+    # Base del espacio nulo en forma dispersa: {"size", "index", "data"} por variable libre
+    basis: Dict[int, Dict[int, float]] = {f: {f: 1.0} for f in free}
 
     out_vars = []
     for col in range(n):
-        if col in basic:
-            r = pivot_row_of_col[col]
-            if r is None:
-                # fallback: constante 0
-                out_vars.append({"col": col, "constant": format_number(0.0), "terms": [], "pretty": f"{xsub(col+1)} = 0"})
-                continue
-
-            const = R[r][n]
-            terms = []
-            pieces = [format_number(const)]
-            for j in range(n):
-                if j == col: 
-                    continue
-                a = R[r][j]
-                if isclose(a, 0.0, tol):
-                    continue
-                # x_col = b - sum_j a*r_j * x_j  -> coef(param) = -a
-                sign = "-" if a > 0 else "+"
-                mag = abs(a)
-                pname = param_of_col.get(j, xsub(j+1))
-                mag_str = "" if abs(mag - 1.0) <= tol else format_number(mag)
-                pieces.append(f"{sign} {mag_str} {pname}".strip())
-                terms.append({"param": param_of_col.get(j, f"x{j+1}"), "coef": -a})
-
-            pretty = f"{xsub(col+1)} = " + " ".join(pieces).replace("  ", " ").strip()
-            out_vars.append({"col": col, "constant": format_number(const), "terms": terms, "pretty": pretty})
+        row = pivot_rows.get(col)
+        if row is not None:
+            coeffs = ((j, row[j]) for j in sorted(row) if j < n)
+            out_vars.append(_basic_var(col, row.get(n, 0.0), coeffs, param_of_col, tol))
+            for j, a in row.items():
+                if j in basis and not isclose(a, 0.0, tol):
+                    basis[j][col] = float(-a)
         else:
-            pname = param_of_col[col]
-            out_vars.append({"col": col, "constant": format_number(0.0), "terms": [{"param": pname, "coef": 1.0}], "pretty": f"{xsub(col+1)} = {pname}"})
+            out_vars.append(_free_var(col, param_of_col))
 
     return {
         "params": params,
         "vars": out_vars,
         "pretty": [v["pretty"] for v in out_vars],
+        "free_basis": [
+            {"size": n, "index": sorted(basis[f]), "data": [basis[f][i] for i in sorted(basis[f])]}
+            for f in free
+        ],
     }
\ No newline at end of file
@@ -0,0 +1,176 @@
+from __future__ import annotations
+from fractions import Fraction
+from math import gcd, lcm
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ...utils.algebraic_support import (
+    Matrix, shape, format_number,
+    log_pivot, log_swap_rows, log_row_op, wants_steps, flush_steps, exhaust, StepEvents
+)
+
+# -------------------------------
+# Eliminación exacta libre de fracciones (Bareiss)
+# -------------------------------
+
+Exact = Union[int, Fraction]
+ExactMatrix = List[List[Exact]]
+
+
+def to_exact(x: Any) -> Fraction:
+    """
+    Convierte un valor de entrada a Fraction sin aproximar.
+    Los floats llegan desde JSON: su repr es el decimal que escribió el usuario (0.1 → 1/10).
+    """
+    if isinstance(x, (int, Fraction)):
+        return Fraction(x)
+    return Fraction(repr(float(x)))
+
+
+def to_exact_matrix(M: Matrix) -> ExactMatrix:
+    return [[to_exact(v) for v in row] for row in (M or [])]
+
+
+def integerize_rows(M: ExactMatrix) -> List[int]:
+    """
+    Multiplica cada fila por el mcm de sus denominadores para trabajar solo con enteros.
+    Modifica M en sitio y devuelve el factor aplicado a cada fila.
+    """
+    scales: List[int] = []
+    for i, row in enumerate(M):
+        d = lcm(*(Fraction(v).denominator for v in row)) if row else 1
+        M[i] = [int(v * d) for v in row]
+        scales.append(d)
+    return scales
+
+
+def scaling_text(scales: List[int]) -> str:
+    return ", ".join(f"R{i+1} ← {d}·R{i+1}" for i, d in enumerate(scales) if d != 1)
+
+
+def bareiss_row_update(P: List[int], R: List[int], col: int, prev: int) -> None:
+    """R ← (p·R − a·P) / prev desde la columna `col`; la división siempre es exacta."""
+    p, a = P[col], R[col]
+    for j in range(col + 1, len(R)):
+        R[j] = (p * R[j] - a * P[j]) // prev
+    R[col] = 0
+
+
+def _bareiss_text(r: int, row: int, p: int, a: int, prev: int) -> str:
+    expr = f"{p}·R{r+1}" if a == 0 else f"{p}·R{r+1} - ({a})·R{row+1}"
+    return f"R{r+1} ← ({expr}) / {prev}" if prev != 1 else f"R{r+1} ← {expr}"
+
+
+def select_pivot_row_exact(M: ExactMatrix, start_row: int, col: int, pivoting: str = "partial") -> Optional[int]:
+    candidates = [r for r in range(start_row, len(M)) if M[r][col] != 0]
+    if not candidates:
+        return None
+    if pivoting == "partial":
+        return max(candidates, key=lambda r: abs(M[r][col]))
+    return candidates[0]
+
+
+def bareiss_forward(Ab: ExactMatrix, steps: Optional[List[Dict[str, Any]]], pivoting: str = "partial",
+                    rhs: int = 1) -> List[Tuple[int, int]]:
+    """
+    Forma escalonada entera de Ab (ya escalada a enteros) por Bareiss.
+    Cada entrada resultante es un menor de la matriz original, por lo que los
+    enteros quedan acotados. Devuelve la lista de pivotes (fila, col).
+    """
+    return exhaust(iter_bareiss_forward(Ab, steps, pivoting, rhs))
+
+
+def iter_bareiss_forward(Ab: ExactMatrix, steps: Optional[List[Dict[str, Any]]], pivoting: str = "partial",
+                         rhs: int = 1) -> StepEvents:
+    """Igual que bareiss_forward, pero emite cada paso en cuanto se registra."""
+    m, n1 = shape(Ab)
+    n = n1 - rhs
+    row = 0
+    prev = 1
+    pivots: List[Tuple[int, int]] = []
+
+    for col in range(n):
+        if row >= m:
+            break
+
+        pivot_row = select_pivot_row_exact(Ab, row, col, pivoting)
+        if pivot_row is None:
+            continue
+
+        if pivot_row != row:
+            Ab[row], Ab[pivot_row] = Ab[pivot_row], Ab[row]
+            if wants_steps(steps):
+                log_swap_rows(steps, row, pivot_row, Ab)
+
+        p = Ab[row][col]
+        if wants_steps(steps, "summary"):
+            log_pivot(steps, row, col, p)
+            yield from flush_steps(steps)
+
+        # Todas las filas inferiores se actualizan (aunque a = 0) para conservar la divisibilidad
+        for r in range(row + 1, m):
+            a = Ab[r][col]
+            if a == 0 and p == prev:
+                continue
+            bareiss_row_update(Ab[row], Ab[r], col, prev)
+            if wants_steps(steps):
+                log_row_op(steps, _bareiss_text(r, row, p, a, prev), Ab, rows=(r,))
+                yield from flush_steps(steps)
+
+        prev = p
+        pivots.append((row, col))
+        row += 1
+
+    return pivots
+
+
+def exact_backward_to_rref(Ab: ExactMatrix, steps: Optional[List[Dict[str, Any]]], pivots: List[Tuple[int, int]]) -> None:
+    """
+    Desde la forma escalonada entera: elimina por encima de cada pivote sin fracciones
+    (R ← p·R − a·P y se divide por el mcd de la fila) y al final normaliza cada pivote a 1.
+    """
+    exhaust(iter_exact_backward_to_rref(Ab, steps, pivots))
+
+
+def iter_exact_backward_to_rref(Ab: ExactMatrix, steps: Optional[List[Dict[str, Any]]],
+                                pivots: List[Tuple[int, int]]) -> StepEvents:
+    """Igual que exact_backward_to_rref, pero emite cada paso en cuanto se registra."""
+    for (r, c) in reversed(pivots):
+        P = Ab[r]
+        p = P[c]
+        for rr in range(r):
+            a = Ab[rr][c]
+            if a == 0:
+                continue
+            R = [p * x - a * y for x, y in zip(Ab[rr], P)]
+            g = gcd(*R)
+            if g > 1:
+                R = [x // g for x in R]
+            Ab[rr] = R
+            if wants_steps(steps):
+                expr = f"{p}·R{rr+1} - ({a})·R{r+1}"
+                log_row_op(steps, f"R{rr+1} ← ({expr}) / {g}" if g > 1 else f"R{rr+1} ← {expr}", Ab, rows=(rr,))
+                yield from flush_steps(steps)
+
+    for (r, c) in pivots:
+        p = Ab[r][c]
+        if p == 1:
+            continue
+        Ab[r] = [Fraction(x, p) for x in Ab[r]]
+        if wants_steps(steps):
+            log_row_op(steps, f"R{r+1} ← R{r+1} / {format_number(p)}", Ab, rows=(r,))
+            yield from flush_steps(steps)
+
+
+def exact_rref(U: ExactMatrix, pivots: List[Tuple[int, int]]) -> ExactMatrix:
+    """RREF exacta a partir de la forma escalonada entera, sin registrar pasos."""
+    R = [row[:] for row in U]
+    exact_backward_to_rref(R, None, pivots)
+    return R
+
+
+def exact_solution_from_rref(R: ExactMatrix, pivots: List[Tuple[int, int]], n: int) -> List[Fraction]:
+    """Solución particular exacta (libres = 0) leída de la RREF."""
+    x = [Fraction(0)] * n
+    for (r, c) in pivots:
+        x[c] = Fraction(R[r][-1])
+    return x
@@ -1,81 +1,193 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from ...utils.algebraic_support import (
-    Matrix, Number, TOL, isclose, to_augmented, shape, normalize_neg_zero,
+    Matrix, Number, TOL, isclose, to_augmented, to_augmented_many, rhs_column, shape, normalize_neg_zero,
     log_init, log_pivot, log_swap_rows, log_row_op, log_upper, format_number, clone_with,
-    matrix_as_fraction
+    matrix_as_fraction, new_step_log, value_table_field, wants_steps, flush_steps, exhaust, StepEvents
 )
 from ..parametric import parametric_from_rref
+from .numpy_engine import resolve_engine, to_array, cached_upper_np, iter_forward_elimination_np, u_to_rref_np
+from ...utils.dense_matrix import DenseMatrix
+from .bareiss import (
+    to_exact_matrix, integerize_rows, scaling_text, iter_bareiss_forward,
+    exact_rref, exact_solution_from_rref
+)
 
 # -------------------------------
 # API de Gauss
 # -------------------------------
 
 def gauss_api(
-        *,
-        A: Optional[Matrix] = None,
-        b: Optional[List[Number]] = None,
-        Ab: Optional[Matrix] = None,
-        options: Optional[Dict[str, Any]] = None,
+    *,
+    A: Optional[Matrix] = None,
+    b: Optional[List[Number]] = None,
+    Ab: Optional[Matrix] = None,
+    B: Optional[Matrix] = None,
+    options: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
+    return exhaust(iter_gauss(A=A, b=b, Ab=Ab, B=B, options=options))
+
+
+def gauss_stream(
+    *,
+    A: Optional[Matrix] = None,
+    b: Optional[List[Number]] = None,
+    Ab: Optional[Matrix] = None,
+    B: Optional[Matrix] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Variante en streaming de gauss_api: emite ("step", paso) a medida que la eliminación
+    avanza y al final ("summary", {"input", "summary" | "summaries"}). Los pasos no se acumulan en memoria.
+    """
+    result = yield from iter_gauss(A=A, b=b, Ab=Ab, B=B, options=options, streaming=True)
+    yield "summary", {k: v for k, v in result.items() if k != "steps"}
+
+
+def iter_gauss(
+    *,
+    A: Optional[Matrix] = None,
+    b: Optional[List[Number]] = None,
+    Ab: Optional[Matrix] = None,
+    B: Optional[Matrix] = None,
+    options: Optional[Dict[str, Any]] = None,
+    streaming: bool = False,
+) -> StepEvents:
     opt = options or {}
     pivoting = opt.get("pivoting", "partial")  # "none" | "partial"
 
-    # 0) Normalizar entrada a Ab
+    # 0) Normalizar entrada a Ab  (con B (n×k): [A | B], una eliminación para las k columnas)
     original_b = None
-    if Ab is None:
+    raw = Ab  # entrada sin normalizar: el modo exacto no redondea residuos
+    rhs = 1
+    if B is not None:
+        if A is None:
+            raise ValueError("Si envías B, también debes enviar A.")
+        Ab = raw = to_augmented_many(A, B)
+        rhs = len(B[0]) if B else 1
+        original_bs = [[row[j] for row in B] for j in range(rhs)]
+    elif Ab is None:
         if A is None or b is None:
             raise ValueError("Debes enviar Ab, o A y b.")
-        Ab = to_augmented(A, b)
+        Ab = raw = to_augmented(A, b)
         original_b = list(b)
     else:
         Ab = clone_with(Ab)
         # Si recibimos Ab “solo”, inferimos b inicial
         original_b = [row[-1] for row in Ab] if Ab else []
+    if B is None:
+        original_bs = [original_b]
 
     m, n1 = shape(Ab)
     if n1 < 2:
         raise ValueError("La matriz aumentada debe tener al menos 2 columnas.")
-    n = n1 - 1
+    n = n1 - rhs
+
+    engine = resolve_engine(opt, Ab)  # options.engine: "auto" | "python" | "numpy" | "exact"
+    exact = engine == "exact"
+    tol = 0.0 if exact else TOL
+    if exact:
+        Ab = to_exact_matrix(raw)
 
-    steps: List[Dict[str, Any]] = []
+    steps = new_step_log(opt, streaming)  # options.steps: "none" | "summary" | "full"; options.steps_format: "full" | "delta"
     log_init(steps, Ab)
+    yield from flush_steps(steps)
 
     # 1) Eliminación hacia adelante → U (triangular superior)
-    pivots = forward_elimination_to_U(Ab, steps, pivoting=pivoting)
+    #    Sin pasos que mostrar, U sale de la caché LU (misma A en otra petición)
+    cached = None
+    if not exact and pivoting == "partial" and not wants_steps(steps, "summary"):
+        cached = cached_upper_np(Ab, rhs)
+    if cached is not None:
+        M, pivots = cached
+        Ab = M.tolist()
+    elif engine == "numpy":
+        M = DenseMatrix.from_rows(Ab)
+        pivots = yield from iter_forward_elimination_np(M, steps, pivoting=pivoting, rhs=rhs)
+        Ab = M.to_rows()
+    elif exact:
+        scales = integerize_rows(Ab)
+        if any(d != 1 for d in scales) and wants_steps(steps):
+            log_row_op(steps, scaling_text(scales), Ab)
+            yield from flush_steps(steps)
+        pivots = yield from iter_bareiss_forward(Ab, steps, pivoting=pivoting, rhs=rhs)
+    else:
+        pivots = yield from iter_forward_elimination_to_U(Ab, steps, pivoting=pivoting, rhs=rhs)
     log_upper(steps, Ab)
+    yield from flush_steps(steps)
 
-    # 2) Analizar (rank, básicas/libres, consistencia) y resolver
-    info = analyze_from_upper(Ab)
+    # 2) RREF de [U | B] una sola vez: los pivotes de A son comunes a todas las columnas
+    pivots = analyze_from_upper(rhs_column(Ab, n, 0), tol)["pivots"]
+    if exact:
+        Ab_rref = exact_rref(Ab, pivots)
+    else:
+        Ab_rref = clone_with(Ab)
+        if engine == "numpy":
+            R = to_array(Ab_rref)
+            u_to_rref_np(R, pivots)
+            Ab_rref = R.tolist()
+        else:
+            u_to_rref_inplace(Ab_rref, pivots)
+
+    # 3) Analizar y resolver cada columna de términos independientes
+    summaries = [
+        gauss_summary(rhs_column(Ab, n, j), rhs_column(Ab_rref, n, j), original_bs[j], exact, tol)
+        for j in range(rhs)
+    ]
+
+    if B is not None:
+        return {
+            "input": {"method": "gauss", "A": A, "B": B, "engine": engine},
+            "steps": steps,
+            "summaries": summaries,
+            **value_table_field(steps),
+        }
+    return {
+        "input": {"method": "gauss", "A": A, "b": b, "engine": engine},
+        "steps": steps,
+        "summary": summaries[0],
+        **value_table_field(steps),
+    }
+
+
+def gauss_summary(U: Matrix, Ab_rref: Matrix, original_b: Optional[List[Number]],
+                  exact: bool = False, tol: float = TOL) -> Dict[str, Any]:
+    """Resumen (rangos, solución, forma paramétrica) de un sistema [U | b] y su RREF."""
+    n = shape(U)[1] - 1
+    info = analyze_from_upper(U, tol)
     solution = None
     if info["status"] != "inconsistent":
-        solution = back_substitution_particular(Ab, info["pivots"])
+        if exact:
+            # La RREF exacta ya contiene la solución particular (libres = 0)
+            solution = exact_solution_from_rref(Ab_rref, info["pivots"], n)
+        else:
+            solution = back_substitution_particular(U, info["pivots"])
 
-    Ab_rref = clone_with(Ab)
     if info["status"] != "inconsistent":
-        u_to_rref_inplace(Ab_rref, info["pivots"])
         parametric = parametric_from_rref(Ab_rref, {
             "basic_vars": info["basic_vars"],
-            "free_vars": info["free_vars"]
-        })
+            "free_vars": info["free_vars"],
+            "pivots": info["pivots"],  # las filas pivote de U son las de la RREF
+        }, tol=tol)
     else:
-        parametric = {"params": [], "vars": [], "pretty": []}
+        parametric = {"params": [], "vars": [], "pretty": [], "free_basis": None}
+    free_basis = parametric.pop("free_basis")
 
-    # 3) Construir summary incluyendo TUS 3 campos extra
+    # Construir summary incluyendo TUS 3 campos extra
     rankA = info["rank"]
     rankAb = rankA + (1 if info["inconsistent_rows"] else 0)
 
     homogeneous = all(isclose(x, 0.0) for x in (original_b or []))
     dependence = "independientes" if rankA == n else "dependientes"
-    trivial_solution = bool(solution) and all(isclose(v, 0.0) for v in solution)
+    trivial_solution = bool(solution) and all(isclose(v, 0.0, tol) for v in solution)
 
     # Format solution and RREF to avoid floats
     formatted_solution = None
     if solution is not None:
         formatted_solution = [format_number(x) for x in solution]
-    formatted_rref = matrix_as_fraction(Ab_rref)
+    formatted_rref = matrix_as_fraction(Ab_rref) if info["status"] != "inconsistent" else None
 
-    summary = {
+    return {
         "ranks": {"rankA": rankA, "rankAb": rankAb},
         "solution_type": (
             "sin_solucion" if info["status"] == "inconsistent"
@@ -87,24 +199,19 @@ def gauss_api(
         "variables": {"basic": info["basic_vars"], "free": info["free_vars"]},
         "parametric_form": {
             "exists": info["status"] == "infinite",
-            "particular": solution,
+            "particular": [float(x) for x in solution] if solution is not None else None,
             "particular_pretty": formatted_solution,
-            "free_basis": None,
+            "free_basis": free_basis,
+            "free_basis_pretty": matrix_as_fraction(free_basis) if free_basis is not None else None,
             "pretty": parametric["pretty"],   # <---- NUEVO
             "symbolic": parametric, 
         },
         "reduced_form": {
-            "U": matrix_as_fraction(clone_with(Ab)), 
-            "RREF": formatted_rref if info["status"] != "inconsistent" else None,
+            "U": matrix_as_fraction(U if exact else clone_with(U)), 
+            "RREF": formatted_rref,
             "note": "Triangular superior (U)"},
     }
 
-    return {
-        "input": {"method": "gauss", "A": A, "b": b},
-        "steps": steps,
-        "summary": summary,
-    }
-
 
 def select_pivot_row(Ab: Matrix, start_row: int, col: int) -> Optional[int]:
     m, _ = shape(Ab)
@@ -117,11 +224,23 @@ def select_pivot_row(Ab: Matrix, start_row: int, col: int) -> Optional[int]:
             sel = r
     return sel
 
-def forward_elimination_to_U(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str = "partial") -> List[Tuple[int, int]]:
+def forward_elimination_to_U(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str = "partial",
+                             rhs: int = 1) -> List[Tuple[int, int]]:
+    # rhs: cantidad de columnas de términos independientes al final de Ab ([A | B])
+    return exhaust(iter_forward_elimination_to_U(Ab, steps, pivoting, rhs))
+
+def iter_forward_elimination_to_U(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str = "partial",
+                                  rhs: int = 1) -> StepEvents:
+    """
+    Igual que forward_elimination_to_U, pero emite cada paso en cuanto se registra.
+    Motor "python": listas de floats (sistemas chicos, ver NUMPY_AUTO_THRESHOLD); el motor
+    "numpy" hace la misma eliminación sobre DenseMatrix (numpy_engine.py).
+    """
     m, n1 = shape(Ab)
-    n = n1 - 1
+    n = n1 - rhs
     row = 0
     pivots: List[Tuple[int, int]] = []
+    clean = False  # hasta la primera limpieza completa de Ab
 
     for col in range(n):
         if row >= m:
@@ -148,16 +267,20 @@ def forward_elimination_to_U(Ab: Matrix, steps: List[Dict[str, Any]], pivoting:
 
         pivot_val = Ab[row][col]
         log_pivot(steps, row, col, pivot_val)
+        yield from flush_steps(steps)
 
         # 4) Eliminar debajo del pivote
         for r in range(row + 1, m):
             if isclose(Ab[r][col], 0.0):
                 continue
             factor = Ab[r][col] / pivot_val
-            for c in range(col, n + 1):
+            for c in range(col, n1):
                 Ab[r][c] -= factor * Ab[row][c]
-            normalize_neg_zero(Ab)
-            log_row_op(steps, f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}", Ab)
+            normalize_neg_zero(Ab, rows=(r,) if clean else None)
+            clean = True
+            if wants_steps(steps):
+                log_row_op(steps, f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}", Ab, rows=(r,))
+                yield from flush_steps(steps)
 
         pivots.append((row, col))
         row += 1
@@ -1,13 +1,18 @@
 from __future__ import annotations
-from typing import Any, List, Tuple, Dict, Optional
+from typing import Any, Iterator, List, Tuple, Dict, Optional
 from ...utils.algebraic_support import(
-    Matrix, Number, TOL, isclose, to_augmented, shape, 
+    Matrix, Number, TOL, isclose, to_augmented, to_augmented_many, rhs_column, shape, 
     normalize_neg_zero, log_init, log_pivot, log_swap_rows, 
     log_row_op, log_upper, log_rref, format_number, clone_with,
-    matrix_as_fraction
+    matrix_as_fraction, new_step_log, value_table_field, wants_steps, flush_steps, exhaust, StepEvents
 )
 
 from ..parametric import parametric_from_rref
+from .numpy_engine import (
+    resolve_engine, to_array, cached_upper_np, u_to_rref_np, iter_forward_elimination_np, iter_backward_to_rref_np
+)
+from ...utils.dense_matrix import DenseMatrix
+from .bareiss import to_exact_matrix, integerize_rows, scaling_text, iter_bareiss_forward, iter_exact_backward_to_rref
 from algebra.Constants.subDigits import SUBDIGITS
 
 # -------------------------------
@@ -18,39 +23,143 @@ def gauss_jordan_api(
     A: Optional[Matrix] = None,
     b: Optional[List[Number]] = None,
     Ab: Optional[Matrix] = None,
+    B: Optional[Matrix] = None,
     options: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
+    return exhaust(iter_gauss_jordan(A=A, b=b, Ab=Ab, B=B, options=options))
+
+
+def gauss_jordan_stream(
+    *,
+    A: Optional[Matrix] = None,
+    b: Optional[List[Number]] = None,
+    Ab: Optional[Matrix] = None,
+    B: Optional[Matrix] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Variante en streaming de gauss_jordan_api: emite ("step", paso) a medida que la eliminación
+    avanza y al final ("summary", {"input", "summary" | "summaries"}). Los pasos no se acumulan en memoria.
+    """
+    result = yield from iter_gauss_jordan(A=A, b=b, Ab=Ab, B=B, options=options, streaming=True)
+    yield "summary", {k: v for k, v in result.items() if k != "steps"}
+
+
+def iter_gauss_jordan(
+    *,
+    A: Optional[Matrix] = None,
+    b: Optional[List[Number]] = None,
+    Ab: Optional[Matrix] = None,
+    B: Optional[Matrix] = None,
+    options: Optional[Dict[str, Any]] = None,
+    streaming: bool = False,
+) -> StepEvents:
     opt = options or {}
     pivoting = opt.get("pivoting", "partial")    # "none" | "partial"
-    keep_fractions = bool(opt.get("keep_fractions", False))  # reservado
+    # keep_fractions=True → aritmética exacta (equivale a engine="exact")
 
     # Normaliza entrada a Ab y guarda b original para 'homogeneous'
-    if Ab is None:
+    # (con B (n×k): [A | B], una eliminación para las k columnas)
+    raw = Ab  # entrada sin normalizar: el modo exacto no redondea residuos
+    rhs = 1
+    if B is not None:
+        if A is None:
+            raise ValueError("Si envías B, también debes enviar A.")
+        Ab = raw = to_augmented_many(A, B)
+        rhs = len(B[0]) if B else 1
+        original_bs = [[row[j] for row in B] for j in range(rhs)]
+    elif Ab is None:
         if A is None or b is None:
             raise ValueError("Debes enviar Ab, o A y b.")
-        Ab = to_augmented(A, b)
-        original_b = list(b)
+        Ab = raw = to_augmented(A, b)
+        original_bs = [list(b)]
     else:
         Ab = clone_with(Ab)
-        original_b = [row[-1] for row in Ab] if Ab else []
+        original_bs = [[row[-1] for row in Ab] if Ab else []]
 
     m, n_plus_1 = shape(Ab)
     if n_plus_1 < 2:
         raise ValueError("La matriz aumentada debe tener al menos 2 columnas.")
+    n = n_plus_1 - rhs
 
-    steps: List[Dict[str, Any]] = []
-    log_init(steps, Ab)
+    engine = resolve_engine(opt, Ab)  # options.engine: "auto" | "python" | "numpy" | "exact"
+    exact = engine == "exact"
+    tol = 0.0 if exact else TOL
+    if exact:
+        Ab = to_exact_matrix(raw)
 
-    # 1) Forward → U
-    pivots = forward_elimination(Ab, steps, pivoting=pivoting)
-    log_upper(steps, Ab)
+    steps = new_step_log(opt, streaming)  # options.steps: "none" | "summary" | "full"; options.steps_format: "full" | "delta"
+    log_init(steps, Ab)
+    yield from flush_steps(steps)
+
+    # Sin pasos que mostrar, U sale de la caché LU (misma A en otra petición)
+    cached = None
+    if not exact and pivoting == "partial" and not wants_steps(steps, "summary"):
+        cached = cached_upper_np(Ab, rhs)
+    if cached is not None:
+        M, pivots = cached
+        u_to_rref_np(M, pivots)
+        Ab = M.tolist()
+        normalize_neg_zero(Ab)
+    elif engine == "numpy":
+        # 1) Forward → U  /  2) Backward → RREF, vectorizados sobre float64
+        M = DenseMatrix.from_rows(Ab)
+        pivots = yield from iter_forward_elimination_np(M, steps, pivoting=pivoting, rhs=rhs)
+        if wants_steps(steps):
+            log_upper(steps, M)
+            yield from flush_steps(steps)
+        yield from iter_backward_to_rref_np(M, steps, pivots)
+        Ab = M.to_rows()
+        log_rref(steps, Ab)
+        yield from flush_steps(steps)
+    elif exact:
+        # 1) Forward → U entera (Bareiss)  /  2) Backward sin fracciones hasta normalizar
+        scales = integerize_rows(Ab)
+        if any(d != 1 for d in scales) and wants_steps(steps):
+            log_row_op(steps, scaling_text(scales), Ab)
+            yield from flush_steps(steps)
+        pivots = yield from iter_bareiss_forward(Ab, steps, pivoting=pivoting, rhs=rhs)
+        log_upper(steps, Ab)
+        yield from flush_steps(steps)
+        yield from iter_exact_backward_to_rref(Ab, steps, pivots)
+        log_rref(steps, Ab)
+        yield from flush_steps(steps)
+    else:
+        # 1) Forward → U
+        pivots = yield from iter_forward_elimination(Ab, steps, pivoting=pivoting, rhs=rhs)
+        log_upper(steps, Ab)
+        yield from flush_steps(steps)
+
+        # 2) Backward → RREF
+        yield from iter_backward_to_rref(Ab, steps, pivots)
+        log_rref(steps, Ab)
+        yield from flush_steps(steps)
+
+    # 3) Análisis en RREF + solución particular, por cada columna de términos independientes
+    summaries = [
+        gauss_jordan_summary(rhs_column(Ab, n, j), original_bs[j], exact, tol)
+        for j in range(rhs)
+    ]
+
+    if B is not None:
+        return {
+            "input": {"method": "gauss-jordan", "A": A, "B": B, "engine": engine},
+            "steps": steps,
+            "summaries": summaries,
+            **value_table_field(steps),
+        }
+    return {
+        "input": {"method": "gauss-jordan", "A": A, "b": b, "engine": engine},
+        "steps": steps,
+        "summary": summaries[0],
+        **value_table_field(steps),
+    }
 
-    # 2) Backward → RREF
-    backward_to_rref(Ab, steps, pivots)
-    log_rref(steps, Ab)
 
-    # 3) Análisis en RREF + solución particular
-    info = analyze_augmented(Ab)
+def gauss_jordan_summary(Ab: Matrix, original_b: Optional[List[Number]],
+                         exact: bool = False, tol: float = TOL) -> Dict[str, Any]:
+    """Resumen (rangos, solución, forma paramétrica) de un sistema [A | b] ya en RREF."""
+    info = analyze_augmented(Ab, tol)
     solution = None
     if info["status"] != "inconsistent":
         solution = particular_solution_from_rref(Ab, info)
@@ -63,15 +172,18 @@ def gauss_jordan_api(
 
     homogeneous = all(isclose(x, 0.0) for x in (original_b or []))
     dependence = "independientes" if rankA == n else "dependientes"
-    trivial_solution = (solution is not None) and all(isclose(v, 0.0) for v in solution)
-    parametric = parametric_from_rref(Ab, info, param_base="s")
+    trivial_solution = (solution is not None) and all(isclose(v, 0.0, tol) for v in solution)
+    parametric = parametric_from_rref(Ab, info, param_base="s", tol=tol)
+    free_basis = parametric.pop("free_basis")
+    if info["status"] == "inconsistent":
+        free_basis = None  # sin solución no hay conjunto que parametrizar
 
 
     # Format solution and RREF to avoid floats
     formatted_solution = None
     if solution is not None:
         formatted_solution = [format_number(x) for x in solution]
-    formatted_rref = matrix_as_fraction(clone_with(Ab))
+    formatted_rref = matrix_as_fraction(Ab if exact else clone_with(Ab))
 
     summary = {
         "ranks": {"rankA": rankA, "rankAb": rankAb},
@@ -86,21 +198,17 @@ def gauss_jordan_api(
         "parametric_form": {
             "exists": info["status"] == "infinitas",
             # keep numeric particular for programmatic use, provide a *_pretty for display
-            "particular": solution,
+            "particular": [float(x) for x in solution] if solution is not None else None,
             "particular_pretty": formatted_solution,
-            "free_basis": None,
+            "free_basis": free_basis,
+            "free_basis_pretty": matrix_as_fraction(free_basis) if free_basis is not None else None,
             "pretty": parametric["pretty"],
             "symbolic": parametric,
         },
         "reduced_form": {"RREF": formatted_rref, "note": ""},
     }
 
-    return {
-        "input": {"method": "gauss-jordan", "A": A, "b": b},
-        "steps": steps,
-        "summary": summary,
-    }
-
+    return summary
 
 
 def select_pivot_row(Ab: Matrix, start_row: int, col: int) -> Optional[int]:
@@ -114,14 +222,22 @@ def select_pivot_row(Ab: Matrix, start_row: int, col: int) -> Optional[int]:
             sel = r
     return sel
 
-def forward_elimination(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str = "partial") -> List[Tuple[int, int]]:
+def forward_elimination(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str = "partial",
+                        rhs: int = 1) -> List[Tuple[int, int]]:
     """
     Convierte Ab a triangular superior. Devuelve lista de pivotes (fila,col).
+    rhs: cantidad de columnas de términos independientes al final de Ab ([A | B]).
     """
+    return exhaust(iter_forward_elimination(Ab, steps, pivoting, rhs))
+
+def iter_forward_elimination(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str = "partial",
+                             rhs: int = 1) -> StepEvents:
+    """Igual que forward_elimination, pero emite cada paso en cuanto se registra."""
     m, n1 = shape(Ab)
-    n = n1 - 1
+    n = n1 - rhs
     row = 0
     pivots: List[Tuple[int, int]] = []
+    clean = False  # hasta la primera limpieza completa de Ab
 
     for col in range(n):
         if row >= m:
@@ -148,16 +264,20 @@ def forward_elimination(Ab: Matrix, steps: List[Dict[str, Any]], pivoting: str =
 
         pivot_val = Ab[row][col]
         log_pivot(steps, row, col, pivot_val)
+        yield from flush_steps(steps)
 
         # Eliminar por debajo
         for r in range(row + 1, m):
             if isclose(Ab[r][col], 0.0):
                 continue
             factor = Ab[r][col] / pivot_val
-            for c in range(col, n + 1):
+            for c in range(col, n1):
                 Ab[r][c] -= factor * Ab[row][c]
-            normalize_neg_zero(Ab)
-            log_row_op(steps, f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}", Ab)
+            normalize_neg_zero(Ab, rows=(r,) if clean else None)
+            clean = True
+            if wants_steps(steps):
+                log_row_op(steps, f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{row+1}", Ab, rows=(r,))
+                yield from flush_steps(steps)
 
         pivots.append((row, col))
         row += 1
@@ -169,8 +289,13 @@ def backward_to_rref(Ab: Matrix, steps: List[Dict[str, Any]], pivots: List[Tuple
     A partir de la forma superior, normaliza pivotes a 1 y elimina arriba de cada pivote.
     Deja Ab en RREF.
     """
+    exhaust(iter_backward_to_rref(Ab, steps, pivots))
+
+def iter_backward_to_rref(Ab: Matrix, steps: List[Dict[str, Any]], pivots: List[Tuple[int, int]]) -> StepEvents:
+    """Igual que backward_to_rref, pero emite cada paso en cuanto se registra."""
     m, n1 = shape(Ab)
     n = n1 - 1
+    clean = False  # hasta la primera limpieza completa de Ab
 
     for (r, c) in reversed(pivots):
         pv = Ab[r][c]
@@ -180,8 +305,11 @@ def backward_to_rref(Ab: Matrix, steps: List[Dict[str, Any]], pivots: List[Tuple
         if not isclose(pv, 1.0):
             for j in range(c, n + 1):
                 Ab[r][j] /= pv
-            normalize_neg_zero(Ab)
-            log_row_op(steps, f"R{r+1} ← R{r+1} / {format_number(pv)}", Ab)
+            normalize_neg_zero(Ab, rows=(r,) if clean else None)
+            clean = True
+            if wants_steps(steps):
+                log_row_op(steps, f"R{r+1} ← R{r+1} / {format_number(pv)}", Ab, rows=(r,))
+                yield from flush_steps(steps)
 
         # Eliminar arriba del pivote
         for rr in range(0, r):
@@ -190,8 +318,11 @@ def backward_to_rref(Ab: Matrix, steps: List[Dict[str, Any]], pivots: List[Tuple
             factor = Ab[rr][c]
             for j in range(c, n + 1):
                 Ab[rr][j] -= factor * Ab[r][j]
-            normalize_neg_zero(Ab)
-            log_row_op(steps, f"R{rr+1} ← R{rr+1} - ({format_number(factor)})·R{r+1}", Ab)
+            normalize_neg_zero(Ab, rows=(rr,) if clean else None)
+            clean = True
+            if wants_steps(steps):
+                log_row_op(steps, f"R{rr+1} ← R{rr+1} - ({format_number(factor)})·R{r+1}", Ab, rows=(rr,))
+                yield from flush_steps(steps)
 
 def analyze_augmented(Ab: Matrix, tol: float = TOL) -> Dict[str, Any]:
     m, n1 = shape(Ab)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ...utils.algebraic_support import (
+    Matrix, TOL, isclose, shape, format_number,
+    log_pivot, log_swap_rows, log_row_op, wants_steps, flush_steps, exhaust, StepEvents
+)
+from ...utils.lu_cache import get_lu
+from ...utils.dense_matrix import DenseMatrix
+
+# -------------------------------
+# Motor NumPy (float64) para Gauss y Gauss-Jordan
+# -------------------------------
+
+# Con engine="auto" se usa NumPy cuando filas o columnas de A alcanzan este tamaño
+NUMPY_AUTO_THRESHOLD = 60
+
+ENGINES = ("auto", "python", "numpy", "exact")
+
+
+def resolve_engine(opt: Dict[str, Any], Ab: Matrix) -> str:
+    """
+    Devuelve "python", "numpy" o "exact" según options.engine y el tamaño de Ab.
+    options.keep_fractions=True equivale a engine="exact" (Bareiss, ver bareiss.py).
+    """
+    engine = opt.get("engine", "auto")
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido: {engine}")
+    if engine == "auto" and opt.get("keep_fractions"):
+        return "exact"
+    if engine == "auto":
+        m, n1 = shape(Ab)
+        return "numpy" if max(m, n1 - 1) >= NUMPY_AUTO_THRESHOLD else "python"
+    return engine
+
+
+def to_array(Ab: Matrix) -> np.ndarray:
+    return np.array(Ab, dtype=np.float64)
+
+
+def cached_upper_np(Ab: Matrix, rhs: int = 1) -> Optional[Tuple[np.ndarray, List[Tuple[int, int]]]]:
+    """
+    [U | L⁻¹·P·B] a partir de la factorización LU en caché (ver utils/lu_cache.py):
+    A no se vuelve a eliminar, solo las columnas de términos independientes.
+    Vale para cualquier A (rectangular o singular): la eliminación hacia adelante solo
+    recorre las columnas de A, así que U y los pivotes son los de PA = LU.
+    """
+    M = to_array(Ab)
+    if M.ndim != 2 or M.shape[0] == 0:
+        return None
+    n = M.shape[1] - rhs
+    lu = get_lu(M[:, :n])
+    return np.hstack([lu.upper(), lu.forward(M[:, n:])]), list(lu.pivots)
+
+
+def select_pivot_row_np(M: DenseMatrix, start_row: int, col: int, pivoting: str = "partial") -> Optional[int]:
+    column = np.abs(M.col(col)[start_row:])
+    if column.size == 0:
+        return None
+    if pivoting == "partial":
+        # argmax devuelve el primer máximo: mismo desempate que select_pivot_row
+        k = int(np.argmax(column))
+        return None if column[k] <= TOL else start_row + k
+    nz = np.flatnonzero(column > TOL)
+    return None if nz.size == 0 else start_row + int(nz[0])
+
+
+def _eliminate_rows(M: DenseMatrix, steps: List[Dict[str, Any]], pivot_row: int, col: int,
+                    rows: List[int], factors: List[float], clean: bool) -> StepEvents:
+    """
+    Aplica R_r ← R_r - factor·R_pivot para cada fila de `rows` en un solo bloque y
+    registra un paso por fila, idéntico al que produciría el bucle en Python.
+    Generador: emite los pasos y devuelve si la matriz ya quedó libre de -0.0 / residuos.
+    """
+    if not rows:
+        return clean
+    detail = wants_steps(steps)
+
+    if not clean:
+        # La primera operación se aplica sola y luego se limpia la matriz completa,
+        # igual que el camino Python (normalize_neg_zero tras cada operación).
+        r, factor = rows[0], factors[0]
+        M.axpy_row(r, factor, pivot_row, col)
+        M.snap()
+        if detail:
+            log_row_op(steps, f"R{r+1} ← R{r+1} - ({format_number(factor)})·R{pivot_row+1}", M, rows=(r,))
+            yield from flush_steps(steps)
+        rows, factors = rows[1:], factors[1:]
+        clean = True
+        if not rows:
+            return clean
+
+    before = M.to_rows() if detail else None
+    phys = M.perm[rows]
+    M.data[phys, col:] -= np.outer(factors, M.row(pivot_row)[col:])
+    M.snap(rows)
+    if not detail:
+        return clean
+
+    # Reconstruye las instantáneas intermedias fila a fila (sin recalcular)
+    after = M.data[phys].tolist()
+    for k, r in enumerate(rows):
+        before[r] = after[k]
+        log_row_op(steps, f"R{r+1} ← R{r+1} - ({format_number(factors[k])})·R{pivot_row+1}", before, rows=(r,))
+        yield from flush_steps(steps)
+    return clean
+
+
+def forward_elimination_np(M: DenseMatrix, steps: List[Dict[str, Any]], pivoting: str = "partial",
+                           rhs: int = 1) -> List[Tuple[int, int]]:
+    """
+    Versión NumPy de forward_elimination / forward_elimination_to_U.
+    Modifica M (DenseMatrix float64) en sitio y devuelve la lista de pivotes (fila, col).
+    """
+    return exhaust(iter_forward_elimination_np(M, steps, pivoting, rhs))
+
+
+def iter_forward_elimination_np(M: DenseMatrix, steps: List[Dict[str, Any]], pivoting: str = "partial",
+                                rhs: int = 1) -> StepEvents:
+    """Igual que forward_elimination_np, pero emite cada paso en cuanto se registra."""
+    m, n1 = M.shape
+    n = n1 - rhs
+    row = 0
+    pivots: List[Tuple[int, int]] = []
+    clean = False
+
+    for col in range(n):
+        if row >= m:
+            break
+
+        pivot_row = select_pivot_row_np(M, row, col, pivoting)
+        if pivot_row is None:
+            continue
+
+        if pivot_row != row:
+            M.swap_rows(row, pivot_row)  # solo la permutación: las filas no se copian
+            if wants_steps(steps):
+                log_swap_rows(steps, row, pivot_row, M)
+
+        pivot_val = M.get(row, col)
+        log_pivot(steps, row, col, pivot_val)
+        yield from flush_steps(steps)
+
+        column = M.col(col)
+        below = row + 1 + np.flatnonzero(np.abs(column[row + 1:]) > TOL)
+        rows = below.tolist()
+        factors = (column[below] / pivot_val).tolist()
+        clean = yield from _eliminate_rows(M, steps, row, col, rows, factors, clean)
+
+        pivots.append((row, col))
+        row += 1
+
+    return pivots
+
+
+def backward_to_rref_np(M: DenseMatrix, steps: List[Dict[str, Any]], pivots: List[Tuple[int, int]]) -> None:
+    """Versión NumPy de backward_to_rref: normaliza pivotes y elimina por encima."""
+    exhaust(iter_backward_to_rref_np(M, steps, pivots))
+
+
+def iter_backward_to_rref_np(M: DenseMatrix, steps: List[Dict[str, Any]], pivots: List[Tuple[int, int]]) -> StepEvents:
+    """Igual que backward_to_rref_np, pero emite cada paso en cuanto se registra."""
+    clean = False
+
+    for (r, c) in reversed(pivots):
+        pv = M.get(r, c)
+        if isclose(pv, 0.0):
+            continue
+        if not isclose(pv, 1.0):
+            M.scale_row(r, pv, c)
+            if clean:
+                M.snap((r,))
+            else:
+                M.snap()
+                clean = True
+            if wants_steps(steps):
+                log_row_op(steps, f"R{r+1} ← R{r+1} / {format_number(pv)}", M, rows=(r,))
+                yield from flush_steps(steps)
+
+        column = M.col(c)
+        above = np.flatnonzero(np.abs(column[:r]) > TOL)
+        clean = yield from _eliminate_rows(M, steps, r, c, above.tolist(), column[above].tolist(), clean)
+
+
+def u_to_rref_np(M: np.ndarray, pivots: List[Tuple[int, int]], tol: float = TOL) -> None:
+    """Equivalente NumPy de u_to_rref_inplace (sin registro de pasos)."""
+    for (r, c) in reversed(sorted(pivots, key=lambda rc: rc[0])):
+        pv = float(M[r, c])
+        if not isclose(pv, 0.0, tol) and not isclose(pv, 1.0, tol):
+            M[r, c:] /= pv
+        above = np.flatnonzero(np.abs(M[:r, c]) > tol)
+        if above.size:
+            M[above, c:] -= np.outer(M[above, c], M[r, c:])
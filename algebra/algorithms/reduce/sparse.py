@@ -0,0 +1,362 @@
+from __future__ import annotations
+from heapq import heapify, heappop, heappush
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ...utils.algebraic_support import (
+    Number, TOL, isclose, format_number, log_pivot, new_step_log, flush_steps, exhaust, StepEvents
+)
+from ...utils.sparse_support import SparseMatrix, SparseRow, sparse_from_spec, sparse_to_coo
+from ..parametric import parametric_from_sparse_rref
+
+# -------------------------------
+# Eliminación dispersa con ordenamiento de Markowitz
+# -------------------------------
+
+# Un pivote es aceptable si |a| >= umbral · max|columna| (pivoteo por umbral)
+MARKOWITZ_THRESHOLD = 0.1
+# Columnas de menor cantidad de no nulos examinadas en cada paso
+MARKOWITZ_SEARCH = 4
+
+# Si la submatriz activa supera esta densidad se termina con eliminación densa (NumPy)
+DENSE_SWITCH = 0.25
+
+ORDERINGS = ("markowitz", "natural")
+
+Pivot = Tuple[int, int, float]  # (fila, col, valor del pivote al eliminar)
+
+
+class _Structure:
+    """Conteos por fila y por columna de la submatriz activa (solo columnas < n)."""
+
+    def __init__(self, rows: SparseMatrix, n: int):
+        self.n = n
+        self.cols: List[Set[int]] = [set() for _ in range(n)]
+        self.rowcount = [0] * len(rows)
+        for r, row in enumerate(rows):
+            for j in row:
+                if j < n:
+                    self.cols[j].add(r)
+                    self.rowcount[r] += 1
+        self.done = [False] * n
+        self.active_nnz = sum(self.rowcount)
+        self.heap = [(len(s), c) for c, s in enumerate(self.cols) if s]
+        heapify(self.heap)
+
+    def add(self, r: int, j: int) -> None:
+        self.cols[j].add(r)
+        self.rowcount[r] += 1
+        self.active_nnz += 1
+        heappush(self.heap, (len(self.cols[j]), j))
+
+    def discard(self, r: int, j: int) -> None:
+        self.cols[j].discard(r)
+        self.rowcount[r] -= 1
+        self.active_nnz -= 1
+        if not self.done[j]:
+            heappush(self.heap, (len(self.cols[j]), j))
+
+
+def _candidate(rows: SparseMatrix, st: _Structure, c: int,
+               best: Optional[Tuple[float, float, int, int]]) -> Optional[Tuple[float, float, int, int]]:
+    # Menor costo de Markowitz (r_i - 1)(c_j - 1) entre los pivotes que pasan el umbral
+    count = len(st.cols[c])
+    colmax = max(abs(rows[r][c]) for r in st.cols[c])
+    for r in st.cols[c]:
+        a = abs(rows[r][c])
+        if a < MARKOWITZ_THRESHOLD * colmax:
+            continue
+        key = ((st.rowcount[r] - 1) * (count - 1), -a, r, c)
+        if best is None or key < best:
+            best = key
+    return best
+
+
+def _select_markowitz(rows: SparseMatrix, st: _Structure) -> Optional[Tuple[int, int]]:
+    best = None
+    seen: List[Tuple[int, int]] = []
+    while st.heap and len(seen) < MARKOWITZ_SEARCH:
+        count, c = heappop(st.heap)
+        if st.done[c] or count != len(st.cols[c]) or count == 0 or any(c == s for _, s in seen):
+            continue  # entrada obsoleta del montículo
+        seen.append((count, c))
+        best = _candidate(rows, st, c, best)
+    for item in seen:
+        heappush(st.heap, item)
+    return None if best is None else (best[2], best[3])
+
+
+def _select_natural(rows: SparseMatrix, st: _Structure, start: int) -> Optional[Tuple[int, int]]:
+    # Columnas de izquierda a derecha; dentro de la columna, fila de menor costo
+    for c in range(start, st.n):
+        if st.cols[c]:
+            best = _candidate(rows, st, c, None)
+            return best[2], best[3]
+    return None
+
+
+def sparse_forward(rows: SparseMatrix, n: int, ordering: str = "markowitz", tol: float = TOL) -> List[Pivot]:
+    """
+    Eliminación hacia adelante en sitio sobre filas dispersas.
+    Las columnas >= n (términos independientes) se actualizan pero no influyen en el orden.
+    Devuelve los pivotes en orden de eliminación; las filas pivote conservan su parte de U.
+    """
+    st = _Structure(rows, n)
+    pivots: List[Pivot] = []
+    next_col = 0
+    m = len(rows)
+
+    while True:
+        left = (m - len(pivots)) * (n - len(pivots))
+        if left and st.active_nnz > DENSE_SWITCH * left:
+            pivots.extend(_finish_dense(rows, st, {p for p, _, _ in pivots}, tol))
+            break
+        if ordering == "markowitz":
+            sel = _select_markowitz(rows, st)
+        else:
+            sel = _select_natural(rows, st, next_col)
+        if sel is None:
+            break
+        p, c = sel
+        prow = rows[p]
+        pv = prow[c]
+        st.done[c] = True
+        next_col = c + 1
+
+        # La fila pivote sale de la submatriz activa
+        for j in prow:
+            if j < n:
+                st.discard(p, j)
+
+        for r in list(st.cols[c]):
+            row = rows[r]
+            f = row[c] / pv
+            del row[c]
+            st.discard(r, c)
+            for j, v in prow.items():
+                if j == c:
+                    continue
+                new = row.get(j, 0.0) - f * v
+                if abs(new) <= tol:
+                    if j in row:
+                        del row[j]
+                        if j < n:
+                            st.discard(r, j)
+                else:
+                    if j not in row and j < n:
+                        row[j] = new
+                        st.add(r, j)  # relleno (fill-in)
+                    else:
+                        row[j] = new
+
+        pivots.append((p, c, pv))
+
+    return pivots
+
+
+def _finish_dense(rows: SparseMatrix, st: _Structure, done_rows: Set[int], tol: float = TOL) -> List[Pivot]:
+    """
+    Termina la eliminación sobre la submatriz activa como bloque denso (pivoteo parcial,
+    columnas en orden creciente): con tanto relleno, NumPy es más rápido que los dict.
+    Las filas se reescriben dispersas al final.
+    """
+    n = st.n
+    act_rows = [r for r in range(len(rows)) if r not in done_rows]
+    act_cols = [c for c in range(n) if not st.done[c]]
+    rhs_cols = sorted({j for r in act_rows for j in rows[r] if j >= n})
+    all_cols = act_cols + rhs_cols
+    pos = {c: k for k, c in enumerate(all_cols)}
+    M = np.zeros((len(act_rows), len(all_cols)))
+    for i, r in enumerate(act_rows):
+        for j, v in rows[r].items():
+            M[i, pos[j]] = v
+
+    pivots: List[Pivot] = []
+    row = 0
+    for k, c in enumerate(act_cols):
+        if row >= len(act_rows):
+            break
+        column = np.abs(M[row:, k])
+        sel = int(np.argmax(column))
+        if column[sel] <= tol:
+            continue
+        sel += row
+        if sel != row:
+            M[[row, sel]] = M[[sel, row]]
+            act_rows[row], act_rows[sel] = act_rows[sel], act_rows[row]
+        pv = float(M[row, k])
+        factors = M[row + 1:, k] / pv
+        M[row + 1:, k:] -= np.outer(factors, M[row, k:])
+        M[row + 1:, k] = 0.0
+        block = M[row + 1:, k + 1:]
+        block[np.abs(block) <= tol] = 0.0
+        pivots.append((act_rows[row], c, pv))
+        row += 1
+
+    for i, r in enumerate(act_rows):
+        nz = np.flatnonzero(M[i])
+        rows[r] = {all_cols[k]: float(M[i, k]) for k in nz}
+    return pivots
+
+
+def sparse_backward_to_rref(rows: SparseMatrix, n: int, pivots: List[Pivot], tol: float = TOL) -> None:
+    """Normaliza cada fila pivote y elimina su columna en las demás filas pivote (RREF dispersa)."""
+    colrows: Dict[int, Set[int]] = {}
+    for p, _, _ in pivots:
+        for j in rows[p]:
+            if j < n:
+                colrows.setdefault(j, set()).add(p)
+
+    for p, c, _ in reversed(pivots):
+        prow = rows[p]
+        pv = prow[c]
+        if not isclose(pv, 1.0, tol):
+            for j in prow:
+                prow[j] /= pv
+        prow[c] = 1.0
+
+        for r in list(colrows.get(c, ())):
+            if r == p:
+                continue
+            row = rows[r]
+            f = row.pop(c)
+            colrows[c].discard(r)
+            for j, v in prow.items():
+                if j == c:
+                    continue
+                new = row.get(j, 0.0) - f * v
+                if abs(new) <= tol:
+                    if row.pop(j, None) is not None and j < n:
+                        colrows[j].discard(r)
+                else:
+                    row[j] = new
+                    if j < n:
+                        colrows.setdefault(j, set()).add(r)
+
+
+# -------------------------------
+# API de reducción dispersa (Gauss / Gauss-Jordan)
+# -------------------------------
+
+def sparse_reduce_api(*, A_sparse: Dict[str, Any], b: List[Number], method: str = "gauss",
+                      options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return exhaust(iter_sparse_reduce(A_sparse=A_sparse, b=b, method=method, options=options))
+
+
+def sparse_reduce_stream(*, A_sparse: Dict[str, Any], b: List[Number], method: str = "gauss",
+                         options: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Variante en streaming de sparse_reduce_api (mismos eventos que gauss_stream)."""
+    result = yield from iter_sparse_reduce(A_sparse=A_sparse, b=b, method=method, options=options, streaming=True)
+    yield "summary", {k: v for k, v in result.items() if k != "steps"}
+
+
+def iter_sparse_reduce(*, A_sparse: Dict[str, Any], b: List[Number], method: str = "gauss",
+                       options: Optional[Dict[str, Any]] = None, streaming: bool = False) -> StepEvents:
+    """
+    Resuelve A·x = b con A dispersa (COO/CSR). Memoria y tiempo escalan con los no nulos.
+    Los pasos solo registran los pivotes: las instantáneas densas serían de tamaño m·n.
+    """
+    opt = options or {}
+    ordering = opt.get("ordering", "markowitz")  # "markowitz" | "natural"
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Ordenamiento desconocido: {ordering}")
+
+    A_rows, (m, n) = sparse_from_spec(A_sparse)
+    if b is None or len(b) != m:
+        raise ValueError(f"Dimensiones inconsistentes: A es {m}x{n} y b debe tener longitud {m}.")
+    for i, v in enumerate(b):
+        if not isclose(v, 0.0):
+            A_rows[i][n] = float(v)
+
+    rows = [dict(row) for row in A_rows]
+    pivots = sparse_forward(rows, n, ordering)
+    if ordering == "markowitz" and len(pivots) < n:
+        # Con rango incompleto las variables básicas dependen del orden de columnas:
+        # se repite en orden natural para que coincidan con la RREF densa
+        ordering = "natural"
+        rows = A_rows
+        pivots = sparse_forward(rows, n, ordering)
+
+    steps = new_step_log(opt, streaming)  # solo pivotes, ver docstring
+    for p, c, pv in pivots:
+        log_pivot(steps, p, c, pv)
+        yield from flush_steps(steps)
+
+    U = [rows[p].copy() for p, _, _ in pivots] if method == "gauss" else None
+    sparse_backward_to_rref(rows, n, pivots)
+    summary = sparse_summary(rows, n, pivots, b, U=U)
+    summary["reduced_form"]["ordering"] = ordering
+
+    return {
+        "input": {"method": method, "A_sparse": A_sparse, "b": b, "engine": "sparse"},
+        "steps": steps,
+        "summary": summary,
+    }
+
+
+def sparse_summary(rows: SparseMatrix, n: int, pivots: List[Pivot], original_b: List[Number],
+                   U: Optional[SparseMatrix] = None, tol: float = TOL) -> Dict[str, Any]:
+    """
+    Resumen con la misma estructura que gauss_summary / gauss_jordan_summary a partir de la
+    RREF dispersa. Las formas reducidas se devuelven en COO (valores como fracción).
+    """
+    m = len(rows)
+    pivot_rows: Dict[int, SparseRow] = {c: rows[p] for p, c, _ in pivots}
+    pivot_set = {p for p, _, _ in pivots}
+    others = [r for r in range(m) if r not in pivot_set]
+    inconsistent = [r for r in others if not isclose(rows[r].get(n, 0.0), 0.0, tol)]
+
+    rankA = len(pivots)
+    rankAb = rankA + (1 if inconsistent else 0)
+    basic = sorted(pivot_rows)
+    free = [c for c in range(n) if c not in pivot_rows]
+    status = "sin_solucion" if inconsistent else ("unica" if rankA == n else "infinitas")
+
+    solution = None
+    if status != "sin_solucion":
+        solution = [0.0] * n
+        for c, row in pivot_rows.items():
+            solution[c] = row.get(n, 0.0)
+
+    if status != "sin_solucion" or U is None:
+        parametric = parametric_from_sparse_rref(pivot_rows, n, free, tol=tol)
+    else:
+        parametric = {"params": [], "vars": [], "pretty": [], "free_basis": None}
+    free_basis = parametric.pop("free_basis")
+    if status == "sin_solucion":
+        free_basis = None  # sin solución no hay conjunto que parametrizar
+
+    # RREF: filas pivote por columna creciente y luego las filas restantes
+    rref = [pivot_rows[c] for c in basic] + [rows[r] for r in others]
+    formatted_rref = sparse_to_coo(rref, (m, n + 1), format_number)
+    if U is not None:
+        reduced_form = {
+            "U": sparse_to_coo(U + [rows[r] for r in others], (m, n + 1), format_number),
+            "RREF": formatted_rref if status != "sin_solucion" else None,
+            "pivot_order": [{"row": p, "col": c} for p, c, _ in pivots],
+            "note": "Forma escalonada dispersa: la fila k de U es el k-ésimo pivote (ver pivot_order)",
+        }
+    else:
+        reduced_form = {"RREF": formatted_rref, "note": ""}
+
+    return {
+        "ranks": {"rankA": rankA, "rankAb": rankAb},
+        "solution_type": status,
+        "homogeneous": all(isclose(x, 0.0) for x in (original_b or [])),
+        "dependence": "independientes" if rankA == n else "dependientes",
+        "trivial_solution": bool(solution) and all(isclose(v, 0.0) for v in solution),
+        "variables": {"basic": basic, "free": free},
+        "parametric_form": {
+            "exists": status == "infinitas",
+            "particular": [float(x) for x in solution] if solution is not None else None,
+            "particular_pretty": [format_number(x) for x in solution] if solution is not None else None,
+            "free_basis": free_basis,
+            "free_basis_pretty": [
+                {**v, "data": [format_number(x) for x in v["data"]]} for v in free_basis
+            ] if free_basis is not None else None,
+            "pretty": parametric["pretty"],
+            "symbolic": parametric,
+        },
+        "reduced_form": reduced_form,
+    }
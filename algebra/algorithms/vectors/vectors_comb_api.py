@@ -17,6 +17,7 @@ def linear_combination_api(
     options: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     # 1) Gauss-Jordan (obtendremos steps y summary con forma paramétrica)
+    #    Con options.steps = "none", U sale de la caché LU: misma A con otro b no se vuelve a eliminar
     gj = gauss_jordan_api(A=A, b=b, options=options or {})
     summary = gj["summary"]
     sol_type = summary["solution_type"]
@@ -36,7 +37,9 @@ def linear_combination_api(
 
     return {
         "input": {"A": A, "b": b, "A_pretty": [[format_number(x) for x in row] for row in A], "b_pretty": [format_number(x) for x in b]},
-        "gauss_jordan": {"steps": gj["steps"], "summary": summary},
+        # options.encoding="dict": sin la tabla las instantáneas de los pasos no se pueden decodificar
+        "gauss_jordan": {"steps": gj["steps"], "summary": summary,
+                         **({"value_table": gj["value_table"]} if "value_table" in gj else {})},
         "check": {
             "Ax": ax,
             "Ax_pretty": [format_number(x) for x in ax] if ax else None,
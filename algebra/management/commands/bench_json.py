@@ -0,0 +1,80 @@
+import io
+import json
+import random
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from algebra.renderers import FastJSONParser, FastJSONRenderer, orjson
+from algebra.algorithms.reduce.gauss_jordan import gauss_jordan_api
+from algebra.algorithms.matrix.matrix_api import matrix_ops_api
+from algebra.algorithms.numericMethods.errorMethods.error_accumulation import accumulate_error_iterations
+
+
+def _recorded_payloads(n: int) -> Dict[str, Any]:
+    """Respuestas típicas de la API (misma semilla en cada corrida)."""
+    rng = random.Random(0)
+    A = [[float(rng.randint(-9, 9)) for _ in range(n)] for _ in range(n)]
+    b = [float(rng.randint(-9, 9)) for _ in range(n)]
+    return {
+        f"gauss_jordan_{n}x{n}_full": gauss_jordan_api(A=A, b=b),
+        f"gauss_jordan_{n}x{n}_delta": gauss_jordan_api(A=A, b=b, options={"steps_format": "delta"}),
+        f"gauss_jordan_{n}x{n}_dict": gauss_jordan_api(A=A, b=b, options={"encoding": "dict"}),
+        f"inverse_{n}x{n}": matrix_ops_api(operation="inverse", A=A),
+        "error_accumulation_decimal": accumulate_error_iterations(
+            initial_amount=Decimal("1000.00"), iterations=200, mode="trunc", rate=Decimal("0.0625")),
+    }
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+class Command(BaseCommand):
+    help = ("Compara JSONRenderer/JSONParser de DRF con FastJSONRenderer/FastJSONParser (orjson) "
+            "sobre respuestas grabadas: archivos .json pasados como argumento o, si no hay, "
+            "respuestas generadas por la propia API.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("payloads", nargs="*", help="Archivos JSON con respuestas grabadas.")
+        parser.add_argument("--size", type=int, default=40, help="n de las matrices generadas (por defecto 40).")
+        parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por medición (se toma la mejor).")
+
+    def handle(self, *args, **opts):
+        if orjson is None:
+            raise CommandError("orjson no está instalado: FastJSONRenderer usaría el mismo json de DRF.")
+
+        payloads: Dict[str, Any] = {}
+        for path in opts["payloads"]:
+            with open(path, encoding="utf-8") as fh:
+                payloads[path] = json.load(fh)
+        if not payloads:
+            payloads = _recorded_payloads(opts["size"])
+
+        pairs: List[Tuple[str, Any, Any]] = [
+            ("stock", JSONRenderer(), JSONParser()),
+            ("fast", FastJSONRenderer(), FastJSONParser()),
+        ]
+        repeat = max(1, opts["repeat"])
+        self.stdout.write(f"{'payload':<34}{'KB':>10}{'render stock':>14}{'render fast':>13}"
+                          f"{'parse stock':>13}{'parse fast':>12}")
+        for name, data in payloads.items():
+            timings: List[float] = []
+            body = b""
+            for _, renderer, _ in pairs:
+                body = renderer.render(data)
+                timings.append(_best_of(lambda: renderer.render(data), repeat))
+            for _, _, parser in pairs:
+                timings.append(_best_of(lambda: parser.parse(io.BytesIO(body)), repeat))
+            ms = [f"{t * 1000:.1f} ms" for t in timings]
+            self.stdout.write(f"{name:<34}{len(body) / 1024:>10.0f}{ms[0]:>14}{ms[1]:>13}{ms[2]:>13}{ms[3]:>12}")
+
@@ -0,0 +1,72 @@
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+
+from algebra.algorithms.matrix.matrix_operations import inverse
+from algebra.algorithms.reduce import gauss, gauss_jordan
+from algebra.utils.algebraic_support import TOL, normalize_neg_zero
+from algebra.utils.dense_matrix import DenseMatrix
+
+_snap = DenseMatrix.snap
+
+
+@contextmanager
+def _full_normalize() -> Iterator[None]:
+    """Limpieza de -0.0 en toda la matriz tras cada operación (comportamiento anterior a rows=)."""
+    with mock.patch.object(gauss, "normalize_neg_zero", lambda M, tol=TOL, rows=None: normalize_neg_zero(M, tol)), \
+         mock.patch.object(gauss_jordan, "normalize_neg_zero", lambda M, tol=TOL, rows=None: normalize_neg_zero(M, tol)), \
+         mock.patch.object(DenseMatrix, "snap", lambda self, rows=None, tol=TOL: _snap(self, None, tol)):
+        yield
+
+
+def _kernels(A: List[List[float]], b: List[float]) -> Dict[str, Callable[[], Any]]:
+    # Motor Python y pasos "summary": sin caché LU ni formato de instantáneas
+    opt = {"engine": "python", "steps": "summary"}
+    return {
+        "inverse": lambda: inverse(A),
+        "gauss": lambda: gauss.gauss_api(A=A, b=b, options=opt),
+        "gauss_jordan": lambda: gauss_jordan.gauss_jordan_api(A=A, b=b, options=opt),
+    }
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+class Command(BaseCommand):
+    help = ("Mide inversa, Gauss y Gauss-Jordan (motor Python) sobre matrices densas "
+            "aleatorias, limpiando -0.0 solo en las filas modificadas (actual) o en toda la matriz "
+            "tras cada operación (anterior).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("sizes", nargs="*", type=int, default=[50, 100], help="n de las matrices (por defecto 50 100).")
+        parser.add_argument("--repeat", type=int, default=1, help="Repeticiones por medición (se toma la mejor).")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--only", choices=["inverse", "gauss", "gauss_jordan"], action="append",
+                            help="Limitar a estos kernels (repetible).")
+
+    def handle(self, *args, **opts):
+        repeat = max(1, opts["repeat"])
+        self.stdout.write(f"{'kernel':<16}{'n':>6}{'filas modificadas':>20}{'matriz completa':>18}{'speedup':>10}")
+        for n in opts["sizes"]:
+            rng = random.Random(opts["seed"])
+            A = [[rng.uniform(-10, 10) for _ in range(n)] for _ in range(n)]
+            b = [rng.uniform(-10, 10) for _ in range(n)]
+            for name, fn in _kernels(A, b).items():
+                if opts["only"] and name not in opts["only"]:
+                    continue
+                fn()  # la primera corrida llena la caché de formato de fracciones
+                after = _best_of(fn, repeat)
+                with _full_normalize():
+                    before = _best_of(fn, repeat)
+                self.stdout.write(f"{name:<16}{n:>6}{after * 1000:>17.1f} ms{before * 1000:>15.1f} ms"
+                                  f"{before / after:>9.1f}x")
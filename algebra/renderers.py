@@ -0,0 +1,218 @@
+import abc
+import io
+import json
+import logging
+from math import fsum, isfinite
+from typing import Any, Dict, Iterable, Tuple
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+import numpy as np
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # dependencia opcional: sin orjson se usan json + JSONEncoder de DRF
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # dependencia opcional: sin msgpack no se ofrece application/msgpack
+    msgpack = None
+
+logger = logging.getLogger("algebra")
+
+# -------------------------------
+# JSON rápido (orjson) para respuestas con muchas matrices
+# settings.ALGEBRA_JSON_BACKEND: "fast" (orjson si está instalado) | "stock" (json de DRF);
+# el valor se valida al cargar settings.py
+# -------------------------------
+
+# Tipos que orjson no conoce (Decimal, QuerySet, ...) se convierten igual que en DRF
+_default = JSONEncoder().default
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+
+def json_backend() -> str:
+    backend = getattr(settings, "ALGEBRA_JSON_BACKEND", "fast")
+    return "fast" if backend == "fast" and orjson is not None else "stock"
+
+
+def _escape_separators(ret: bytes) -> bytes:
+    # U+2028 / U+2029 escapados como en JSONRenderer (JSON subconjunto estricto de JavaScript)
+    if b"\xe2\x80" not in ret:
+        return ret
+    return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+_NO_FLOATS = {str, int, bool, type(None)}
+
+
+def check_finite(data: Any) -> None:
+    """
+    ValueError si hay NaN / ±Infinity en `data`, como json.dumps(allow_nan=False) en
+    JSONRenderer con STRICT_JSON (orjson los escribiría como null sin avisar).
+    Las listas se comprueban en bloque: solo texto / enteros / None se saltan y las de solo
+    float se suman con fsum (suma finita ⇒ todos finitos).
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not isfinite(node):
+                raise ValueError("Out of range float values are not JSON compliant")
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            kinds = set(map(type, node))
+            if kinds <= _NO_FLOATS:
+                continue
+            if kinds == {float}:
+                try:
+                    if isfinite(fsum(node)):
+                        continue
+                except (ValueError, OverflowError):
+                    pass  # inf - inf o desborde intermedio: se revisa celda a celda
+            stack.extend(node)
+        elif isinstance(node, np.ndarray) and node.dtype.kind in "fc":
+            if not np.isfinite(node).all():
+                raise ValueError("Out of range float values are not JSON compliant")
+
+
+def fast_dumps(data: Any) -> bytes:
+    """orjson.dumps con la conversión de DRF para los tipos no nativos (Decimal → str)."""
+    check_finite(data)
+    return _escape_separators(orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS))
+
+
+def _dumps(data: Any) -> bytes:
+    if json_backend() == "fast" and api_settings.STRICT_JSON:
+        return fast_dumps(data)
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"),
+                      allow_nan=not api_settings.STRICT_JSON).encode("utf-8")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer sobre orjson: misma salida compacta en UTF-8 y mismos tipos (Decimal como
+    en DRF, listas anidadas de float, ndarray). NaN / Infinity se rechazan con ValueError como
+    en JSONRenderer (check_finite). Con `indent` (p. ej. "application/json; indent=4"), con
+    STRICT_JSON = False o sin orjson instalado delega en JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None or not self.strict \
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return fast_dumps(data)
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser sobre orjson (UTF-8, estricto). Si orjson rechaza el cuerpo (otra codificación,
+    NaN con STRICT_JSON = False, JSON inválido) se reintenta con JSONParser, que acepta lo
+    mismo que antes o devuelve su ParseError habitual.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        raw = stream.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(raw), media_type, parser_context)
+
+
+class StreamingRenderer(abc.ABC, BaseRenderer):
+    """
+    Base de los renderers de streaming (NDJSON / SSE).
+    render() sirve para respuestas normales (p. ej. errores 400) y
+    streaming_response() para emitir eventos (evento, datos) a medida que se generan.
+    Las subclases implementan render_event (sin él no se pueden instanciar).
+    """
+    charset = "utf-8"
+
+    @abc.abstractmethod
+    def render_event(self, event: str, data: Any) -> bytes:
+        """Bytes de un evento del stream."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        event = "error" if isinstance(data, dict) and "error" in data else "result"
+        return self.render_event(event, data)
+
+    def _encode(self, events: Iterable[Tuple[str, Dict[str, Any]]], error_code: str):
+        # El status ya se envió: cualquier error viaja como último evento del stream
+        try:
+            for event, data in events:
+                yield self.render_event(event, data)
+        except ValueError as e:
+            yield self.render_event("error", {"error": {"code": error_code, "message": str(e)}})
+        except Exception:
+            logger.exception("Error inesperado durante el streaming (%s)", error_code)
+            yield self.render_event("error", {"error": {"code": error_code, "message": "Error interno del servidor."}})
+
+    def streaming_response(self, events: Iterable[Tuple[str, Dict[str, Any]]],
+                           error_code: str = "STREAM_ERROR") -> StreamingHttpResponse:
+        response = StreamingHttpResponse(self._encode(events, error_code),
+                                         content_type=f"{self.media_type}; charset={self.charset}")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # evita que nginx acumule el stream
+        return response
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """Un objeto JSON por línea: {"event": ..., "data": ...}."""
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render_event(self, event: str, data: Any) -> bytes:
+        return _dumps({"event": event, "data": data}) + b"\n"
+
+
+class EventStreamRenderer(StreamingRenderer):
+    """Server-Sent Events: "event: <evento>" + "data: <json>" por mensaje."""
+    media_type = "text/event-stream"
+    format = "sse"
+
+    def render_event(self, event: str, data: Any) -> bytes:
+        return b"event: " + event.encode(self.charset) + b"\ndata: " + _dumps(data) + b"\n\n"
+
+
+# -------------------------------
+# MessagePack (application/msgpack): las matrices empaquetadas viajan como bytes crudos
+# -------------------------------
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
+
+
+# Se agregan a las vistas de matrices solo si msgpack está instalado
+BINARY_RENDERERS = [MessagePackRenderer] if msgpack is not None else []
+BINARY_PARSERS = [MessagePackParser] if msgpack is not None else []
@@ -1,25 +1,139 @@
 from rest_framework import serializers
 from decimal import Decimal
+import math
+import numpy as np
 from sympy import lambdify, diff
+from .utils.matrix_transport import is_packed, unpack_matrix
 from .utils.latex_parser import (
     latex_to_sympy_expr_for_bisection,
     latex_to_sympy_expr,
     LatexParsingError,
 )
+
+
+class MatrixField(serializers.ListField):
+    """
+    Matriz densa (lista de filas de float) validada en una sola pasada vectorizada:
+    si todas las celdas son números y las filas tienen el mismo largo, NumPy convierte y
+    comprueba la matriz completa; si no, se usa la validación celda a celda de
+    ListField(child=ListField(child=FloatField())), con sus mismos mensajes de error.
+    Los valores no finitos (NaN, ±Infinity) se rechazan con el mensaje de FloatField.
+    Devuelve Matrix (list[list[float]]), no el ndarray: los motores Python modifican las
+    filas en sitio, las vistas arman [A | b] con `row + [b[i]]` (con filas ndarray eso
+    sumaría b elemento a elemento) e `input` se devuelve tal cual en la respuesta.
+    M.tolist() es una sola conversión en C. PackedMatrixField sí devuelve el ndarray (vista
+    sin copia de los bytes recibidos) porque matrix_ops_api solo lee A / B por índice.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('child', serializers.ListField(child=serializers.FloatField()))
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        M = self._bulk_array(data)
+        if M is not None:
+            self._check_finite(M)
+            return M.tolist()
+        # Celda a celda: mismos errores (y mismo resultado) que el ListField anidado
+        rows = super().to_internal_value(data)
+        for i, row in enumerate(rows):
+            for j, v in enumerate(row):
+                if not math.isfinite(v):
+                    self._fail_cell(i, j)
+        return rows
+
+    def _bulk_array(self, data):
+        # Solo listas de filas con celdas int / float / bool (lo que FloatField convierte con float())
+        if type(data) is not list or not data or not all(type(row) is list for row in data):
+            return None
+        try:
+            M = np.array(data)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        if M.ndim != 2 or M.dtype.kind not in 'fiub':
+            return None
+        return M.astype(np.float64, copy=False)
+
+    def _fail_cell(self, i: int, j: int):
+        message = serializers.FloatField().error_messages['invalid']
+        raise serializers.ValidationError({i: {j: [message]}}, code='invalid')
+
+    def _check_finite(self, M: np.ndarray) -> None:
+        bad = np.argwhere(~np.isfinite(M))
+        if len(bad):
+            self._fail_cell(int(bad[0][0]), int(bad[0][1]))
+
+
+class SparseMatrixSerializer(serializers.Serializer):
+    """Matriz dispersa: COO (row, col, data) o CSR (indptr, indices, data)."""
+    format = serializers.ChoiceField(choices=['coo', 'csr'], default='coo')
+    shape = serializers.ListField(child=serializers.IntegerField(min_value=1), min_length=2, max_length=2)
+    data = serializers.ListField(child=serializers.FloatField())
+    row = serializers.ListField(child=serializers.IntegerField(min_value=0), required=False)
+    col = serializers.ListField(child=serializers.IntegerField(min_value=0), required=False)
+    indptr = serializers.ListField(child=serializers.IntegerField(min_value=0), required=False)
+    indices = serializers.ListField(child=serializers.IntegerField(min_value=0), required=False)
+
+    def validate(self, data):
+        m, n = data['shape']
+        nz = len(data['data'])
+        if data['format'] == 'coo':
+            row, col = data.get('row'), data.get('col')
+            if row is None or col is None:
+                raise serializers.ValidationError("En formato COO envía 'row', 'col' y 'data'.")
+            if len(row) != nz or len(col) != nz:
+                raise serializers.ValidationError("'row', 'col' y 'data' deben tener la misma longitud.")
+            if any(i >= m for i in row) or any(j >= n for j in col):
+                raise serializers.ValidationError(f"Índices fuera de rango para una matriz {m}x{n}.")
+        else:
+            indptr, indices = data.get('indptr'), data.get('indices')
+            if indptr is None or indices is None:
+                raise serializers.ValidationError("En formato CSR envía 'indptr', 'indices' y 'data'.")
+            if len(indptr) != m + 1 or len(indices) != nz:
+                raise serializers.ValidationError("'indptr' debe tener m+1 entradas e 'indices' la longitud de 'data'.")
+            if any(j >= n for j in indices):
+                raise serializers.ValidationError(f"Índices fuera de rango para una matriz {m}x{n}.")
+        return data
+
+
 class MatrixReduceSerializer(serializers.Serializer):
     method = serializers.ChoiceField(choices=['gauss', 'gauss-jordan'])
-    A = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()), required=False)
+    A = MatrixField(required=False)
+    A_sparse = SparseMatrixSerializer(required=False)
     b = serializers.ListField(child=serializers.FloatField(), required=False)
-    Ab = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()), required=False)
+    B = MatrixField(required=False)
+    Ab = MatrixField(required=False)
     options = serializers.DictField(required=False)
 
     def validate(self, data):
-        A, b, Ab = data.get('A'), data.get('b'), data.get('Ab')
-
+        A, b, B, Ab = data.get('A'), data.get('b'), data.get('B'), data.get('Ab')
+        A_sparse = data.get('A_sparse')
+
+        if A_sparse is not None:
+            if A is not None or Ab is not None or B is not None:
+                raise serializers.ValidationError("Con 'A_sparse' envía solo 'b' (no 'A', 'Ab' ni 'B').")
+            m, n = A_sparse['shape']
+            if b is None or len(b) != m:
+                raise serializers.ValidationError(f"Dimensiones inconsistentes: A_sparse es {m}x{n} y b debe tener longitud {m}.")
+            return data
         if Ab is None and A is None:
             raise serializers.ValidationError("Debes enviar 'Ab' o 'A'.")
         if Ab is not None and A is not None:
             raise serializers.ValidationError("Envía solo 'Ab' o 'A', no ambos.")
+        if b is not None and B is not None:
+            raise serializers.ValidationError("Envía solo 'b' o 'B', no ambos.")
+        if B is not None:
+            if A is None:
+                raise serializers.ValidationError("Si envías 'B', también debes enviar 'A'.")
+            if len(A) == 0:
+                raise serializers.ValidationError("A no puede ser vacía.")
+            if any(len(row) != len(A[0]) for row in A):
+                raise serializers.ValidationError("Todas las filas de A deben tener la misma longitud.")
+            if len(B) != len(A) or len(B[0]) == 0:
+                raise serializers.ValidationError(f"Dimensiones inconsistentes: A es {len(A)}x{len(A[0])} y B tiene {len(B)} filas.")
+            if any(len(row) != len(B[0]) for row in B):
+                raise serializers.ValidationError("Todas las filas de B deben tener la misma longitud.")
+            return data
         if A is not None and b is None:
             raise serializers.ValidationError("Si envías 'A', también debes enviar 'b'.")
         if A is not None and b is not None:
@@ -38,7 +152,7 @@ class MatrixReduceSerializer(serializers.Serializer):
         return data
     
 class VectorCombinationSerializer(serializers.Serializer):
-    A = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()))
+    A = MatrixField()
     b = serializers.ListField(child=serializers.FloatField())
     options = serializers.DictField(required=False)
 
@@ -117,14 +231,35 @@ class VectorOperateSerializer(serializers.Serializer):
         return {**data, "vectors": vecs, "scalars": sc}
 
 
+class PackedMatrixField(MatrixField):
+    """
+    Matriz densa como listas anidadas (MatrixField) o empaquetada
+    {"shape": [m, n], "dtype": "<f8", "data": base64 | bytes}: en ese caso se devuelve
+    un ndarray sobre los mismos bytes, sin FloatField por celda (ver utils/matrix_transport.py).
+    """
+
+    def to_internal_value(self, data):
+        if is_packed(data):
+            try:
+                return unpack_matrix(data)
+            except ValueError as e:
+                raise serializers.ValidationError(str(e))
+        return super().to_internal_value(data)
+
+
 class MatrixOperateSerializer(serializers.Serializer):
-    operation = serializers.ChoiceField(choices=['add', 'sub', 'scalar', 'transpose', 'matmul', 'sum_many', 'sub_many', 'matmul_chain', 'inverse'])
+    operation = serializers.ChoiceField(choices=['add', 'sub', 'scalar', 'transpose', 'matmul', 'sum_many', 'sub_many', 'matmul_chain', 'inverse', 'power', 'polyval'])
 
     # operandos comunes
-    A = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()), required=False)
-    B = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()), required=False)
-    matrices = serializers.ListField(child=serializers.ListField(child=serializers.ListField(child=serializers.FloatField())), required=False)
+    # A, B y cada elemento de matrices: listas anidadas o empaquetadas (float64 en base64 / MessagePack)
+    A = PackedMatrixField(required=False)
+    B = PackedMatrixField(required=False)
+    A_sparse = SparseMatrixSerializer(required=False)
+    B_sparse = SparseMatrixSerializer(required=False)
+    matrices = serializers.ListField(child=PackedMatrixField(), required=False)
     scalar = serializers.FloatField(required=False)
+    exponent = serializers.IntegerField(required=False)  # power: A^k (k < 0 usa la inversa)
+    coefficients = serializers.ListField(child=serializers.FloatField(), required=False)  # polyval: de mayor a menor grado
     options = serializers.DictField(required=False)
 
     def validate(self, data):
@@ -133,8 +268,33 @@ class MatrixOperateSerializer(serializers.Serializer):
         B = data.get('B')
         mats = data.get('matrices')
         sc = data.get('scalar')
+        A_sparse, B_sparse = data.get('A_sparse'), data.get('B_sparse')
+
+        if A_sparse is not None or B_sparse is not None:
+            if A is not None or B is not None or mats is not None:
+                raise serializers.ValidationError("No mezcles matrices densas ('A', 'B', 'matrices') con 'A_sparse' / 'B_sparse'.")
+            if A_sparse is None:
+                raise serializers.ValidationError("Con matrices dispersas envía 'A_sparse'.")
+            if op not in ('add', 'sub', 'scalar', 'transpose', 'matmul', 'inverse'):
+                raise serializers.ValidationError(f"La operación '{op}' no admite matrices dispersas.")
+            sa = A_sparse['shape']
+            if op in ('add', 'sub', 'matmul'):
+                if B_sparse is None:
+                    raise serializers.ValidationError(f"Para '{op}' envía 'A_sparse' y 'B_sparse'.")
+                sb = B_sparse['shape']
+                if op == 'matmul' and sa[1] != sb[0]:
+                    raise serializers.ValidationError(f"Incompatibilidad dimensional para multiplicación: cols(A)={sa[1]} != rows(B)={sb[0]}")
+                if op != 'matmul' and sa != sb:
+                    raise serializers.ValidationError("A y B deben tener la misma dimensión.")
+            if op == 'scalar' and sc is None:
+                raise serializers.ValidationError("Para 'scalar' envía 'A_sparse' y 'scalar'.")
+            if op == 'inverse' and sa[0] != sa[1]:
+                raise serializers.ValidationError("La matriz debe ser cuadrada para calcular la inversa.")
+            return data
 
         def is_matrix(M):
+            if isinstance(M, np.ndarray):
+                return True
             return isinstance(M, list) and all(isinstance(row, list) for row in M)
 
         if op in ('add', 'sub'):
@@ -187,24 +347,68 @@ class MatrixOperateSerializer(serializers.Serializer):
             if len(A) != len(A[0]):
                 raise serializers.ValidationError("La matriz debe ser cuadrada para calcular la inversa.")
 
+        if op in ('power', 'polyval'):
+            if A is None or len(A) == 0:
+                raise serializers.ValidationError(f"Para '{op}' envía 'A'.")
+            if any(len(row) != len(A) for row in A):
+                raise serializers.ValidationError("La matriz debe ser cuadrada para calcular potencias o polinomios.")
+            if op == 'power' and data.get('exponent') is None:
+                raise serializers.ValidationError("Para 'power' envía 'A' y 'exponent'.")
+            if op == 'polyval' and not data.get('coefficients'):
+                raise serializers.ValidationError("Para 'polyval' envía 'A' y 'coefficients' (de mayor a menor grado).")
+
         return data
 
 
 class MatrixDeterminantSerializer(serializers.Serializer):
-    method = serializers.ChoiceField(choices=['sarrus', 'cofactors', 'cramer'], default='cofactors')
-    A = serializers.ListField(child=serializers.ListField(child=serializers.FloatField()))
+    method = serializers.ChoiceField(choices=['sarrus', 'cofactors', 'bareiss', 'lu', 'cramer'], default='cofactors')
+    A = MatrixField()
     options = serializers.DictField(required=False)
 
+    @staticmethod
+    def validate_matrix(A, prefix: str = "") -> None:
+        if not A:
+            raise serializers.ValidationError(f"{prefix}La matriz A es requerida.")
+        # todas las filas del mismo largo
+        if any(len(row) != len(A[0]) for row in A):
+            raise serializers.ValidationError(f"{prefix}Todas las filas de A deben tener la misma longitud.")
+        # cuadrada
+        if len(A) != len(A[0]):
+            raise serializers.ValidationError(f"{prefix}La matriz A debe ser cuadrada para calcular el determinante.")
+
     def validate(self, data):
-        A = data.get('A')
+        self.validate_matrix(data.get('A'))
+        return data
+
+
+class MatrixDeterminantBatchSerializer(serializers.Serializer):
+    # Con options.steps = "none", cofactores / Cramer / LU se calculan apilados por LU (method_used = "lu")
+    method = serializers.ChoiceField(choices=['sarrus', 'cofactors', 'bareiss', 'lu', 'cramer'], default='cofactors')
+    matrices = serializers.ListField(child=MatrixField(), allow_empty=False)
+    options = serializers.DictField(required=False)
+
+    def validate(self, data):
+        # Mismas reglas que /matrix/determinant, por matriz
+        for i, A in enumerate(data.get('matrices')):
+            MatrixDeterminantSerializer.validate_matrix(A, prefix=f"matrices[{i}]: ")
+        return data
+
+
+class MatrixCramerSerializer(serializers.Serializer):
+    A = MatrixField()
+    b = serializers.ListField(child=serializers.FloatField())
+    options = serializers.DictField(required=False)
+
+    def validate(self, data):
+        A, b = data.get('A'), data.get('b')
         if not A:
             raise serializers.ValidationError("La matriz A es requerida.")
-        # todas las filas del mismo largo
         if any(len(row) != len(A[0]) for row in A):
             raise serializers.ValidationError("Todas las filas de A deben tener la misma longitud.")
-        # cuadrada
         if len(A) != len(A[0]):
-            raise serializers.ValidationError("La matriz A debe ser cuadrada para calcular el determinante.")
+            raise serializers.ValidationError("La matriz A debe ser cuadrada para aplicar la regla de Cramer.")
+        if len(b) != len(A):
+            raise serializers.ValidationError(f"Dimensiones inconsistentes: A es {len(A)}x{len(A)} y b tiene longitud {len(b)}.")
         return data
 
 
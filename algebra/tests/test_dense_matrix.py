@@ -0,0 +1,27 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from algebra.utils.dense_matrix import DenseMatrix
+
+
+class DenseMatrixTests(SimpleTestCase):
+
+    def test_col_follows_swaps(self):
+        rows = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        M = DenseMatrix.from_rows(rows)
+        self.assertTrue(M.is_identity_perm())
+        self.assertTrue(np.shares_memory(M.col(1), M.data))  # sin permutar: vista
+        M.swap_rows(1, 1)
+        self.assertTrue(M.is_identity_perm())
+        M.swap_rows(0, 2)
+        self.assertFalse(M.is_identity_perm())
+        self.assertEqual(M.col(0).tolist(), [5.0, 3.0, 1.0])
+        self.assertEqual(M.to_rows(), [rows[2], rows[1], rows[0]])
+
+    def test_clone_keeps_permutation(self):
+        M = DenseMatrix.from_rows([[1.0], [2.0]])
+        M.swap_rows(0, 1)
+        C = M.clone()
+        self.assertFalse(C.is_identity_perm())
+        self.assertEqual(C.col(0).tolist(), [2.0, 1.0])
+        self.assertTrue(DenseMatrix(np.eye(2), np.array([0, 1])).is_identity_perm())
@@ -0,0 +1,237 @@
+import random
+from fractions import Fraction
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from algebra.algorithms.matrix.determinants.crammer import determinant_cofactors, validate_determinant_properties
+from algebra.algorithms.matrix.determinants import determinant_api as determinant_api_module
+from algebra.algorithms.matrix.determinants.determinant_api import cramer_api, determinant_api, determinant_batch_api
+from algebra.utils.algebraic_support import TOL, isclose
+
+
+def random_matrix(rng, n, lo=-5, hi=5):
+    return [[float(rng.randint(lo, hi)) for _ in range(n)] for _ in range(n)]
+
+
+def naive_laplace(A):
+    # Desarrollo por la primera fila sin memorizar (referencia O(n!))
+    n = len(A)
+    if n == 1:
+        return A[0][0]
+    if n == 2:
+        return A[0][0] * A[1][1] - A[0][1] * A[1][0]
+    total = 0.0
+    for j in range(n):
+        minor = [row[:j] + row[j + 1:] for row in A[1:]]
+        total += ((-1) ** j) * A[0][j] * naive_laplace(minor)
+    return total
+
+
+class CofactorTests(SimpleTestCase):
+
+    def test_memoized_matches_naive(self):
+        rng = random.Random(2)
+        for n in range(1, 8):
+            for _ in range(5):
+                A = [[rng.uniform(-5, 5) for _ in range(n)] for _ in range(n)]
+                for level in ("none", "full"):
+                    self.assertEqual(determinant_cofactors(A, level)[0], naive_laplace(A))
+
+    def test_one_by_one(self):
+        det, _ = determinant_cofactors([[-3.5]])
+        self.assertEqual(det, -3.5)
+        res = determinant_api(A=[[7.0]], method="cofactors")
+        self.assertEqual((res["result"]["determinant"], res["input"]["method_used"]), (7.0, "cofactors"))
+
+    def test_each_2x2_minor_logged_once(self):
+        A = random_matrix(random.Random(3), 5)
+        _, steps = determinant_cofactors(A, "full")
+        subdets = [st for st in steps["frame"]["states"] if st.get("tag") == "minor_2x2"]
+        self.assertEqual(len(subdets), 10)  # C(5, 2) menores 2×2 distintos
+
+    def test_switches_to_lu_above_max_n(self):
+        with self.settings(ALGEBRA_COFACTOR_MAX_N=4):
+            A = random_matrix(random.Random(4), 5)
+            res = determinant_api(A=A, method="cofactors", options={"steps": "none"})
+            self.assertEqual(res["input"]["method_used"], "lu")
+            self.assertAlmostEqual(res["result"]["determinant"], naive_laplace(A), places=6)
+
+
+class BareissTests(SimpleTestCase):
+
+    def test_exact_determinant_out_of_float_range(self):
+        rng = random.Random(1)
+        A = random_matrix(rng, 40, lo=-10**9, hi=10**9)
+        res = determinant_api(A=A, method="bareiss", options={"steps": "summary"})
+        # det ≈ 1e360: sin valor float, el texto exacto es el resultado
+        self.assertIsNone(res["result"]["determinant"])
+        self.assertGreater(abs(Fraction(res["result"]["determinant_pretty"])), Fraction(10) ** 308)
+        self.assertFalse(res["properties"]["consistency"]["det_is_zero"])
+
+
+class CramerTests(SimpleTestCase):
+
+    def test_matches_numpy_solve(self):
+        rng = random.Random(5)
+        for n in range(1, 9):
+            for _ in range(5):
+                A = random_matrix(rng, n)
+                b = [float(rng.randint(-5, 5)) for _ in range(n)]
+                detA = np.linalg.det(A)
+                if abs(detA) < 1e-6:
+                    continue
+                res = cramer_api(A=A, b=b, options={"steps": "none"})["result"]
+                np.testing.assert_allclose(res["solution"], np.linalg.solve(A, b), rtol=1e-9, atol=1e-9)
+                self.assertAlmostEqual(res["determinant"], detA, delta=1e-9 * max(1.0, abs(detA)))
+                # det(A_i): A con la columna i reemplazada por b
+                for i, det_i in enumerate(res["determinants"]):
+                    Ai = np.array(A)
+                    Ai[:, i] = b
+                    expected = np.linalg.det(Ai)
+                    self.assertAlmostEqual(det_i, expected, delta=1e-8 * max(1.0, abs(expected)))
+
+    def test_singular(self):
+        with self.assertRaises(ValueError):
+            cramer_api(A=[[1.0, 2.0], [2.0, 4.0]], b=[1.0, 2.0])
+
+    def test_endpoint(self):
+        resp = self.client.post("/api/v1/matrix/cramer", {"A": [[2, 1], [1, 3]], "b": [3, 5]},
+                                content_type="application/json", HTTP_HOST="localhost")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["result"]["solution_pretty"], ["4/5", "7/5"])
+        resp = self.client.post("/api/v1/matrix/cramer", {"A": [[1, 2], [2, 4]], "b": [1, 2]},
+                                content_type="application/json", HTTP_HOST="localhost")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_determinant_method_uses_lu(self):
+        A = random_matrix(random.Random(13), 6)
+        with mock.patch.object(determinant_api_module, "determinant_cofactors") as cofactors:
+            res = determinant_api(A=A, method="cramer")
+        cofactors.assert_not_called()
+        self.assertEqual(res["input"]["method_used"], "lu")
+        self.assertEqual(res["result"], determinant_api(A=A, method="lu")["result"])
+        self.assertIn("/matrix/cramer", res["steps"]["text_steps"][0])
+
+
+class DeterminantBatchTests(SimpleTestCase):
+    """
+    Sin pasos, cofactores / Cramer / LU se apilan: cada elemento es la respuesta de determinant_api
+    con method="lu". Con pasos, o con Bareiss / Sarrus, es exactamente la de determinant_api.
+    """
+
+    def batch(self, rng):
+        mats = [[[2.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 4.0]], [[1.0, 2.0], [3.0, 4.0]], [[5.0]],
+                [[1.0, 2.0], [2.0, 4.0]]]
+        for _ in range(30):
+            n = rng.randint(1, 7)
+            A = [[rng.uniform(-5, 5) if rng.random() < 0.5 else float(rng.randint(-3, 3)) for _ in range(n)]
+                 for _ in range(n)]
+            if n > 1 and rng.random() < 0.2:
+                A[-1] = A[0][:]  # singular
+            mats.append(A)
+        return mats
+
+    def assert_matches_single(self, method, options, single_method=None):
+        mats = self.batch(random.Random(6))
+        res = determinant_batch_api(matrices=mats, method=method, options=options)
+        self.assertEqual(res["count"], len(mats))
+        for A, item in zip(mats, res["results"]):
+            if method == "sarrus" and len(A) != 3:
+                self.assertIn("error", item)
+                continue
+            expected = determinant_api(A=A, method=single_method or method, options=options)
+            expected["input"]["method"] = method
+            self.assertEqual(item, expected)
+
+    def test_stacked_methods_match_single_lu(self):
+        for method in ("cofactors", "lu", "cramer"):
+            self.assert_matches_single(method, {"steps": "none"}, single_method="lu")
+
+    def test_stacked_close_to_requested_method(self):
+        mats = self.batch(random.Random(7))
+        res = determinant_batch_api(matrices=mats, options={"steps": "none"})
+        for A, item in zip(mats, res["results"]):
+            expected = determinant_api(A=A, options={"steps": "none"})["result"]["determinant"]
+            self.assertAlmostEqual(item["result"]["determinant"], expected, delta=1e-9 * max(1.0, abs(expected)))
+
+    def test_default_method_is_stacked(self):
+        mats = [[[2.0, 0.0], [0.0, 3.0]], [[1.0, 2.0], [3.0, 4.0]], [[5.0]]]
+        with mock.patch.object(determinant_api_module, "determinant_api") as single, \
+             mock.patch.object(determinant_api_module, "determinant_lu_stacked",
+                               wraps=determinant_api_module.determinant_lu_stacked) as stacked:
+            res = determinant_batch_api(matrices=mats, options={"steps": "none"})
+        single.assert_not_called()
+        self.assertEqual(stacked.call_count, 2)  # un grupo 2x2 y uno 1x1
+        self.assertEqual([r["input"]["method_used"] for r in res["results"]], ["lu", "lu", "lu"])
+        self.assertEqual(res["results"][0]["result"]["determinant"], 6.0)
+
+    def test_per_item_methods_match_single(self):
+        for method in ("bareiss", "sarrus"):
+            self.assert_matches_single(method, {"steps": "none"})
+
+    def test_matches_single_with_steps(self):
+        for method in ("cofactors", "lu"):
+            self.assert_matches_single(method, {"steps": "summary"})
+
+
+def pairwise_properties(A):
+    # Referencia: todos los pares con isclose (filas / columnas iguales, columna j = k·columna i)
+    m, n = len(A), len(A[0])
+    cols = [list(c) for c in zip(*A)]
+    equal = lambda V: any(all(isclose(x, y, TOL) for x, y in zip(V[i], V[j]))
+                          for i in range(len(V)) for j in range(i + 1, len(V)))
+
+    def multiple(u, v):
+        k = None
+        for a, b in zip(u, v):
+            if isclose(a, 0.0, TOL):
+                if not isclose(b, 0.0, TOL):
+                    return False
+                continue
+            if k is None:
+                k = b / a
+            elif not isclose(k, b / a, TOL):
+                return False
+        return k is not None
+
+    return equal(A), equal(cols), any(multiple(cols[i], cols[j]) for i in range(n) for j in range(i + 1, n))
+
+
+class DeterminantPropertiesTests(SimpleTestCase):
+    """validate_determinant_properties: mismos resultados que comparar todos los pares con isclose."""
+
+    def found(self, A):
+        props = validate_determinant_properties(A, 0.0)
+        ev = props["equal_rows_or_cols"]["evidence"]
+        return ev["equal_rows"], ev["equal_cols"], props["scalar_multiple_column"]["applies"]
+
+    def test_rounding_boundary(self):
+        # 1.000000050001 y 1.000000049999 redondean distinto a 8 cifras pero son isclose
+        for A in ([[1.000000050001, 2.0], [1.000000049999, 2.0]], [[1.000000050001, 1.000000049999], [2.0, 2.0]]):
+            self.assertEqual(self.found(A), pairwise_properties(A))
+        self.assertEqual(self.found([[1.000000050001, 2.0], [1.000000049999, 2.0]])[:2], (True, False))
+
+    def test_scalar_multiple_column(self):
+        self.assertTrue(self.found([[1.0, 2.0, 0.0], [3.0, 6.0, 1.0], [0.0, 0.0, 5.0]])[2])
+        self.assertTrue(self.found([[1.0, 0.0, 2.0], [3.0, 0.0, 1.0], [4.0, 0.0, 5.0]])[2])  # k = 0
+        self.assertFalse(self.found([[0.0, 1.0], [0.0, 2.0]])[2])  # la columna cero va primero
+        self.assertFalse(self.found([[-1.0, 0.0], [-0.999999999998, 1e-12]])[2])  # cociente apenas > TOL
+        self.assertTrue(self.found([[1.0, 1e-13], [1e6, 1.0000000001e-7]])[2])  # k diminuto
+        self.assertFalse(self.found([[1.0, 2.0], [3.0, 6.1]])[2])
+
+    def test_matches_pairwise_check(self):
+        rng = random.Random(12)
+        for _ in range(1500):
+            n = rng.randint(2, 7)
+            A = [[rng.choice([0.0, 1.0, -1.0, 2.0, rng.uniform(-3, 3)]) for _ in range(n)] for _ in range(n)]
+            i, j = rng.sample(range(n), 2)
+            eps = rng.choice([0.0, 1e-13, 1e-12, 2e-12, 5e-10, 1e-9, 1.5e-9])
+            if rng.random() < 0.5:
+                A[j] = [x * (1 + rng.choice([-1, 1]) * eps) + rng.choice([0.0, eps]) for x in A[i]]
+            else:
+                k = rng.choice([1.0, -0.5, 3.7, 1e-11, 0.0])
+                for row in A:
+                    row[j] = row[i] * k * (1 + rng.choice([-1, 0, 1]) * eps)
+            self.assertEqual(self.found(A), pairwise_properties(A), A)
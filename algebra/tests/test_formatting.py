@@ -0,0 +1,50 @@
+from fractions import Fraction
+
+import numpy as np
+from django.test import SimpleTestCase
+from hypothesis import given, settings, strategies as st
+
+from algebra.utils.algebraic_support import TOL, format_number, format_row, matrix_as_fraction
+
+
+def baseline_format(x):
+    # format_number original: entero si es exacto, fracción acotada si no
+    if abs(x - int(round(x))) < TOL:
+        return str(int(round(x)))
+    return str(Fraction(x).limit_denominator())
+
+
+finite = st.floats(allow_nan=False, allow_infinity=False)
+ratios = st.builds(lambda p, q: p / q, st.integers(-10**6, 10**6), st.integers(1, 10**4))
+near_ints = st.builds(lambda k, e: k + e, st.integers(-10**6, 10**6), st.sampled_from([0.0, 1e-13, -1e-13, 1e-11, 5e-12]))
+values = st.one_of(finite, ratios, near_ints, st.sampled_from([0.0, -0.0, 1e300, -1e300, 2.0**53 + 2, 5e-324]))
+derandomized = settings(max_examples=400, derandomize=True, deadline=None)
+
+
+class FormatNumberTests(SimpleTestCase):
+    """format_number / format_row (caché por bits y prueba de entero en bloque): mismo texto que el original."""
+
+    @derandomized
+    @given(values)
+    def test_scalar(self, x):
+        self.assertEqual(format_number(x), baseline_format(x))
+        self.assertEqual(format_number(x), baseline_format(x))  # segunda vez desde la caché
+
+    @derandomized
+    @given(st.integers(-10**30, 10**30))
+    def test_ints(self, k):
+        self.assertEqual(format_number(k), baseline_format(k))
+
+    @derandomized
+    @given(st.lists(values, max_size=12))
+    def test_rows(self, row):
+        expected = [baseline_format(x) for x in row]
+        self.assertEqual(format_row(row), expected)
+        self.assertEqual(format_row(np.array(row, dtype=np.float64)), expected)
+        if row:
+            self.assertEqual(matrix_as_fraction([row, row]), [expected, expected])
+
+    def test_negative_zero_and_mixed_rows(self):
+        self.assertEqual(format_number(-0.0), "0")
+        self.assertEqual(format_row([1, 0.5, -0.0, 2.0]), ["1", "1/2", "0", "2"])
+        self.assertEqual(format_number(Fraction(1, 3)), "1/3")  # modo exacto: tal cual
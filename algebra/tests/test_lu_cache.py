@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from algebra.algorithms.matrix.matrix_api import matrix_ops_api
+from algebra.algorithms.reduce.gauss import gauss_api
+from algebra.algorithms.reduce.gauss_jordan import gauss_jordan_api
+from algebra.utils.lu_cache import LUCache, LUFactorization, lu_cache
+
+
+def random_square(rng, n):
+    return [[float(rng.randint(-5, 5)) for _ in range(n)] for _ in range(n)]
+
+
+class LUCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        lu_cache().clear()
+
+    def test_hit_and_miss(self):
+        cache = LUCache()
+        A = [[4.0, 3.0], [6.0, 3.0]]
+        first = cache.get(A)
+        self.assertIs(cache.get([row[:] for row in A]), first)  # misma huella de contenido
+        cache.get([[1.0, 0.0], [0.0, 1.0]])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 2, 2))
+
+    def test_eviction_by_bytes(self):
+        one = LUFactorization(np.eye(3)).nbytes
+        cache = LUCache(max_bytes=2 * one)
+        for k in range(3):
+            cache.get((np.eye(3) * (k + 1)).tolist())
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (2, 1))
+        self.assertLessEqual(stats["bytes"], cache.max_bytes)
+
+    def test_factorization(self):
+        rng = random.Random(1)
+        for n in range(1, 8):
+            A = np.array(random_square(rng, n))
+            lu = LUFactorization(A)
+            if abs(np.linalg.det(A)) < 1e-9:
+                continue
+            b = np.arange(1.0, n + 1)
+            np.testing.assert_allclose(lu.solve(b), np.linalg.solve(A, b), atol=1e-9)
+            np.testing.assert_allclose(lu.inverse(), np.linalg.inv(A), atol=1e-9)
+            self.assertAlmostEqual(lu.det(), np.linalg.det(A), delta=1e-9 * max(1.0, abs(np.linalg.det(A))))
+
+    def test_cached_reduction_matches_elimination(self):
+        # steps="none" sale de la caché (fallo y luego acierto); "summary" elimina siempre
+        rng = random.Random(2)
+        for _ in range(40):
+            n = rng.randint(1, 7)
+            A, b = random_square(rng, n), [float(rng.randint(-5, 5)) for _ in range(n)]
+            for api in (gauss_api, gauss_jordan_api):
+                lu_cache().clear()
+                expected = api(A=A, b=b, options={"steps": "summary"})["summary"]
+                self.assertEqual(api(A=A, b=b, options={"steps": "none"})["summary"], expected)
+                self.assertEqual(api(A=A, b=b, options={"steps": "none"})["summary"], expected)
+                self.assertGreaterEqual(lu_cache().stats()["hits"], 1)
+
+    def test_cached_reduction_rectangular_and_singular(self):
+        # U y los pivotes de PA = LU sirven para cualquier A; solo la vuelta a RREF redondea distinto
+        rng = random.Random(4)
+        for _ in range(60):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            A = [[float(rng.randint(-3, 3)) for _ in range(n)] for _ in range(m)]
+            if m > 1:
+                A[-1] = [2.0 * x for x in A[0]]  # rango < m
+            b = [float(rng.randint(-3, 3)) for _ in range(m)]
+            for api in (gauss_api, gauss_jordan_api):
+                lu_cache().clear()
+                expected = api(A=A, b=b, options={"steps": "summary"})["summary"]
+                for _ in range(2):
+                    got = api(A=A, b=b, options={"steps": "none"})["summary"]
+                    for key in ("ranks", "solution_type", "variables", "reduced_form"):
+                        self.assertEqual(got[key], expected[key])
+                    x, y = got["parametric_form"]["particular"], expected["parametric_form"]["particular"]
+                    self.assertEqual(x is None, y is None)
+                    np.testing.assert_allclose(x or [], y or [], atol=1e-9)
+                self.assertEqual(lu_cache().stats()["hits"], 1)
+
+    def test_linear_combination_uses_cache(self):
+        body = {"A": [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], "b": [3.0, 7.0, 11.0], "options": {"steps": "none"}}
+        results = []
+        for _ in range(2):
+            resp = self.client.post("/api/v1/vectors/combination", body, content_type="application/json",
+                                    HTTP_HOST="localhost")
+            self.assertEqual(resp.status_code, 200)
+            results.append(resp.json()["result"])
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(results[0]["is_linear_combination"])
+        self.assertEqual(results[0]["coefficients_particular"], [1.0, 1.0])
+        stats = lu_cache().stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 1))
+
+    def test_cached_inverse(self):
+        rng = random.Random(3)
+        A = random_square(rng, 6)
+        expected = matrix_ops_api(operation="inverse", A=A)["result"]["matrix"]
+        for _ in range(2):
+            got = matrix_ops_api(operation="inverse", A=A, options={"steps": "none"})["result"]["matrix"]
+            np.testing.assert_allclose(got, expected, atol=1e-9)
+        self.assertEqual(lu_cache().stats()["hits"], 1)
+
+    def test_stats_endpoint(self):
+        resp = self.client.get("/api/v1/matrix/lu-cache", HTTP_HOST="localhost")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(set(resp.json()), {"hits", "misses", "evictions", "entries", "bytes", "max_bytes"})
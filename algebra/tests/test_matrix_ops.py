@@ -0,0 +1,162 @@
+import random
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from algebra.algorithms.matrix.matrix_api import matrix_ops_api
+from algebra.utils.algebraic_support import format_number, matrix_as_fraction
+
+
+def random_matrix(rng, m, n, lo=-5, hi=5):
+    return [[float(rng.randint(lo, hi)) for _ in range(n)] for _ in range(m)]
+
+
+class MatmulChainTests(SimpleTestCase):
+
+    def test_classic_chain_order(self):
+        # CLRS 15.2: 30x35, 35x15, 15x5, 5x10, 10x20, 20x25 → 15125 multiplicaciones
+        dims = [30, 35, 15, 5, 10, 20, 25]
+        rng = random.Random(1)
+        mats = [random_matrix(rng, dims[i], dims[i + 1], -2, 2) for i in range(len(dims) - 1)]
+        res = matrix_ops_api(operation="matmul_chain", matrices=mats, options={"steps": "none"})["result"]
+        self.assertEqual(res["chain"]["flops"], 15125)
+        self.assertEqual(res["chain"]["parenthesization"], "((M1·(M2·M3))·((M4·M5)·M6))")
+        self.assertEqual(res["chain"]["flops_left_to_right"],
+                         sum(dims[0] * dims[t] * dims[t + 1] for t in range(1, len(dims) - 1)))
+        np.testing.assert_array_equal(res["matrix"], np.linalg.multi_dot(mats))
+
+    def test_matches_numpy(self):
+        rng = random.Random(2)
+        for _ in range(30):
+            k = rng.randint(2, 6)
+            dims = [rng.randint(1, 6) for _ in range(k + 1)]
+            mats = [random_matrix(rng, dims[i], dims[i + 1]) for i in range(k)]
+            res = matrix_ops_api(operation="matmul_chain", matrices=mats)["result"]
+            np.testing.assert_allclose(res["matrix"], np.linalg.multi_dot(mats) if k > 2 else np.dot(*mats))
+            self.assertLessEqual(res["chain"]["flops"], res["chain"]["flops_left_to_right"])
+
+    def test_incompatible_dimensions(self):
+        res = matrix_ops_api(operation="matmul_chain", matrices=[[[1.0, 2.0]], [[1.0, 2.0]]])
+        self.assertEqual(res["error"]["code"], "MATRIX_OP_ERROR")
+
+
+class PowerPolyvalTests(SimpleTestCase):
+
+    def test_power_matches_numpy(self):
+        rng = random.Random(3)
+        for n in (1, 2, 4):
+            A = random_matrix(rng, n, n, -2, 2)
+            for i in range(n):
+                A[i][i] += 6.0  # invertible para potencias negativas
+            for k in range(-3, 21):
+                res = matrix_ops_api(operation="power", A=A, exponent=k, options={"steps": "none"})["result"]
+                expected = np.linalg.matrix_power(np.array(A), k)
+                np.testing.assert_allclose(res["matrix"], expected, rtol=1e-9, atol=1e-9)
+                if k > 0:
+                    self.assertLessEqual(res["multiplications"], 2 * k.bit_length() - 1)
+
+    def test_polyval_matches_numpy(self):
+        rng = random.Random(4)
+        for _ in range(30):
+            n = rng.randint(1, 4)
+            A = random_matrix(rng, n, n, -2, 2)
+            coeffs = [float(rng.choice([0, 0, rng.randint(-3, 3)])) for _ in range(rng.randint(1, 9))]
+            res = matrix_ops_api(operation="polyval", A=A, coefficients=coeffs)["result"]
+            d = len(coeffs) - 1
+            expected = sum(c * np.linalg.matrix_power(np.array(A), d - i) for i, c in enumerate(coeffs))
+            np.testing.assert_allclose(res["matrix"], expected, rtol=1e-9, atol=1e-9)
+
+    def test_square_matrix_required(self):
+        for operation in ("power", "polyval"):
+            res = matrix_ops_api(operation=operation, A=[[1.0, 2.0]], exponent=2, coefficients=[1.0])
+            self.assertEqual(res["error"]["code"], "MATRIX_OP_ERROR")
+
+
+class InverseTests(SimpleTestCase):
+    """det(A) sale de la misma eliminación; options.snapshots=False solo quita las instantáneas."""
+
+    def test_snapshots_off_matches_on(self):
+        rng = random.Random(5)
+        for n in (1, 2, 3, 5):
+            A = random_matrix(rng, n, n)
+            for i in range(n):
+                A[i][i] += 15.0
+            on = matrix_ops_api(operation="inverse", A=A)
+            off = matrix_ops_api(operation="inverse", A=A, options={"snapshots": False})
+            self.assertEqual(off["result"], on["result"])
+            self.assertEqual(off["steps"]["text_steps"], on["steps"]["text_steps"])
+            self.assertEqual(off["steps"]["frame"], {})
+            self.assertTrue(on["steps"]["frame"]["step_states"])
+            self.assertAlmostEqual(on["result"]["determinant"], np.linalg.det(np.array(A)),
+                                   delta=1e-9 * abs(np.linalg.det(np.array(A))))
+            np.testing.assert_allclose(on["result"]["matrix"], np.linalg.inv(np.array(A)), atol=1e-12)
+
+    def test_singular(self):
+        for options in ({}, {"snapshots": False}, {"steps": "none"}):
+            res = matrix_ops_api(operation="inverse", A=[[1.0, 2.0], [2.0, 4.0]], options=options)
+            self.assertEqual(res["error"]["code"], "MATRIX_OP_ERROR")
+
+
+def cellwise_text(m, n, term):
+    # Texto de referencia: una línea por fila, todas las celdas (bucle Python original)
+    return [f"  Fila {i+1}: " + " | ".join(term(i, j) for j in range(n)) for i in range(m)]
+
+
+class ElementwiseTests(SimpleTestCase):
+    """add / sub / scalar con NumPy: mismos valores y mismo texto que el bucle celda a celda."""
+
+    def cases(self):
+        rng = random.Random(6)
+        for m, n in ((1, 1), (2, 3), (4, 4)):
+            A = [[rng.randint(-9, 9) / rng.choice((1, 2, 3, 7)) for _ in range(n)] for _ in range(m)]
+            B = [[rng.randint(-9, 9) / rng.choice((1, 2, 5)) for _ in range(n)] for _ in range(m)]
+            yield m, n, A, B
+
+    def reference(self, operation, A, B, alpha):
+        m, n = len(A), len(A[0])
+        if operation == "add":
+            C = [[A[i][j] + B[i][j] for j in range(n)] for i in range(m)]
+            term = lambda i, j: f"({format_number(A[i][j])}) + ({format_number(B[i][j])}) = {format_number(C[i][j])}"
+        elif operation == "sub":
+            C = [[A[i][j] - B[i][j] for j in range(n)] for i in range(m)]
+            term = lambda i, j: f"({format_number(A[i][j])}) - ({format_number(B[i][j])}) = {format_number(C[i][j])}"
+        else:
+            C = [[alpha * A[i][j] for j in range(n)] for i in range(m)]
+            term = lambda i, j: f"{format_number(alpha)}·({format_number(A[i][j])}) = {format_number(C[i][j])}"
+        return C, term
+
+    def test_full_steps_match_cell_loop(self):
+        for m, n, A, B in self.cases():
+            for operation in ("add", "sub", "scalar"):
+                res = matrix_ops_api(operation=operation, A=A, B=B, scalar=-1.5)
+                C, term = self.reference(operation, A, B, -1.5)
+                self.assertEqual(res["result"]["matrix"], C)
+                self.assertEqual(res["result"]["matrix_pretty"], matrix_as_fraction(C))
+                self.assertEqual(res["steps"], cellwise_text(m, n, term))
+
+    def test_step_cells_subset(self):
+        # options.step_cells (base 1): solo esas celdas, con el mismo texto que en el detalle completo
+        for m, n, A, B in self.cases():
+            cells = [[m, n], [1, 1]] if m > 1 else [[1, 1]]
+            for operation in ("add", "sub", "scalar"):
+                full = matrix_ops_api(operation=operation, A=A, B=B, scalar=2.0)
+                some = matrix_ops_api(operation=operation, A=A, B=B, scalar=2.0, options={"step_cells": cells})
+                _, term = self.reference(operation, A, B, 2.0)
+                self.assertEqual(some["result"], full["result"])
+                self.assertEqual(some["steps"], [f"  Fila {i}: {term(i - 1, j - 1)}" for i, j in cells])
+            Bt = [list(col) for col in zip(*B)]  # A·Bᵀ es m×m
+            cells = [[m, m], [1, 1]] if m > 1 else [[1, 1]]
+            full = matrix_ops_api(operation="matmul", A=A, B=Bt)
+            some = matrix_ops_api(operation="matmul", A=A, B=Bt, options={"step_cells": cells})
+            self.assertEqual(some["result"], full["result"])
+            self.assertEqual(some["steps"], [full["steps"][(i - 1) * m + j - 1] for i, j in cells])
+
+    def test_step_cells_out_of_range(self):
+        res = matrix_ops_api(operation="add", A=[[1.0]], B=[[2.0]], options={"step_cells": [[2, 1]]})
+        self.assertEqual(res["error"]["code"], "MATRIX_OP_ERROR")
+
+    def test_steps_levels(self):
+        A, B = [[1.0, 2.0]], [[0.5, -1.0]]
+        self.assertEqual(matrix_ops_api(operation="add", A=A, B=B, options={"steps": "none"})["steps"], [])
+        self.assertEqual(matrix_ops_api(operation="add", A=A, B=B, options={"steps": "summary"})["steps"],
+                         ["C = A + B (1×2)"])
@@ -0,0 +1,69 @@
+import base64
+from unittest import skipIf
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from algebra.renderers import msgpack
+from algebra.utils.matrix_transport import pack_matrix, unpack_matrix
+
+URL = "/api/v1/matrix/operate"
+
+
+class PackedMatrixTests(SimpleTestCase):
+    """Matrices empaquetadas {"shape", "dtype", "data"}: ida y vuelta exacta en base64 y en bytes."""
+
+    A = [[1.0, -2.5, 1e-300], [0.1, 3.0, -0.0]]
+
+    def test_round_trip(self):
+        for binary in (False, True):
+            spec = pack_matrix(self.A, binary)
+            self.assertEqual(spec["shape"], [2, 3])
+            self.assertIsInstance(spec["data"], bytes if binary else str)
+            M = unpack_matrix(spec)
+            self.assertEqual(M.tolist(), self.A)
+            self.assertEqual(np.signbit(M).tolist(), np.signbit(self.A).tolist())
+
+    def test_invalid_specs(self):
+        good = pack_matrix(self.A)
+        for bad in ({**good, "dtype": ">f8"}, {**good, "shape": [3, 3]}, {**good, "shape": [2, True, 3]},
+                    {**good, "shape": [0, 3]}, {**good, "data": "no es base64!"}, {**good, "data": 12},
+                    pack_matrix([[1.0, float("nan")]])):
+            with self.assertRaises(ValueError):
+                unpack_matrix(bad)
+
+    def post(self, data, **extra):
+        return self.client.post(URL, data, HTTP_HOST="localhost", **extra)
+
+    def test_base64_endpoint(self):
+        B = [[2.0, 0.0], [1.0, 1.0], [0.0, -1.0]]
+        resp = self.post({"operation": "matmul", "A": pack_matrix(self.A), "B": B,
+                          "options": {"matrix_encoding": "base64"}}, content_type="application/json")
+        self.assertEqual(resp.status_code, 200)
+        result = resp.json()["result"]["matrix"]
+        expected = (np.array(self.A) @ np.array(B)).tolist()
+        self.assertEqual(np.frombuffer(base64.b64decode(result["data"]), "<f8").reshape(result["shape"]).tolist(),
+                         expected)
+        lists = self.post({"operation": "matmul", "A": self.A, "B": B}, content_type="application/json")
+        self.assertEqual(lists.json()["result"]["matrix"], expected)
+
+    def test_invalid_packed_input(self):
+        resp = self.post({"operation": "transpose", "A": {**pack_matrix(self.A), "shape": [3, 3]}},
+                         content_type="application/json")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["error"]["code"], "VALIDATION_ERROR")
+
+    @skipIf(msgpack is None, "msgpack no está instalado (requirements-optional.txt)")
+    def test_msgpack_endpoint(self):
+        body = msgpack.packb({"operation": "transpose", "A": pack_matrix(self.A, binary=True)}, use_bin_type=True)
+        resp = self.post(body, content_type="application/msgpack", HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "application/msgpack")
+        data = msgpack.unpackb(resp.content, raw=False)
+        self.assertEqual(unpack_matrix(data["result"]["matrix"]).tolist(), np.array(self.A).T.tolist())
+        self.assertIsInstance(data["input"]["A"]["data"], bytes)
+
+    @skipIf(msgpack is None, "msgpack no está instalado (requirements-optional.txt)")
+    def test_msgpack_parse_error(self):
+        resp = self.post(b"\xc1", content_type="application/msgpack")
+        self.assertEqual(resp.status_code, 400)
@@ -0,0 +1,323 @@
+import json
+import random
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from algebra.algorithms.reduce.gauss import gauss_api
+from algebra.algorithms.reduce.gauss_jordan import gauss_jordan_api
+from algebra.algorithms.reduce.numpy_engine import NUMPY_AUTO_THRESHOLD
+from algebra.algorithms.reduce.sparse import sparse_reduce_api
+from algebra.algorithms.parametric import parametric_from_rref
+from algebra.algorithms.matrix.determinants.determinant_api import determinant_api
+from algebra.algorithms.matrix.matrix_api import matrix_ops_api
+from algebra.algorithms.vectors.vectors_comb_api import linear_combination_api
+from algebra.utils.algebraic_support import decode_value_table, rebuild_snapshot
+
+
+def random_system(rng, m, n, lo=-5, hi=5, den=(1,)):
+    A = [[rng.randint(lo, hi) / rng.choice(den) for _ in range(n)] for _ in range(m)]
+    b = [float(rng.randint(lo, hi)) for _ in range(m)]
+    return A, b
+
+
+def without_engine(result):
+    result["input"].pop("engine")
+    return result
+
+
+class EngineEqualityTests(SimpleTestCase):
+    """engine="numpy" replica paso a paso al motor Python (mismas operaciones de punto flotante)."""
+
+    def test_numpy_matches_python(self):
+        rng = random.Random(1)
+        for _ in range(60):
+            A, b = random_system(rng, rng.randint(1, 7), rng.randint(1, 7), den=(1, 2, 3, 7))
+            for api in (gauss_api, gauss_jordan_api):
+                for pivoting in ("partial", "none"):
+                    py, np_ = (without_engine(api(A=A, b=b, options={"engine": e, "pivoting": pivoting}))
+                               for e in ("python", "numpy"))
+                    self.assertEqual(py, np_)
+
+    def test_numpy_matches_python_many_rhs(self):
+        rng = random.Random(2)
+        A, _ = random_system(rng, 5, 5)
+        B = [[float(rng.randint(-5, 5)) for _ in range(3)] for _ in range(5)]
+        for api in (gauss_api, gauss_jordan_api):
+            py, np_ = (without_engine(api(A=A, B=B, options={"engine": e})) for e in ("python", "numpy"))
+            self.assertEqual(py, np_)
+
+    def test_auto_picks_numpy_for_large_systems(self):
+        rng = random.Random(3)
+        A, b = random_system(rng, NUMPY_AUTO_THRESHOLD, NUMPY_AUTO_THRESHOLD)
+        self.assertEqual(gauss_api(A=A, b=b, options={"steps": "none"})["input"]["engine"], "numpy")
+        self.assertEqual(gauss_api(A=[row[:3] for row in A[:3]], b=b[:3])["input"]["engine"], "python")
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            gauss_api(A=[[1.0]], b=[1.0], options={"engine": "gpu"})
+
+
+class ExactEngineTests(SimpleTestCase):
+    """engine="exact" (Bareiss): mismos rangos y soluciones que el motor flotante, sin pasar por float."""
+
+    def test_exact_matches_float_on_integer_systems(self):
+        rng = random.Random(4)
+        for _ in range(40):
+            A, b = random_system(rng, rng.randint(1, 6), rng.randint(1, 6))
+            for api in (gauss_api, gauss_jordan_api):
+                fl = api(A=A, b=b, options={"engine": "python"})["summary"]
+                ex = api(A=A, b=b, options={"engine": "exact"})["summary"]
+                self.assertEqual(ex["ranks"], fl["ranks"])
+                self.assertEqual(ex["solution_type"], fl["solution_type"])
+                self.assertEqual(ex["variables"], fl["variables"])
+                if fl["parametric_form"]["particular"] is not None:
+                    for x, y in zip(ex["parametric_form"]["particular"], fl["parametric_form"]["particular"]):
+                        self.assertAlmostEqual(x, y, places=9)
+
+    def test_large_integer_system(self):
+        # Los enteros intermedios de Bareiss superan el rango de float64
+        rng = random.Random(5)
+        n = 40
+        A, b = random_system(rng, n, n, lo=-10**9, hi=10**9)
+        for api in (gauss_api, gauss_jordan_api):
+            res = api(A=A, b=b, options={"engine": "exact", "steps": "none"})
+            self.assertEqual(res["summary"]["solution_type"], "unica")
+            self.assertEqual(res["summary"]["ranks"], {"rankA": n, "rankAb": n})
+            x = res["summary"]["parametric_form"]["particular"]
+            for row, bi in zip(A, b):
+                self.assertAlmostEqual(sum(a * xi for a, xi in zip(row, x)), bi, delta=1e-3 * abs(bi) + 1e-3)
+
+    def test_pivot_log_beyond_float_range(self):
+        # Pivotes de Bareiss > 1e308: as_float es None y el texto exacto se conserva
+        A = [[1e200, 2e200, 3.0], [4e200, 5e200, 6.0], [7e200, 8e200, 10.0]]
+        res = gauss_api(A=A, b=[1.0, 2.0, 3.0], options={"engine": "exact"})
+        pivots = [st["pivot"]["value"] for st in res["steps"] if "pivot" in st]
+        self.assertEqual(pivots[0]["as_float"], 7e200)
+        self.assertIsNone(pivots[1]["as_float"])
+        self.assertEqual(pivots[1]["as_fraction"], "6" + "0" * 400)
+
+    def test_large_integer_system_via_api(self):
+        rng = random.Random(6)
+        A, b = random_system(rng, 40, 40, lo=-10**9, hi=10**9)
+        for method in ("gauss", "gauss-jordan"):
+            resp = self.client.post("/api/v1/matrix/reduce", {
+                "method": method, "A": A, "b": b, "options": {"engine": "exact", "steps": "none"},
+            }, content_type="application/json", HTTP_HOST="localhost")
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.json()["summary"]["solution_type"], "unica")
+
+
+class ParametricTests(SimpleTestCase):
+    """free_basis de parametric_from_rref: base del espacio nulo y solución general de A·x = b."""
+
+    def test_known_system(self):
+        A, b = [[1, 2, -1, 3], [2, 4, 0, 2]], [1, 6]
+        for api in (gauss_api, gauss_jordan_api):
+            form = api(A=A, b=b, options={"steps": "none"})["summary"]["parametric_form"]
+            self.assertEqual(form["particular"], [3.0, 0.0, 2.0, 0.0])
+            self.assertEqual(form["free_basis"], [[-2.0, 1.0, 0.0, 0.0], [-1.0, 0.0, 2.0, 1.0]])
+            self.assertEqual(form["free_basis_pretty"], [["-2", "1", "0", "0"], ["-1", "0", "2", "1"]])
+
+    def test_without_pivots_in_info(self):
+        # sin info["pivots"] se buscan las filas pivote en la RREF: misma salida
+        Ab = [[1.0, 0.5, 0.0, -1.0, 2.0], [0.0, 0.0, 1.0, 3.0, -1.0], [0.0, 0.0, 0.0, 0.0, 0.0]]
+        info = {"basic_vars": [0, 2], "free_vars": [1, 3], "pivots": [(0, 0), (1, 2)]}
+        with_pivots = parametric_from_rref(Ab, info)
+        scanned = parametric_from_rref(Ab, {k: v for k, v in info.items() if k != "pivots"})
+        self.assertEqual(with_pivots, scanned)
+        self.assertEqual(with_pivots["free_basis"], [[-0.5, 1.0, 0.0, 0.0], [1.0, 0.0, -3.0, 1.0]])
+
+    def test_basis_spans_null_space(self):
+        rng = random.Random(5)
+        for _ in range(40):
+            A, b = random_system(rng, rng.randint(1, 5), rng.randint(2, 6), den=(1, 2, 3))
+            A = A + [[x + y for x, y in zip(A[0], A[-1])]]  # fuerza dependencia
+            b = b + [b[0] + b[-1]]
+            form = gauss_jordan_api(A=A, b=b, options={"steps": "none"})["summary"]["parametric_form"]
+            if not form["exists"]:
+                continue
+            M, V = np.array(A), np.array(form["free_basis"])
+            self.assertEqual(V.shape, (len(form["symbolic"]["params"]), len(A[0])))
+            self.assertEqual(np.linalg.matrix_rank(V), len(V))
+            np.testing.assert_allclose(M @ V.T, 0.0, atol=1e-9)
+            t = np.array([rng.uniform(-3, 3) for _ in V])
+            np.testing.assert_allclose(M @ (np.array(form["particular"]) + t @ V), b, atol=1e-9)
+
+
+class StepsLevelTests(SimpleTestCase):
+    """options.steps = "none" | "summary" | "full": cambia solo cuántos pasos se registran, nunca el resultado."""
+
+    A = [[2.0, 1.0, -1.0], [-3.0, -1.0, 2.0], [-2.0, 1.0, 2.0]]
+    b = [8.0, -11.0, -3.0]
+
+    def by_level(self, call):
+        return {level: call({"steps": level}) for level in ("none", "summary", "full")}
+
+    def test_reduction(self):
+        for api, full_count in ((gauss_api, 10), (gauss_jordan_api, 17)):
+            res = self.by_level(lambda opt: api(A=self.A, b=self.b, options={**opt, "engine": "python"}))
+            self.assertEqual(res["none"]["steps"], [])
+            self.assertEqual(len(res["summary"]["steps"]), 3)  # una línea por pivote
+            self.assertTrue(all(set(st) == {"index", "operation", "pivot"} for st in res["summary"]["steps"]))
+            self.assertEqual(len(res["full"]["steps"]), full_count)
+            self.assertEqual(res["none"]["summary"], res["full"]["summary"])
+            self.assertEqual(res["summary"]["summary"], res["full"]["summary"])
+
+    def test_inverse(self):
+        res = self.by_level(lambda opt: matrix_ops_api(operation="inverse", A=self.A, options=opt))
+        counts = {level: (len(r["steps"]["text_steps"]), len(r["steps"]["frame"].get("step_states", [])))
+                  for level, r in res.items()}
+        self.assertEqual(counts, {"none": (0, 0), "summary": (3, 0), "full": (11, 11)})
+        self.assertEqual(res["none"]["steps"]["frame"], {})
+        for level in ("none", "summary"):
+            self.assertEqual(res[level]["result"]["matrix_pretty"], res["full"]["result"]["matrix_pretty"])
+            self.assertAlmostEqual(res[level]["result"]["determinant"], res["full"]["result"]["determinant"])
+
+    def test_determinant(self):
+        expected = {"cofactors": (4, 10), "lu": (2, 6), "bareiss": (1, 3), "sarrus": (3, 4)}
+        for method, (summary_count, full_count) in expected.items():
+            res = self.by_level(lambda opt: determinant_api(A=self.A, method=method, options=opt))
+            counts = {level: len(r["steps"]["text_steps"]) for level, r in res.items()}
+            self.assertEqual(counts, {"none": 0, "summary": summary_count, "full": full_count}, method)
+            self.assertEqual(res["none"]["steps"]["frame"]["states"], [])
+            for level in ("none", "summary"):
+                self.assertEqual(res[level]["result"], res["full"]["result"])
+                self.assertEqual(res[level]["properties"], res["full"]["properties"])
+
+    def test_unknown_level(self):
+        with self.assertRaises(ValueError):
+            gauss_api(A=self.A, b=self.b, options={"steps": "verbose"})
+        with self.assertRaises(ValueError):
+            determinant_api(A=self.A, options={"steps": "verbose"})
+
+
+class DeltaFormatTests(SimpleTestCase):
+    """steps_format="delta": rebuild_snapshot reproduce la instantánea del formato completo en cada paso."""
+
+    def assert_rebuilds(self, full_steps, delta_steps, key, payload):
+        self.assertEqual(len(full_steps), len(delta_steps))
+        expected = None
+        for i, st in enumerate(full_steps):
+            if payload(st) is not None:
+                expected = payload(st)
+            self.assertEqual(rebuild_snapshot(delta_steps, i, key), expected)
+
+    def test_reduction_steps(self):
+        rng = random.Random(7)
+        augmented = lambda st: st.get("matrix", {}).get("augmented")
+        for _ in range(20):
+            A, b = random_system(rng, rng.randint(2, 7), rng.randint(2, 7), den=(1, 2, 3))
+            for api in (gauss_api, gauss_jordan_api):
+                for engine in ("python", "numpy", "exact"):
+                    opt = {"engine": engine}
+                    full = api(A=A, b=b, options=opt)["steps"]
+                    delta = api(A=A, b=b, options={**opt, "steps_format": "delta", "keyframe_every": 3})["steps"]
+                    self.assert_rebuilds(full, delta, "augmented", augmented)
+
+    def test_inverse_step_states(self):
+        rng = random.Random(8)
+        for n in (2, 4, 6):
+            A = [[float(rng.randint(-5, 5)) for _ in range(n)] for _ in range(n)]
+            for i in range(n):
+                A[i][i] += 20.0 * n  # diagonal dominante: invertible
+            full = matrix_ops_api(operation="inverse", A=A)["steps"]["frame"]["step_states"]
+            delta = matrix_ops_api(operation="inverse", A=A, options={"steps_format": "delta", "keyframe_every": 2})
+            self.assert_rebuilds(full, delta["steps"]["frame"]["step_states"], "matrix", lambda st: st["matrix"])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            gauss_api(A=[[1.0]], b=[1.0], options={"steps_format": "zip"})
+
+
+class ValueTableTests(SimpleTestCase):
+    """encoding="dict": decode_value_table(steps, value_table) reproduce los pasos de encoding="plain"."""
+
+    def test_reduction_steps(self):
+        rng = random.Random(11)
+        for _ in range(10):
+            A, b = random_system(rng, rng.randint(2, 5), rng.randint(2, 5), den=(1, 2, 3))
+            for api in (gauss_api, gauss_jordan_api):
+                for fmt in ("full", "delta"):
+                    opt = {"steps_format": fmt, "keyframe_every": 2}
+                    plain = api(A=A, b=b, options=opt)
+                    encoded = api(A=A, b=b, options={**opt, "encoding": "dict"})
+                    self.assertEqual(decode_value_table(encoded["steps"], encoded["value_table"]), plain["steps"])
+                    self.assertEqual(encoded["summary"], plain["summary"])
+
+    def test_inverse_step_states(self):
+        A = [[2.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 4.0]]
+        plain = matrix_ops_api(operation="inverse", A=A)
+        encoded = matrix_ops_api(operation="inverse", A=A, options={"encoding": "dict"})
+        self.assertEqual(decode_value_table(encoded["steps"], encoded["value_table"]), plain["steps"])
+        self.assertEqual(encoded["result"], plain["result"])
+
+    def test_linear_combination(self):
+        A, b = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], [3.0, 7.0, 11.0]
+        plain = linear_combination_api(A=A, b=b)["gauss_jordan"]
+        encoded = linear_combination_api(A=A, b=b, options={"encoding": "dict"})["gauss_jordan"]
+        self.assertEqual(decode_value_table(encoded["steps"], encoded["value_table"]), plain["steps"])
+        resp = self.client.post("/api/v1/vectors/combination", {"A": A, "b": b, "options": {"encoding": "dict"}},
+                                content_type="application/json", HTTP_HOST="localhost")
+        self.assertEqual(resp.status_code, 200)
+        gj = resp.json()["gauss_jordan"]
+        self.assertEqual(decode_value_table(gj["steps"], gj["value_table"]), json.loads(json.dumps(plain["steps"])))
+
+
+def to_coo(A):
+    cells = [(i, j, v) for i, row in enumerate(A) for j, v in enumerate(row) if v != 0.0]
+    return {"format": "coo", "shape": [len(A), len(A[0])],
+            "row": [i for i, _, _ in cells], "col": [j for _, j, _ in cells], "data": [v for _, _, v in cells]}
+
+
+def to_csr(A):
+    indptr, indices, data = [0], [], []
+    for row in A:
+        for j, v in enumerate(row):
+            if v != 0.0:
+                indices.append(j)
+                data.append(v)
+        indptr.append(len(data))
+    return {"format": "csr", "shape": [len(A), len(A[0])], "indptr": indptr, "indices": indices, "data": data}
+
+
+class SparseEngineTests(SimpleTestCase):
+    """A_sparse (COO / CSR, Markowitz o natural): mismo resumen que la eliminación densa."""
+
+    def random_sparse_system(self, rng, m, n, density):
+        A = [[float(rng.randint(-5, 5)) if rng.random() < density else 0.0 for _ in range(n)] for _ in range(m)]
+        return A, [float(rng.randint(-5, 5)) for _ in range(m)]
+
+    def test_summary_matches_dense(self):
+        rng = random.Random(9)
+        for k in range(80):
+            A, b = self.random_sparse_system(rng, rng.randint(1, 8), rng.randint(1, 8), rng.choice((0.2, 0.4, 0.8)))
+            spec = to_coo(A) if k % 2 else to_csr(A)
+            for method, api in (("gauss", gauss_api), ("gauss-jordan", gauss_jordan_api)):
+                dense = api(A=A, b=b)["summary"]
+                for ordering in ("markowitz", "natural"):
+                    sparse = sparse_reduce_api(A_sparse=spec, b=b, method=method,
+                                               options={"ordering": ordering})["summary"]
+                    for key in ("ranks", "solution_type", "homogeneous", "dependence", "variables"):
+                        self.assertEqual(sparse[key], dense[key], key)
+                    x, y = sparse["parametric_form"]["particular"], dense["parametric_form"]["particular"]
+                    self.assertEqual(x is None, y is None)
+                    for xi, yi in zip(x or [], y or []):
+                        self.assertAlmostEqual(xi, yi, places=9)
+
+    def test_larger_system_with_fill_in(self):
+        rng = random.Random(10)
+        n = 30
+        A, b = self.random_sparse_system(rng, n, n, 0.15)
+        for i in range(n):
+            A[i][i] = 10.0  # diagonal dominante: solución única
+        dense = gauss_api(A=A, b=b, options={"steps": "summary"})["summary"]
+        sparse = sparse_reduce_api(A_sparse=to_coo(A), b=b)["summary"]
+        self.assertEqual(sparse["solution_type"], "unica")
+        for xi, yi in zip(sparse["parametric_form"]["particular"], dense["parametric_form"]["particular"]):
+            self.assertAlmostEqual(xi, yi, places=9)
+
+    def test_invalid_spec(self):
+        with self.assertRaises(ValueError):
+            sparse_reduce_api(A_sparse={"format": "coo", "shape": [2, 2], "row": [0, 5], "col": [0, 0],
+                                        "data": [1.0, 1.0]}, b=[1.0, 1.0])
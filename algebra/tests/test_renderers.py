@@ -0,0 +1,102 @@
+import json
+import io
+import os
+import subprocess
+import sys
+
+import numpy as np
+from django.conf import settings
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from algebra.algorithms.reduce.gauss_jordan import gauss_jordan_api
+from algebra.renderers import EventStreamRenderer, FastJSONParser, FastJSONRenderer, NDJSONRenderer, StreamingRenderer
+
+
+def ndjson_events(body):
+    return [json.loads(line) for line in body.decode("utf-8").splitlines()]
+
+
+class StreamingRendererTests(SimpleTestCase):
+
+    def test_subclass_without_render_event(self):
+        class Incomplete(StreamingRenderer):
+            media_type = "application/x-test"
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def stream(self, renderer, events):
+        resp = renderer.streaming_response(events, "TEST_ERROR")
+        return b"".join(resp.streaming_content)
+
+    def test_value_error_mid_stream(self):
+        def events():
+            yield "step", {"index": 0}
+            raise ValueError("Matriz singular")
+
+        out = ndjson_events(self.stream(NDJSONRenderer(), events()))
+        self.assertEqual(out[0], {"event": "step", "data": {"index": 0}})
+        self.assertEqual(out[-1], {"event": "error", "data": {"error": {"code": "TEST_ERROR", "message": "Matriz singular"}}})
+
+    def test_unexpected_error_mid_stream(self):
+        def events():
+            yield "step", {"index": 0}
+            raise KeyError("x")
+
+        with self.assertLogs("algebra", level="ERROR"):
+            out = ndjson_events(self.stream(NDJSONRenderer(), events()))
+        self.assertEqual(out[-1]["event"], "error")
+        self.assertEqual(out[-1]["data"]["error"]["code"], "TEST_ERROR")
+
+    def test_sse_framing(self):
+        body = self.stream(EventStreamRenderer(), iter([("step", {"index": 0}), ("summary", {"ok": True})]))
+        self.assertEqual(body, b'event: step\ndata: {"index":0}\n\nevent: summary\ndata: {"ok":true}\n\n')
+
+    def test_reduce_endpoint_streams_steps(self):
+        resp = self.client.post("/api/v1/matrix/reduce", {"method": "gauss", "A": [[2, 1], [1, 3]], "b": [1, 2]},
+                                content_type="application/json", HTTP_HOST="localhost",
+                                HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(resp.status_code, 200)
+        out = ndjson_events(b"".join(resp.streaming_content))
+        self.assertTrue(all(ev["event"] == "step" for ev in out[:-1]))
+        self.assertEqual(out[-1]["event"], "summary")
+        self.assertEqual(out[-1]["data"]["summary"]["solution_type"], "unica")
+
+
+class FastJSONTests(SimpleTestCase):
+
+    def assert_same_json(self, data):
+        # orjson escribe 1e-7 / 1e308 donde json escribe 1e-07 / 1e+308: se comparan los valores
+        self.assertEqual(json.loads(FastJSONRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+
+    def test_same_output_as_stock(self):
+        data = gauss_jordan_api(A=[[1.0, 2.0, 3.0], [4.0, 5.0, 6.5], [7.0, 8.0, 10.0]], b=[0.1, 2.0, 1e-7])
+        data["text"] = "ñ ∑ \u2028"
+        self.assert_same_json(data)
+
+    def test_non_finite_rejected_like_stock(self):
+        for bad in (float("nan"), float("inf"), -float("inf")):
+            for data in ({"x": bad}, {"m": [[1.0, bad]]}, {"m": [[1e308, 1e308, bad]]}, {"t": (1, "a", bad)},
+                         {"a": np.array([[1.0, bad]])}, {"s": np.float64(bad)}, [{"x": [None, bad]}]):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render(data)
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render(data)
+
+    def test_large_finite_values_accepted(self):
+        self.assert_same_json({"m": [[1e308, 1e308, -1e308]], "pretty": [["1", "2"]], "n": [None, 1, True]})
+
+    def test_parser_round_trip(self):
+        body = FastJSONRenderer().render({"A": [[1.5, -2.0]], "ok": True})
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), {"A": [[1.5, -2.0]], "ok": True})
+
+
+class JSONBackendSettingTests(SimpleTestCase):
+
+    def test_unknown_backend_fails_at_startup(self):
+        env = {**os.environ, "ALGEBRA_JSON_BACKEND": "bogus", "DJANGO_SETTINGS_MODULE": "calculadora_backend.settings"}
+        proc = subprocess.run([sys.executable, "-c", "import django; django.setup()"], cwd=settings.BASE_DIR,
+                              env=env, capture_output=True, text=True)
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("ImproperlyConfigured: ALGEBRA_JSON_BACKEND debe ser 'fast' o 'stock', no 'bogus'", proc.stderr)
@@ -0,0 +1,37 @@
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from algebra.serializers import MatrixField
+
+
+def validate(field, data):
+    try:
+        return "ok", field.run_validation(data)
+    except serializers.ValidationError as e:
+        return "error", e.detail
+
+
+class MatrixFieldTests(SimpleTestCase):
+    """MatrixField: mismo resultado y mismos errores que ListField(child=ListField(child=FloatField()))."""
+
+    def nested(self):
+        return serializers.ListField(child=serializers.ListField(child=serializers.FloatField()))
+
+    def test_same_as_nested_list_field(self):
+        cases = [
+            [[1, 2.5], [-3, 0]], [[True, 2]], [["1.5", "2"]], [[1, 2], [3]], [], [[]],
+            [[1, "x"]], [[1, None]], [[[1]]], [[1, 2], "ab"], "abc", {"a": 1}, None,
+        ]
+        for data in cases:
+            expected = validate(self.nested(), data)
+            got = validate(MatrixField(), data)
+            self.assertEqual(got, expected, data)
+            if got[0] == "ok":
+                self.assertIs(type(got[1]), list)
+                self.assertTrue(all(type(row) is list and all(type(v) is float for v in row) for row in got[1]))
+
+    def test_non_finite_rejected_with_float_field_message(self):
+        message = serializers.FloatField().error_messages["invalid"]
+        cases = [([[1.0, float("nan")]], 0, 1), ([[1.0], [float("-inf")]], 1, 0), ([["1", "inf"]], 0, 1)]
+        for data, i, j in cases:
+            self.assertEqual(validate(MatrixField(), data), ("error", {i: {j: [message]}}), data)
@@ -3,6 +3,9 @@ from .views import (
     MatrixReduceView, 
     MatrixOperateView,
     MatrixDeterminantView,
+    MatrixDeterminantBatchView,
+    MatrixCramerView,
+    LUCacheStatsView,
     VectorCombinationView, 
     VectorOperateView,
     ErrorAccumulationView,
@@ -20,6 +23,9 @@ urlpatterns = [
     path("matrix/reduce", MatrixReduceView.as_view(), name="matrix-reduce"),
     path("matrix/operate", MatrixOperateView.as_view(), name="matrix-operate"),
     path("matrix/determinant", MatrixDeterminantView.as_view(), name="matrix-determinant"),
+    path("matrix/determinant/batch", MatrixDeterminantBatchView.as_view(), name="matrix-determinant-batch"),
+    path("matrix/cramer", MatrixCramerView.as_view(), name="matrix-cramer"),
+    path("matrix/lu-cache", LUCacheStatsView.as_view(), name="matrix-lu-cache"),
     path("vectors/combination", VectorCombinationView.as_view(), name="vectors-combination"),
     path("vectors/operate", VectorOperateView.as_view(), name="vectors-operate"),
     path("numeric/error-accumulation", ErrorAccumulationView.as_view(), name="error-accumulation"),
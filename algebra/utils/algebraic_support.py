@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
-from copy import deepcopy
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+from functools import lru_cache
 from math import isclose as _isclose
 from fractions import Fraction
+import struct
+
+import numpy as np
 
 Number = float
 Matrix = List[List[Number]]
@@ -11,107 +14,425 @@ DetSteps = Dict[str, Any]  # {"frame":{"states":[...]}, "text_steps":[...]}
 TOL = 1e-12
 
 def isclose(a:float, b: float = 0.0, tol:float = TOL) -> bool:
+    # tol = 0: modo exacto (int / Fraction), comparación exacta sin convertir a float
+    # (los enteros de Bareiss pueden no caber en un float)
+    if tol == 0:
+        return a == b
     return _isclose(a, b, abs_tol=tol)
 
-def deepcopy_mat(M: Optional[Matrix]) -> Matrix:
-    return [] if M is None else deepcopy(M)
+def exact_as_float(x: Number) -> Optional[float]:
+    """float(x); None si un valor exacto (int / Fraction) no cabe en float64 (el texto exacto va aparte)."""
+    try:
+        return float(x)
+    except OverflowError:
+        return None
+
+''' Formato de números (entero / fracción) '''
+# Entradas de la caché LRU de fracciones (los mismos valores se repiten en cada instantánea)
+FORMAT_CACHE_SIZE = 1 << 16
+
+_F64 = struct.Struct("<d")
+_I64 = struct.Struct("<q")
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _fraction_text(bits: int) -> str:
+    # Clave: patrón de bits del float64 (valores iguales → misma clave, sin ambigüedad)
+    x = _F64.unpack(_I64.pack(bits))[0]
+    return str(Fraction(x).limit_denominator())
+
 
 def format_number(x: float) -> str:
-    # Entero si es exacto, fraccion si no lo es
-    if abs(x - int(round(x))) < TOL:
-        return str(int(round(x)))
-    frac = Fraction(x).limit_denominator()
-    return str(frac)
+    # Valores exactos (int / Fraction del modo exacto) se muestran tal cual
+    if isinstance(x, (int, Fraction)):
+        return str(x)
+    # Entero si es exacto (sin pasar por Fraction), fraccion si no lo es
+    r = int(round(x))
+    if abs(x - r) < TOL:
+        return str(r)
+    if isinstance(x, float):
+        return _fraction_text(_I64.unpack(_F64.pack(x))[0])
+    return str(Fraction(x).limit_denominator())
+
+
+def _format_floats(a: np.ndarray) -> List[str]:
+    """format_number sobre un arreglo float64 1-D: la prueba de entero se hace en bloque."""
+    if not np.isfinite(a).all():
+        return [format_number(v) for v in a.tolist()]  # mismo error que el caso escalar
+    r = np.round(a)  # mitades al par, igual que round()
+    is_int = (np.abs(a - r) < TOL).tolist()
+    ints = r.tolist()
+    bits = a.view(np.int64).tolist()
+    return [str(int(ri)) if ok else _fraction_text(b) for ri, ok, b in zip(ints, is_int, bits)]
+
+
+def format_row(row: Iterable[Number]) -> List[str]:
+    """
+    Formatea una fila completa (mismo texto que format_number celda a celda).
+    Filas de solo float se procesan en bloque; int / Fraction / mezclas van celda a celda.
+    """
+    if isinstance(row, np.ndarray):
+        if row.dtype == np.float64:
+            return _format_floats(row.ravel())
+        return [format_number(v) for v in row.tolist()]
+    if isinstance(row, list) and all(type(v) is float for v in row):
+        return _format_floats(np.array(row, dtype=np.float64))
+    return [format_number(v) for v in row]
 
 
 def matrix_as_fraction(M: Matrix) -> List[List[str]]:
-    return [[format_number(v) for v in row] for row in (M or [])]
+    return [format_row(row) for row in (M or [])]
 
 def to_augmented(A: Matrix, b: List[Number]) -> Matrix:
     if len(A) != len(b):
         raise ValueError("Dimensiones inconsistentes entre A y b.")
     return [row + [b[i]] for i, row in enumerate(A)]
 
+def to_augmented_many(A: Matrix, B: Matrix) -> Matrix:
+    """[A | B] para resolver AX = B con B de n×k."""
+    if len(A) != len(B):
+        raise ValueError("Dimensiones inconsistentes entre A y B.")
+    if any(len(row) != len(B[0]) for row in B):
+        raise ValueError("Todas las filas de B deben tener la misma longitud.")
+    return [list(row) + list(B[i]) for i, row in enumerate(A)]
+
+def rhs_column(M: Matrix, n: int, j: int) -> Matrix:
+    """[A | b_j]: las n columnas de coeficientes de M y su columna de términos independientes j."""
+    if len(M) and len(M[0]) == n + 1:
+        return M
+    return [row[:n] + [row[n + j]] for row in M]
+
 def shape(M: Matrix) -> Tuple[int, int]:
-    if not M:
+    if M is None or len(M) == 0:  # len(): también para ndarray (matrices empaquetadas)
         return (0, 0)
     return (len(M), len(M[0]))
 
-def normalize_neg_zero(M: Matrix, tol: float = TOL) -> None:
-    for i in range(len(M)):
-        for j in range(len(M[0])):
-            if isclose(M[i][j], 0.0, tol):
-                M[i][j] = 0.0
+def normalize_neg_zero(M: Matrix, tol: float = TOL, rows: Optional[Iterable[int]] = None) -> None:
+    """
+    Lleva a 0.0 los valores |x| <= tol (incluido -0.0).
+    Con `rows` solo limpia esas filas: tras una primera limpieza completa, basta con
+    limpiar las filas que modificó cada operación para obtener el mismo resultado.
+    """
+    # |x| <= tol equivale a isclose(x, 0.0, tol); la fila se reescribe en su lugar
+    for i in (range(len(M)) if rows is None else rows):
+        R = M[i]
+        R[:] = [0.0 if abs(v) <= tol else v for v in R]
 
 def clone_with(M: Matrix) -> Matrix:
-    C = deepcopy(M)
-    normalize_neg_zero(C)
-    return C
+    """Copia fila a fila ya normalizada (mismo resultado que deepcopy + normalize_neg_zero)."""
+    return [[0.0 if abs(v) <= TOL else v for v in row] for row in M]
+
+
+''' Codificación delta de instantáneas (options.steps_format = "delta") '''
+STEPS_FORMATS = ("full", "delta")
+KEYFRAME_EVERY = 25  # instantáneas entre keyframes completos
+
+
+class DeltaEncoder:
+    """
+    Codifica instantáneas sucesivas de una matriz: un keyframe completo cada
+    `keyframe_every` instantáneas y, entre medio, solo las filas que cambiaron.
+    """
+    __slots__ = ("key", "format_row", "keyframe_every", "_last", "_count")
+
+    def __init__(self, key: str = "augmented", format_row: Callable[[Iterable[Number]], List[Any]] = format_row,
+                 keyframe_every: int = KEYFRAME_EVERY):
+        self.key = key
+        self.format_row = format_row
+        self.keyframe_every = max(1, int(keyframe_every))
+        self._last: Optional[List[List[Any]]] = None
+        self._count = 0
+
+    def encode(self, M: Matrix, rows: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        """
+        rows: filas modificadas desde la instantánea anterior (si se conocen).
+        Sin `rows` se formatea la matriz completa y se comparan las filas.
+        """
+        if self._last is None or self._count >= self.keyframe_every or len(M) != len(self._last):
+            full = [self.format_row(row) for row in M]
+            self._last = list(full)
+            self._count = 0
+            return {self.key: full, "keyframe": True}
+
+        self._count += 1
+        changed: List[int] = []
+        candidates = range(len(M)) if rows is None else sorted(set(rows))
+        for i in candidates:
+            new_row = self.format_row(M[i])
+            if new_row != self._last[i]:
+                self._last[i] = new_row
+                changed.append(i)
+        return {"delta": [{"row": i, "values": self._last[i]} for i in changed]}
+
+
+''' Tabla de valores compartida (options.encoding = "dict") '''
+ENCODINGS = ("plain", "dict")
+
+
+def response_encoding(opt: Optional[Dict[str, Any]]) -> str:
+    encoding = (opt or {}).get("encoding", "plain")
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Codificación desconocida: {encoding}")
+    return encoding
+
+
+class ValueTable:
+    """
+    Valores distintos de las instantáneas de una respuesta ("0", "1", "-1/3", ...):
+    cada uno se guarda una vez en `values` y las instantáneas llevan su índice.
+    La respuesta lo publica como "value_table" (ver decode_value_table).
+    """
+    __slots__ = ("values", "_index")
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._index: Dict[Any, int] = {}
+
+    def ref(self, v: Any) -> int:
+        idx = self._index.get(v)
+        if idx is None:
+            idx = self._index[v] = len(self.values)
+            self.values.append(v)
+        return idx
+
+    def encode_row(self, row: Iterable[Any]) -> List[int]:
+        index = self._index
+        return [index[v] if v in index else self.ref(v) for v in row]
+
+    def encode_matrix(self, M: Iterable[Iterable[Any]]) -> List[List[int]]:
+        return [self.encode_row(row) for row in M]
+
+
+def decode_value_table(node: Any, values: List[Any]) -> Any:
+    """
+    Deshace encoding="dict" en sitio: reemplaza los índices de las instantáneas
+    ("augmented", "matrix" y las filas "delta") por sus valores. Se aplica a la parte
+    "steps" de la respuesta: decode_value_table(resp["steps"], resp["value_table"]).
+    """
+    if isinstance(node, list):
+        for item in node:
+            decode_value_table(item, values)
+    elif isinstance(node, dict):
+        for key, v in node.items():
+            if key in ("augmented", "matrix") and isinstance(v, list):
+                node[key] = [[values[i] for i in row] for row in v]
+            elif key == "delta":
+                for d in v:
+                    d["values"] = [values[i] for i in d["values"]]
+            else:
+                decode_value_table(v, values)
+    return node
+
+
+def value_table_field(steps: Any) -> Dict[str, Any]:
+    """{"value_table": [...]} si el registro de pasos usa encoding="dict"; si no, {}."""
+    table = getattr(steps, "table", None)
+    return {} if table is None else {"value_table": table.values}
+
+
+''' Nivel de detalle de los pasos (options.steps = "none" | "summary" | "full") '''
+STEPS_LEVELS = ("none", "summary", "full")
+_LEVEL_RANK = {level: rank for rank, level in enumerate(STEPS_LEVELS)}
+
+
+def steps_level(opt: Optional[Dict[str, Any]]) -> str:
+    level = (opt or {}).get("steps", "full")
+    if level not in _LEVEL_RANK:
+        raise ValueError(f"Nivel de pasos desconocido: {level}")
+    return level
+
+
+def wants_steps(steps: Any, level: str = "full") -> bool:
+    """
+    Indica si un registro de pasos acepta entradas de `level`. Las listas y dicts
+    simples equivalen a "full"; None no registra nada. Los kernels lo consultan antes
+    de formatear texto, así el trabajo se omite en lugar de generarse y descartarse.
+    """
+    if steps is None:
+        return False
+    return _LEVEL_RANK[getattr(steps, "level", "full")] >= _LEVEL_RANK[level]
+
+
+class StepLog(list):
+    """
+    Lista de pasos de una reducción. Con steps_format="full" se comporta como la lista
+    original; con "delta" las instantáneas de log_* se codifican con DeltaEncoder.
+    `level` limita qué pasos se registran (ver STEPS_LEVELS).
+    Con streaming=True los pasos se entregan con flush_steps() y no se acumulan;
+    `offset` cuenta los ya entregados para que "index" siga siendo global.
+    Con encoding="dict" las instantáneas guardan índices de `table` (ValueTable);
+    en streaming no aplica: cada paso viaja solo y debe poder leerse sin la tabla.
+    """
+
+    def __init__(self, steps_format: str = "full", keyframe_every: int = KEYFRAME_EVERY, level: str = "full",
+                 streaming: bool = False, encoding: str = "plain"):
+        super().__init__()
+        if steps_format not in STEPS_FORMATS:
+            raise ValueError(f"Formato de pasos desconocido: {steps_format}")
+        if level not in _LEVEL_RANK:
+            raise ValueError(f"Nivel de pasos desconocido: {level}")
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Codificación desconocida: {encoding}")
+        self.steps_format = steps_format
+        self.level = level
+        self.table = ValueTable() if encoding == "dict" and not streaming else None
+        row_fn = format_row if self.table is None else (lambda row: self.table.encode_row(format_row(row)))
+        self.encoder = DeltaEncoder(format_row=row_fn, keyframe_every=keyframe_every) \
+            if steps_format == "delta" else None
+        self.streaming = streaming
+        self.offset = 0
+
+
+def new_step_log(opt: Dict[str, Any], streaming: bool = False) -> StepLog:
+    return StepLog(opt.get("steps_format", "full"), opt.get("keyframe_every", KEYFRAME_EVERY), steps_level(opt),
+                   streaming=streaming, encoding=response_encoding(opt))
+
+
+''' Reducciones como generadores (streaming de pasos) '''
+StepEvents = Generator[Tuple[str, Dict[str, Any]], None, Any]
+
+
+def flush_steps(steps: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Emite ("step", paso) por cada paso pendiente de un StepLog en streaming y lo
+    descarta. Con cualquier otro registro no emite nada y los pasos se conservan.
+    """
+    if not getattr(steps, "streaming", False):
+        return
+    pending = list(steps)
+    steps.offset += len(pending)
+    steps.clear()
+    for st in pending:
+        yield "step", st
+
+
+def exhaust(gen: Generator[Any, None, Any]) -> Any:
+    """Consume un generador de pasos y devuelve su valor de retorno."""
+    while True:
+        try:
+            next(gen)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _augmented(steps: List[Dict[str, Any]], Ab: Matrix, rows: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+    encoder = getattr(steps, "encoder", None)
+    if encoder is not None:
+        return encoder.encode(Ab, rows)
+    table = getattr(steps, "table", None)
+    if table is None:
+        return {"augmented": matrix_as_fraction(Ab)}
+    return {"augmented": table.encode_matrix(matrix_as_fraction(Ab))}
+
+
+def rebuild_snapshot(steps: List[Dict[str, Any]], index: int, key: str = "augmented") -> Optional[List[List[Any]]]:
+    """
+    Reconstruye la matriz vigente en el paso `index` de un registro en formato delta.
+    Sirve para los pasos de reducción ({"matrix": {...}}) y para frame.step_states de la
+    inversa (key="matrix"). Devuelve None si aún no hay ninguna instantánea.
+    """
+    def payload(st: Dict[str, Any]) -> Dict[str, Any]:
+        inner = st.get("matrix")
+        return inner if isinstance(inner, dict) else st
+
+    start = None
+    for i in range(min(index, len(steps) - 1), -1, -1):
+        if key in payload(steps[i]):
+            start = i
+            break
+    if start is None:
+        return None
+
+    current = [list(row) for row in payload(steps[start])[key]]
+    for st in steps[start + 1:index + 1]:
+        for d in payload(st).get("delta", []):
+            current[d["row"]] = list(d["values"])
+    return current
 
 
 ''' Registro de Pasos Para Vectores, Matrices y Reducciones'''
+def _next_index(steps: List[Dict[str, Any]]) -> int:
+    return getattr(steps, "offset", 0) + len(steps)
+
 def log_init(steps: List[Dict[str, Any]], Ab: Matrix) -> None:
+    if not wants_steps(steps):
+        return
     steps.append({
-        "index": len(steps),
+        "index": _next_index(steps),
         "operation": "Inicial",
         "matrix": {
-            "augmented":matrix_as_fraction(Ab),
+            **_augmented(steps, Ab),
             "shape": shape(Ab)},
         "note": "Matriz aumentada inicial"
     })
 
 def log_pivot(steps: List[Dict[str, Any]], r: int, c: int, val: float) -> None:
+    if not wants_steps(steps, "summary"):
+        return
     steps.append({
-        "index": len(steps),
+        "index": _next_index(steps),
         "operation": f"Pivot @ ({r+1},{c+1}) = {format_number(val)}",
-        "pivot": {"row": r, "col": c, "value": {"as_float": float(val), "as_fraction": format_number(val)}},
+        "pivot": {"row": r, "col": c, "value": {"as_float": exact_as_float(val), "as_fraction": format_number(val)}},
     })
 
 def log_swap_rows(steps: List[Dict[str, Any]], i: int, j:int, Ab: Matrix) -> None:
+    if not wants_steps(steps):
+        return
     steps.append({
-        "index": len(steps),
+        "index": _next_index(steps),
         "operation": f"Intercambio filas: F{i+1} <-> F{j+1}",
         "swap": {"type": "rows", "i": i, "j": j},
-        "matrix": { "augmented": matrix_as_fraction(Ab)},
+        "matrix": _augmented(steps, Ab, (i, j)),
         "tag": "swap_rows",
         })
     
-def log_row_op(steps: List[Dict[str, Any]], text: str, Ab: Matrix) -> None:
+def log_row_op(steps: List[Dict[str, Any]], text: str, Ab: Matrix, rows: Optional[Iterable[int]] = None) -> None:
+    # rows: filas que modificó la operación (permite codificar solo esas en modo delta)
+    if not wants_steps(steps):
+        return
     steps.append({
-        "index": len(steps),
+        "index": _next_index(steps),
         "operation": text,
         "row_op": {"text": text},
-        "matrix": {
-            "augmented": matrix_as_fraction(Ab),
-                   },
+        "matrix": _augmented(steps, Ab, rows),
         "tag": "elim",
     })
 
 def log_upper(steps: List[Dict[str, Any]], Ab: Matrix) -> None:
+    if not wants_steps(steps):
+        return
     steps.append({
-        "index": len(steps),
+        "index": _next_index(steps),
         "operation": "Triangulación superior (U)",
-        "matrix": {
-            "augmented": matrix_as_fraction(Ab),
-            },
+        "matrix": _augmented(steps, Ab),
         "tag": "upper",
     })
 
 def log_rref(steps: List[Dict[str, Any]], Ab: Matrix) -> None:
+    if not wants_steps(steps):
+        return
     steps.append({
-        "index": len(steps),
+        "index": _next_index(steps),
         "operation": "Forma reducida por filas (RREF)",
-        "matrix": {
-            "augmented": matrix_as_fraction(Ab),
-            },
+        "matrix": _augmented(steps, Ab),
         "tag": "rref",
     })
 
 
 ''' Registro de Pasos para Determinantes (Sarrus, Cofactors) '''
 
-def det_steps_init() -> DetSteps:
-    return {"frame": {"states": []}, "text_steps": []}
+class DetStepLog(dict):
+    """DetSteps con nivel de detalle; se serializa igual que el dict original."""
+
+    def __init__(self, level: str = "full"):
+        super().__init__(frame={"states": []}, text_steps=[])
+        if level not in _LEVEL_RANK:
+            raise ValueError(f"Nivel de pasos desconocido: {level}")
+        self.level = level
+
+
+def det_steps_init(level: str = "full") -> DetSteps:
+    return DetStepLog(level)
 
 def _push_state(steps: DetSteps, *, tag: str, operation: str, matrix: Optional[List[List[float]]] = None, note: Optional[str] = None, extra: Optional[Dict[str, Any]] = None):
     st = {
@@ -128,6 +449,8 @@ def _push_state(steps: DetSteps, *, tag: str, operation: str, matrix: Optional[L
     steps["frame"]["states"].append(st)
 
 def log_det_init(steps: DetSteps, A: List[List[float]], method_name: str):
+    if not wants_steps(steps):
+        return
     _push_state(
         steps,
         tag="initial",
@@ -137,6 +460,8 @@ def log_det_init(steps: DetSteps, A: List[List[float]], method_name: str):
     )
 
 def log_sarrus_extended(steps: DetSteps, A_ext: List[List[float]]):
+    if not wants_steps(steps):
+        return
     _push_state(
         steps,
         tag="sarrus_extended",
@@ -150,6 +475,8 @@ def log_sarrus_diag(steps: DetSteps, kind: str, triples: List[Tuple[float,float,
     kind: "principal" | "secundaria"
     triples: lista de (a,b,c) para cada diagonal
     """
+    if not wants_steps(steps, "summary"):
+        return
     terms_pretty = [f"({format_number(a)})·({format_number(b)})·({format_number(c)})" for (a,b,c) in triples]
     _push_state(
         steps,
@@ -163,7 +490,9 @@ def log_sarrus_diag(steps: DetSteps, kind: str, triples: List[Tuple[float,float,
     steps["text_steps"].append(f"Sumar diagonales {kind}: " + " + ".join(terms_pretty))
 
 def log_det_result(steps: DetSteps, det: float, method_name: str, pos_sum: Optional[float] = None, neg_sum: Optional[float] = None):
-    extra = {"determinant": {"as_float": float(det), "as_fraction": format_number(det)}}
+    if not wants_steps(steps, "summary"):
+        return
+    extra = {"determinant": {"as_float": exact_as_float(det), "as_fraction": format_number(det)}}
     if pos_sum is not None:
         extra["positive_sum"] = {"as_float": float(pos_sum), "as_fraction": format_number(pos_sum)}
     if neg_sum is not None:
@@ -179,7 +508,54 @@ def log_det_result(steps: DetSteps, det: float, method_name: str, pos_sum: Optio
     else:
         steps["text_steps"].append(f"det(A) = {format_number(det)}")
 
+def log_det_diagonal(steps: DetSteps, diag: List[float], sign: int, det: float):
+    """Producto de la diagonal de U (LU), con el signo de los intercambios de filas."""
+    if not wants_steps(steps, "summary"):
+        return
+    factors = "·".join(f"({format_number(d)})" for d in diag)
+    prefix = "−" if sign < 0 else ""
+    _push_state(
+        steps,
+        tag="diagonal_product",
+        operation="Producto de la diagonal de U",
+        note=f"{prefix}{factors} = {format_number(det)}",
+        extra={"diagonal": [format_number(d) for d in diag], "sign": sign}
+    )
+    steps["text_steps"].append(f"det(A) = {prefix}{factors}")
+
+def log_cramer_variable(steps: DetSteps, i: int, Ai: Optional[List[List[float]]], det_i: float, det: float, xi: float):
+    """x_i por Cramer; det(A_i) sale del lema del determinante (A_i = A + (b − a_i)·e_iᵀ)."""
+    if not wants_steps(steps, "summary"):
+        return
+    _push_state(
+        steps,
+        tag="cramer_variable",
+        operation=f"Variable x{i+1}: A{i+1} = A con la columna {i+1} reemplazada por b",
+        matrix=Ai,
+        note=f"det(A{i+1}) = det(A)·(1 + e{i+1}ᵀ·A⁻¹·(b − a{i+1})) = {format_number(det_i)}",
+        extra={
+            "index_var": i+1,
+            "det_Ai": {"as_float": float(det_i), "as_fraction": format_number(det_i)},
+            "x": {"as_float": float(xi), "as_fraction": format_number(xi)}
+        }
+    )
+    steps["text_steps"].append(f"x{i+1} = det(A{i+1}) / det(A) = {format_number(det_i)} / {format_number(det)} = {format_number(xi)}")
+
+def log_det_step(steps: DetSteps, tag: str, operation: str, matrix: Optional[List[List[float]]] = None, note: Optional[str] = None):
+    if not wants_steps(steps):
+        return
+    _push_state(
+        steps,
+        tag=tag,
+        operation=operation,
+        matrix=matrix,
+        note=note
+    )
+    steps["text_steps"].append(operation if not note else f"{operation}: {note}")
+
 def log_cofactor_minor(steps: DetSteps, j: int, M1j: List[List[float]]):
+    if not wants_steps(steps):
+        return
     _push_state(
         steps,
         tag="cofactor_minor",
@@ -189,6 +565,8 @@ def log_cofactor_minor(steps: DetSteps, j: int, M1j: List[List[float]]):
     steps["text_steps"].append(f"Construir M₁{j+1} eliminando fila 1 y col {j+1}.")
 
 def log_subdet_2x2(steps: DetSteps, M: List[List[float]], det2: float):
+    if not wants_steps(steps):
+        return
     a,b = M[0][0], M[0][1]
     c,d = M[1][0], M[1][1]
     _push_state(
@@ -202,6 +580,8 @@ def log_subdet_2x2(steps: DetSteps, M: List[List[float]], det2: float):
     steps["text_steps"].append(f"det(2×2) = ({format_number(a)})·({format_number(d)}) − ({format_number(b)})·({format_number(c)})")
 
 def log_cofactor_value(steps: DetSteps, j: int, sign: int, a1j: float, sub_det: float, cofactor: float):
+    if not wants_steps(steps, "summary"):
+        return
     sign_str = "+" if sign > 0 else "−"
     _push_state(
         steps,
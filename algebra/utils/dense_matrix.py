@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .algebraic_support import Matrix, TOL
+
+# -------------------------------
+# Matriz densa respaldada por un arreglo float64 contiguo
+# -------------------------------
+
+
+class DenseMatrix:
+    """
+    Matriz m×n sobre un único buffer float64 con una permutación de filas:
+    - swap_rows intercambia índices de la permutación (O(1), sin mover datos);
+    - row(i) es una vista sin copia de la fila lógica i (para operar en sitio);
+    - clone() copia el buffer de una vez (sin deepcopy de listas anidadas).
+    Para el código que espera `Matrix` (logs, formato) se comporta como una lista de
+    filas de solo lectura: M[i] y la iteración devuelven listas de float.
+    """
+    __slots__ = ("data", "perm", "shape", "_identity")
+
+    def __init__(self, data: np.ndarray, perm: Optional[np.ndarray] = None):
+        self.data = data
+        self.perm = np.arange(data.shape[0]) if perm is None else perm
+        self.shape: Tuple[int, int] = (int(data.shape[0]), int(data.shape[1]))
+        # ¿perm sigue siendo la identidad? Se calcula una vez; swap_rows lo invalida
+        self._identity = perm is None or bool(np.array_equal(perm, np.arange(data.shape[0])))
+
+    @classmethod
+    def from_rows(cls, rows: Matrix, n: Optional[int] = None) -> "DenseMatrix":
+        m = len(rows)
+        data = np.array(rows, dtype=np.float64)
+        return cls(data.reshape(m, n if n is not None else (len(rows[0]) if m else 0)))
+
+    # --- acceso tipo Matrix (copias: seguras para logs y formato) ---
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, i: int) -> List[float]:
+        return self.data[self.perm[i]].tolist()
+
+    def __iter__(self) -> Iterator[List[float]]:
+        for p in self.perm:
+            yield self.data[p].tolist()
+
+    def to_rows(self) -> Matrix:
+        return self.data[self.perm].tolist()
+
+    def to_array(self) -> np.ndarray:
+        """Copia en orden lógico de filas."""
+        return self.data[self.perm]
+
+    def clone(self) -> "DenseMatrix":
+        return DenseMatrix(self.data.copy(), self.perm.copy())
+
+    # --- vistas y acceso por índice ---
+    def row(self, i: int) -> np.ndarray:
+        """Vista sin copia de la fila lógica i."""
+        return self.data[self.perm[i]]
+
+    def col(self, j: int) -> np.ndarray:
+        """Columna j en orden lógico (vista con paso si las filas no se permutaron)."""
+        if self.is_identity_perm():
+            return self.data[:, j]
+        return self.data[self.perm, j]
+
+    def get(self, i: int, j: int) -> float:
+        return float(self.data[self.perm[i], j])
+
+    def is_identity_perm(self) -> bool:
+        return self._identity
+
+    # --- operaciones de fila en sitio ---
+    def swap_rows(self, i: int, j: int) -> None:
+        if i != j:
+            self.perm[i], self.perm[j] = self.perm[j], self.perm[i]
+            self._identity = False
+
+    def argmax_abs(self, col: int, start: int = 0) -> Tuple[int, float]:
+        """(fila lógica, |valor|) del primer máximo en valor absoluto de la columna desde `start`."""
+        column = np.abs(self.data[self.perm[start:], col])
+        k = int(np.argmax(column))
+        return start + k, float(column[k])
+
+    def scale_row(self, i: int, divisor: float, start: int = 0) -> None:
+        """R_i ← R_i / divisor desde la columna `start`."""
+        self.data[self.perm[i], start:] /= divisor
+
+    def axpy_row(self, dst: int, factor: float, src: int, start: int = 0) -> None:
+        """R_dst ← R_dst - factor·R_src desde la columna `start` (mismas operaciones que el bucle)."""
+        self.data[self.perm[dst], start:] -= factor * self.data[self.perm[src], start:]
+
+    def snap(self, rows: Optional[Iterable[int]] = None, tol: float = TOL) -> None:
+        """Como normalize_neg_zero: |x| <= tol (incluido -0.0) pasa a 0.0, en todo o en `rows`."""
+        if rows is None:
+            self.data[np.abs(self.data) <= tol] = 0.0
+            return
+        rows = list(rows)
+        if len(rows) == 1:
+            R = self.data[self.perm[rows[0]]]  # vista: en sitio
+            R[np.abs(R) <= tol] = 0.0
+            return
+        # Varias filas: un solo bloque (copia por índices) en lugar de un bucle por fila
+        phys = self.perm[rows]
+        block = self.data[phys]
+        block[np.abs(block) <= tol] = 0.0
+        self.data[phys] = block
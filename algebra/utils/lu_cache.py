@@ -0,0 +1,193 @@
+from __future__ import annotations
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from .algebraic_support import Matrix, TOL
+
+# -------------------------------
+# Caché LRU de factorizaciones PA = LU entre peticiones
+# -------------------------------
+
+# Límite por defecto (bytes) si settings.ALGEBRA_LU_CACHE_MAX_BYTES no está definido
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def fingerprint(A: np.ndarray) -> Tuple[Tuple[int, ...], str]:
+    """Huella de A: forma + hash del contenido float64 (la misma matriz da la misma clave)."""
+    return A.shape, hashlib.blake2b(A.tobytes(), digest_size=16).hexdigest()
+
+
+class LUFactorization:
+    """
+    PA = LU con pivoteo parcial (mismo criterio de pivote que select_pivot_row_np).
+    Para matrices singulares o rectangulares U queda en forma escalonada y `pivots`
+    guarda las posiciones (fila, col); L (unitaria) se almacena bajo la diagonal de `lu`.
+    """
+    __slots__ = ("shape", "lu", "perm", "pivots", "sign")
+
+    def __init__(self, A: np.ndarray, tol: float = TOL):
+        M = np.array(A, dtype=np.float64)
+        m, n = M.shape
+        perm = np.arange(m)
+        sign = 1
+        pivots: List[Tuple[int, int]] = []
+        row = 0
+        for col in range(n):
+            if row >= m:
+                break
+            column = np.abs(M[row:, col])
+            k = int(np.argmax(column))
+            if column[k] <= tol:
+                continue
+            k += row
+            if k != row:
+                M[[row, k]] = M[[k, row]]
+                perm[[row, k]] = perm[[k, row]]
+                sign = -sign
+            factors = M[row + 1:, col] / M[row, col]
+            factors[np.abs(M[row + 1:, col]) <= tol] = 0.0  # filas que la eliminación no toca
+            M[row + 1:, col + 1:] -= np.outer(factors, M[row, col + 1:])
+            block = M[row + 1:, col + 1:]
+            block[np.abs(block) <= tol] = 0.0
+            M[row + 1:, col] = factors  # multiplicadores de L
+            pivots.append((row, col))
+            row += 1
+
+        M.flags.writeable = False  # compartida entre peticiones: solo lectura
+        self.shape = (m, n)
+        self.lu = M
+        self.perm = perm
+        self.pivots = pivots
+        self.sign = sign
+
+    @property
+    def nbytes(self) -> int:
+        return self.lu.nbytes + self.perm.nbytes
+
+    def rank(self) -> int:
+        return len(self.pivots)
+
+    def is_invertible(self) -> bool:
+        m, n = self.shape
+        return m == n and self.rank() == n
+
+    def upper(self) -> np.ndarray:
+        """U (forma escalonada) sin los multiplicadores de L."""
+        U = np.zeros(self.shape)
+        for r, (_, c) in enumerate(self.pivots):
+            U[r, c:] = self.lu[r, c:]
+        return U
+
+    def det(self) -> float:
+        m, n = self.shape
+        if m != n:
+            raise ValueError("Determinante sólo definido para matrices cuadradas.")
+        if self.rank() < n:
+            return 0.0
+        with np.errstate(over="ignore"):  # igual que el producto en Python: ±inf si desborda
+            return float(self.sign * np.prod(np.diag(self.lu)))
+
+    def forward(self, B: np.ndarray) -> np.ndarray:
+        """L⁻¹·P·B: las columnas de B eliminadas como en la eliminación hacia adelante."""
+        C = np.array(B, dtype=np.float64)[self.perm]
+        for r, (_, c) in enumerate(self.pivots):
+            factors = self.lu[r + 1:, c]
+            C[r + 1:] -= np.outer(factors, C[r]) if C.ndim == 2 else factors * C[r]
+            block = C[r + 1:]
+            block[np.abs(block) <= TOL] = 0.0
+        return C
+
+    def solve(self, B: np.ndarray) -> np.ndarray:
+        """Resuelve A·X = B (vector o matriz de columnas); requiere A cuadrada invertible."""
+        if not self.is_invertible():
+            raise ValueError("La matriz es singular: no se puede resolver con LU.")
+        X = self.forward(B)
+        n = self.shape[0]
+        for r in range(n - 1, -1, -1):
+            X[r] -= self.lu[r, r + 1:] @ X[r + 1:]
+            X[r] /= self.lu[r, r]
+        return X
+
+    def inverse(self) -> np.ndarray:
+        return self.solve(np.eye(self.shape[0]))
+
+
+class LUCache:
+    """
+    Caché LRU acotada en memoria: si agregar una factorización supera `max_bytes`
+    se descartan primero las menos usadas. Segura entre hilos.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Any, LUFactorization]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, A: Matrix) -> LUFactorization:
+        M = np.array(A, dtype=np.float64)
+        key = fingerprint(M)
+        with self._lock:
+            lu = self._entries.get(key)
+            if lu is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return lu
+            self.misses += 1
+
+        # Se factoriza fuera del candado; si dos peticiones coinciden, gana la primera
+        lu = LUFactorization(M)
+        with self._lock:
+            if key not in self._entries and lu.nbytes <= self.max_bytes:
+                self._entries[key] = lu
+                self._bytes += lu.nbytes
+                while self._bytes > self.max_bytes:
+                    _, old = self._entries.popitem(last=False)
+                    self._bytes -= old.nbytes
+                    self.evictions += 1
+        return lu
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_cache: Optional[LUCache] = None
+_cache_lock = threading.Lock()
+
+
+def lu_cache() -> LUCache:
+    """Caché del proceso; el límite se lee de settings.ALGEBRA_LU_CACHE_MAX_BYTES."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                max_bytes = getattr(settings, "ALGEBRA_LU_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES) \
+                    if settings.configured else DEFAULT_MAX_BYTES
+                _cache = LUCache(int(max_bytes))
+    return _cache
+
+
+def get_lu(A: Matrix) -> LUFactorization:
+    return lu_cache().get(A)
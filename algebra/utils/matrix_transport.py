@@ -0,0 +1,88 @@
+from __future__ import annotations
+import base64
+import binascii
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from .algebraic_support import Matrix
+
+# -------------------------------
+# Matrices empaquetadas: {"shape": [m, n], "dtype": "<f8", "data": ...}
+# data = bytes float64 little-endian en orden por filas; en JSON van en base64,
+# en MessagePack como bytes crudos.
+# -------------------------------
+
+PACKED_DTYPE = "<f8"
+MATRIX_ENCODINGS = ("lists", "base64")  # options.matrix_encoding en JSON
+
+_DTYPE = np.dtype(PACKED_DTYPE)
+
+
+def is_packed(value: Any) -> bool:
+    return isinstance(value, dict) and "shape" in value and "data" in value
+
+
+def unpack_matrix(spec: Dict[str, Any]) -> np.ndarray:
+    """
+    Matriz empaquetada → ndarray m×n de solo lectura sobre los mismos bytes
+    (numpy.frombuffer: sin copiar los datos ni validar celda a celda).
+    """
+    dtype = spec.get("dtype", PACKED_DTYPE)
+    if dtype != PACKED_DTYPE:
+        raise ValueError(f"Solo se admite dtype '{PACKED_DTYPE}' (float64 little-endian), no '{dtype}'.")
+    shape = spec.get("shape")
+    if (not isinstance(shape, (list, tuple)) or len(shape) != 2
+            or not all(isinstance(d, int) and not isinstance(d, bool) and d >= 1 for d in shape)):
+        raise ValueError("'shape' debe ser [filas, columnas] con enteros positivos.")
+    data = spec["data"]
+    if isinstance(data, str):
+        try:
+            data = base64.b64decode(data, validate=True)
+        except binascii.Error:
+            raise ValueError("'data' no es base64 válido.")
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise ValueError("'data' debe ser base64 (JSON) o bytes (MessagePack).")
+    m, n = shape
+    if len(data) != m * n * _DTYPE.itemsize:
+        raise ValueError(f"'data' tiene {len(data)} bytes; una matriz {m}x{n} float64 ocupa {m * n * _DTYPE.itemsize}.")
+    M = np.frombuffer(data, dtype=_DTYPE).reshape(m, n)
+    if not np.isfinite(M).all():
+        raise ValueError("Los valores de la matriz deben ser finitos.")
+    return M
+
+
+def pack_matrix(M: Union[Matrix, np.ndarray], binary: bool = False) -> Dict[str, Any]:
+    """Inversa de unpack_matrix: bytes crudos si `binary` (MessagePack), base64 si no (JSON)."""
+    a = np.ascontiguousarray(M, dtype=_DTYPE)
+    raw = a.tobytes()
+    return {
+        "shape": list(a.shape),
+        "dtype": PACKED_DTYPE,
+        "data": raw if binary else base64.b64encode(raw).decode("ascii"),
+    }
+
+
+def matrix_encoding(opt: Optional[Dict[str, Any]]) -> str:
+    encoding = (opt or {}).get("matrix_encoding", "lists")
+    if encoding not in MATRIX_ENCODINGS:
+        raise ValueError(f"Codificación de matrices desconocida: {encoding}")
+    return encoding
+
+
+def pack_response(resp: Dict[str, Any], binary: bool = False) -> Dict[str, Any]:
+    """
+    Empaqueta en sitio las matrices densas de una respuesta de matrix_ops_api:
+    input.A, input.B, input.matrices y result.matrix ("matrix_pretty" queda igual).
+    """
+    inp = resp.get("input", {})
+    for key in ("A", "B"):
+        if inp.get(key) is not None:
+            inp[key] = pack_matrix(inp[key], binary)
+    if inp.get("matrices") is not None:
+        inp["matrices"] = [pack_matrix(M, binary) for M in inp["matrices"]]
+    result = resp.get("result", {})
+    if result.get("matrix") is not None:
+        result["matrix"] = pack_matrix(result["matrix"], binary)
+    return resp
+
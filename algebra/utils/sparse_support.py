@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .algebraic_support import TOL
+
+# -------------------------------
+# Matrices dispersas: cada fila es un dict {col: valor} con solo los no nulos
+# -------------------------------
+
+SparseRow = Dict[int, float]
+SparseMatrix = List[SparseRow]
+
+SPARSE_FORMATS = ("coo", "csr")
+
+
+def _triplets(spec: Dict[str, Any], m: int) -> Iterator[Tuple[int, int, float]]:
+    fmt = spec.get("format", "coo")
+    data = spec.get("data") or []
+    if fmt == "coo":
+        row, col = spec.get("row") or [], spec.get("col") or []
+        if not (len(row) == len(col) == len(data)):
+            raise ValueError("En formato COO, 'row', 'col' y 'data' deben tener la misma longitud.")
+        return zip(row, col, data)
+    if fmt == "csr":
+        indptr, indices = spec.get("indptr") or [], spec.get("indices") or []
+        if len(indptr) != m + 1 or len(indices) != len(data):
+            raise ValueError("En formato CSR, 'indptr' debe tener m+1 entradas e 'indices' la longitud de 'data'.")
+        if indptr[0] != 0 or indptr[-1] != len(data) or any(a > b for a, b in zip(indptr, indptr[1:])):
+            raise ValueError("'indptr' debe ser no decreciente, empezar en 0 y terminar en len(data).")
+        return ((i, indices[k], data[k]) for i in range(m) for k in range(indptr[i], indptr[i + 1]))
+    raise ValueError(f"Formato disperso desconocido: {fmt}")
+
+
+def sparse_from_spec(spec: Dict[str, Any], tol: float = TOL) -> Tuple[SparseMatrix, Tuple[int, int]]:
+    """
+    Convierte {"format": "coo"|"csr", "shape": [m, n], ...} a filas dispersas.
+    Las entradas repetidas se suman (convención COO) y los valores |x| <= tol se descartan.
+    """
+    m, n = spec["shape"]
+    rows: SparseMatrix = [{} for _ in range(m)]
+    for i, j, v in _triplets(spec, m):
+        if not (0 <= i < m and 0 <= j < n):
+            raise ValueError(f"Índice fuera de rango: ({i}, {j}) en una matriz {m}x{n}.")
+        s = rows[i].get(j, 0.0) + float(v)
+        if abs(s) <= tol:
+            rows[i].pop(j, None)
+        else:
+            rows[i][j] = s
+    return rows, (m, n)
+
+
+def sparse_to_coo(rows: SparseMatrix, shape: Tuple[int, int],
+                  fmt: Optional[Callable[[float], Any]] = None) -> Dict[str, Any]:
+    """Filas dispersas → {"format": "coo", "shape", "row", "col", "data"} ordenado por fila y columna."""
+    out_r: List[int] = []
+    out_c: List[int] = []
+    out_v: List[Any] = []
+    for i, row in enumerate(rows):
+        for j in sorted(row):
+            out_r.append(i)
+            out_c.append(j)
+            out_v.append(fmt(row[j]) if fmt else float(row[j]))
+    return {"format": "coo", "shape": list(shape), "row": out_r, "col": out_c, "data": out_v}
+
+
+def nnz(rows: SparseMatrix) -> int:
+    return sum(len(row) for row in rows)
@@ -1,5 +1,7 @@
 import logging
+from itertools import chain
 from rest_framework.views import APIView
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import render
@@ -21,11 +23,13 @@ from .serializers import (
     IntegralSerializer,
     DerivativeSerializer,
 )
-from .serializers import MatrixDeterminantSerializer
+from .serializers import MatrixDeterminantSerializer, MatrixDeterminantBatchSerializer, MatrixCramerSerializer
+from .renderers import StreamingRenderer, NDJSONRenderer, EventStreamRenderer, BINARY_RENDERERS, BINARY_PARSERS
 
 # REDUCE API
-from .algorithms.reduce.gauss_jordan import gauss_jordan_api
-from .algorithms.reduce.gauss import gauss_api
+from .algorithms.reduce.gauss_jordan import gauss_jordan_api, gauss_jordan_stream
+from .algorithms.reduce.gauss import gauss_api, gauss_stream
+from .algorithms.reduce.sparse import sparse_reduce_api, sparse_reduce_stream
 
 # VECOTR API
 from .algorithms.vectors.vectors_comb_api import linear_combination_api
@@ -33,7 +37,10 @@ from .algorithms.vectors.vectors_operations_api import vector_ops_api
 
 # MATRIX API
 from .algorithms.matrix.matrix_api import matrix_ops_api
-from .algorithms.matrix.determinants.determinant_api import determinant_api
+from .algorithms.matrix.sparse_operations import sparse_ops_api
+from .algorithms.matrix.determinants.determinant_api import determinant_api, determinant_batch_api, cramer_api
+from .utils.lu_cache import lu_cache
+from .utils.matrix_transport import matrix_encoding, pack_response
 
 # ERROR API
 from .algorithms.numericMethods.errorMethods.error_accumulation import accumulate_error_iterations
@@ -56,6 +63,9 @@ logger = logging.getLogger("algebra")
 
 
 class MatrixReduceView(APIView):
+    # Accept: application/x-ndjson | text/event-stream → pasos en streaming (ver renderers.py)
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer, EventStreamRenderer]
+
     def post(self, request):
         s = MatrixReduceSerializer(data=request.data)
         if not s.is_valid():
@@ -64,7 +74,7 @@ class MatrixReduceView(APIView):
 
         # Normalizar matriz aumentada
         Ab = payload.get("Ab")
-        if Ab is None:
+        if Ab is None and payload.get("B") is None and payload.get("A_sparse") is None:
             A, b = payload["A"], payload["b"]
             Ab = [row + [b[i]] for i, row in enumerate(A)]
 
@@ -72,13 +82,36 @@ class MatrixReduceView(APIView):
         options = payload.get("options", {})
 
         # Llamar a la logica de Gauss y Gauss-Jordan
-        if method == "gauss":
-            result = gauss_api(A=payload.get("A"), b=payload.get("b"), Ab=payload.get("Ab"), options=options)
-            return Response(result, status=status.HTTP_200_OK)
-
-        if method == "gauss-jordan":
-            result = gauss_jordan_api(A=payload.get("A"), b=payload.get("b"), Ab=payload.get("Ab"), options=options)
-            return Response(result, status=status.HTTP_200_OK)
+        try:
+            if payload.get("A_sparse") is not None:
+                # Entrada COO/CSR: eliminación dispersa (ver algorithms/reduce/sparse.py)
+                if isinstance(request.accepted_renderer, StreamingRenderer):
+                    events = sparse_reduce_stream(A_sparse=payload["A_sparse"], b=payload["b"], method=method,
+                                                  options=options)
+                    first = next(events)
+                    return request.accepted_renderer.streaming_response(chain([first], events), "MATRIX_REDUCE_ERROR")
+                result = sparse_reduce_api(A_sparse=payload["A_sparse"], b=payload["b"], method=method, options=options)
+                return Response(result, status=status.HTTP_200_OK)
+
+            if isinstance(request.accepted_renderer, StreamingRenderer):
+                stream_fn = gauss_stream if method == "gauss" else gauss_jordan_stream
+                events = stream_fn(A=payload.get("A"), b=payload.get("b"), Ab=payload.get("Ab"), B=payload.get("B"),
+                                   options=options)
+                # El primer evento valida la entrada: los errores aún pueden responder 400
+                first = next(events)
+                return request.accepted_renderer.streaming_response(chain([first], events), "MATRIX_REDUCE_ERROR")
+
+            if method == "gauss":
+                result = gauss_api(A=payload.get("A"), b=payload.get("b"), Ab=payload.get("Ab"), B=payload.get("B"),
+                                   options=options)
+                return Response(result, status=status.HTTP_200_OK)
+
+            if method == "gauss-jordan":
+                result = gauss_jordan_api(A=payload.get("A"), b=payload.get("b"), Ab=payload.get("Ab"), B=payload.get("B"),
+                                          options=options)
+                return Response(result, status=status.HTTP_200_OK)
+        except ValueError as e:
+            return Response({"error": {"code": "MATRIX_REDUCE_ERROR", "message": str(e)}}, status=status.HTTP_400_BAD_REQUEST)
     
 class VectorCombinationView(APIView):
     def post(self, request):
@@ -115,23 +148,45 @@ class VectorOperateView(APIView):
 
 
 class MatrixOperateView(APIView):
+    # Content-Type / Accept: application/msgpack → matrices empaquetadas como bytes (ver utils/matrix_transport.py)
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, *BINARY_RENDERERS]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, *BINARY_PARSERS]
+
     def post(self, request):
         s = MatrixOperateSerializer(data=request.data)
         if not s.is_valid():
             return Response({"error": {"code": "VALIDATION_ERROR", "message": str(s.errors)}}, status=status.HTTP_400_BAD_REQUEST)
         payload = s.validated_data
         try:
+            if payload.get("A_sparse") is not None:
+                result = sparse_ops_api(
+                    operation=payload["operation"],
+                    A_sparse=payload["A_sparse"],
+                    B_sparse=payload.get("B_sparse"),
+                    scalar=payload.get("scalar"),
+                    options=payload.get("options"),
+                )
+                if result.get('error'):
+                    return Response(result, status=status.HTTP_400_BAD_REQUEST)
+                return Response(result, status=status.HTTP_200_OK)
+            # Respuesta empaquetada: con Accept: application/msgpack o options.matrix_encoding = "base64"
+            binary = request.accepted_renderer.format == "msgpack"
+            packed = binary or matrix_encoding(payload.get("options")) == "base64"
             result = matrix_ops_api(
                 operation=payload["operation"],
                 A=payload.get("A"),
                 B=payload.get("B"),
                 matrices=payload.get("matrices"),
                 scalar=payload.get("scalar"),
+                exponent=payload.get("exponent"),
+                coefficients=payload.get("coefficients"),
                 options=payload.get("options"),
             )
             # If wrapper returned an error dict, forward as 400
             if isinstance(result, dict) and result.get('error'):
                 return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            if packed:
+                pack_response(result, binary)
             return Response(result, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"error": {"code": "MATRIX_OP_ERROR", "message": str(e)}}, status=status.HTTP_400_BAD_REQUEST)
@@ -152,6 +207,38 @@ class MatrixDeterminantView(APIView):
             return Response({"error": {"code": "DETERMINANT_ERROR", "message": str(e)}}, status=status.HTTP_400_BAD_REQUEST)
         
 
+class MatrixDeterminantBatchView(APIView):
+    def post(self, request):
+        s = MatrixDeterminantBatchSerializer(data=request.data)
+        if not s.is_valid():
+            return Response({"error": {"code": "VALIDATION_ERROR", "message": str(s.errors)}}, status=status.HTTP_400_BAD_REQUEST)
+        payload = s.validated_data
+        try:
+            res = determinant_batch_api(matrices=payload["matrices"], method=payload.get("method"), options=payload.get("options"))
+            return Response(res, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": {"code": "DETERMINANT_ERROR", "message": str(e)}}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class MatrixCramerView(APIView):
+    def post(self, request):
+        s = MatrixCramerSerializer(data=request.data)
+        if not s.is_valid():
+            return Response({"error": {"code": "VALIDATION_ERROR", "message": str(s.errors)}}, status=status.HTTP_400_BAD_REQUEST)
+        payload = s.validated_data
+        try:
+            res = cramer_api(A=payload["A"], b=payload["b"], options=payload.get("options"))
+            return Response(res, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": {"code": "CRAMER_ERROR", "message": str(e)}}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class LUCacheStatsView(APIView):
+    def get(self, request):
+        # Aciertos / fallos / desalojos y memoria usada por la caché LU de este proceso
+        return Response(lu_cache().stats(), status=status.HTTP_200_OK)
+
+
 ## VISTAS DE MÉTODOS NUMÉRICOS ##
 
 class ErrorAccumulationView(APIView):
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+from django.core.exceptions import ImproperlyConfigured
 from django.core.management.utils import get_random_secret_key
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -141,16 +142,30 @@ MEDIA_ROOT = BASE_DIR / "media"
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # --- Django REST Framework ---
+# JSON de la API: "fast" = orjson (algebra/renderers.py, si está instalado) | "stock" = json de DRF
+ALGEBRA_JSON_BACKEND = os.environ.get("ALGEBRA_JSON_BACKEND", "fast")
+_JSON_BACKENDS = {
+    "fast": ("algebra.renderers.FastJSONRenderer", "algebra.renderers.FastJSONParser"),
+    "stock": ("rest_framework.renderers.JSONRenderer", "rest_framework.parsers.JSONParser"),
+}
+if ALGEBRA_JSON_BACKEND not in _JSON_BACKENDS:
+    raise ImproperlyConfigured(
+        f"ALGEBRA_JSON_BACKEND debe ser {' o '.join(map(repr, _JSON_BACKENDS))}, no {ALGEBRA_JSON_BACKEND!r}.")
+_JSON_CLASSES = _JSON_BACKENDS[ALGEBRA_JSON_BACKEND]
+
 REST_FRAMEWORK = {
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.NamespaceVersioning",
-    "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
-    ],
-    "DEFAULT_PARSER_CLASSES": ["rest_framework.parsers.JSONParser"],
+    # La API navegable (HTML) solo en desarrollo
+    "DEFAULT_RENDERER_CLASSES": [_JSON_CLASSES[0]] + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+    "DEFAULT_PARSER_CLASSES": [_JSON_CLASSES[1]],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",  # <---
 }
 
+# --- Caché de factorizaciones LU (algebra/utils/lu_cache.py), límite en bytes por proceso ---
+ALGEBRA_LU_CACHE_MAX_BYTES = int(os.environ.get("ALGEBRA_LU_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+# --- Determinantes: por encima de este n, method="cofactors" se calcula por LU ---
+ALGEBRA_COFACTOR_MAX_N = int(os.environ.get("ALGEBRA_COFACTOR_MAX_N", 16))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Calculadora Álgebra API",
     "DESCRIPTION": "Endpoints para reducciones de matrices y operaciones vectoriales.",